@@ -7,10 +7,12 @@ from groq import Groq
 from dotenv import load_dotenv
 
 # Import your existing handlers
-from Backend.general_q import general
-from Backend.realtime_q import *
+from Backend.general_q import general, general_stream, warm_connection
+from Backend.realtime_q import get_realtime_data
 from Backend.systemq import handle_system_query
 from Backend.memory import memory
+from Backend import templates
+from Backend.skills import registry as skills
 
 # ────────────────────────────────────────────────
 #  Config & Setup
@@ -29,6 +31,9 @@ logger.setLevel(logging.INFO)
 
 MODEL = "llama-3.3-70b-versatile"   # same as in general_q.py
 
+# Said when a turn produced no text at all (Groq error, empty completion)
+NO_ANSWER = "I'm afraid I don't have an answer for that right now, Sir."
+
 # ────────────────────────────────────────────────
 #  Classification Prompt (strict JSON output)
 # ────────────────────────────────────────────────
@@ -121,14 +126,54 @@ def classify_with_groq(query: str) -> Optional[Dict]:
 #  Public brain entry point (what main.py calls)
 # ────────────────────────────────────────────────
 
-def brainQ(user_input: str) -> str:
+def warm_llm():
+    """Pre-open both Groq connections (classifier + answers) ahead of a likely LLM turn."""
+    warm_connection()
+    warm_connection(client)
+
+
+def brainQ_stream(user_input: str, prefetched: Optional[Dict] = None):
+    """
+    Generator form of brainQ(): yields the answer in pieces.
+    LLM answers are yielded token by token as Groq streams them; system and
+    template answers are yielded whole. If nothing but whitespace came out,
+    yields NO_ANSWER, so the voice loop never goes silent.
+    prefetched: realtime data (and its rendered answer) already fetched
+    speculatively for this exact query — see Backend/speculation.py.
+    """
+    pieces = _answer_pieces(user_input, prefetched)
+    answered = False
+    try:
+        for piece in pieces:
+            answered = answered or bool(piece.strip())
+            yield piece
+    finally:
+        pieces.close()   # barge-in closes us mid-answer: stop the LLM stream too
+    if not answered:
+        yield NO_ANSWER
+
+
+def _answer_pieces(user_input: str, prefetched: Optional[Dict]):
     if not user_input or not user_input.strip():
-        return "Sorry Sir, I didn't catch that. Could you repeat?"
+        yield "Sorry Sir, I didn't catch that. Could you repeat?"
+        return
 
     # Step 1: Try to get realtime data first (fast path)
-    realtime_result = get_realtime_data(user_input)   # ← use the new function name
+    if prefetched and prefetched.get("realtime"):
+        realtime_result = prefetched["realtime"]
+    else:
+        realtime_result = get_realtime_data(user_input)   # ← use the new function name
 
     if realtime_result:
+        # Explicit time/date/weather questions → local Rex template, no LLM
+        answer = templates.answer(user_input, realtime_result)
+        if answer:
+            # the speculated (pre-synthesized) phrasing, if any; gated on the final text above
+            answer = (prefetched or {}).get("answer") or answer
+            print(f"Rex: {answer}")
+            yield answer
+            return
+
         # We have fresh data → pass it to general LLM for personality
         data_str = realtime_result.get("display_str") or str(realtime_result.get("key_data", ""))
         enhanced_query = (
@@ -136,8 +181,8 @@ def brainQ(user_input: str) -> str:
             f"Use this exact realtime information — do NOT invent or change any numbers:\n"
             f"{data_str}"
         )
-        answer = general(enhanced_query, extra_context=data_str)
-        return answer
+        yield from general_stream(enhanced_query, extra_context=data_str)
+        return
 
     # Step 2: Check for system commands (fast, no LLM needed)
     # Prefer classifier for system detection so we can get a normalized English command
@@ -149,20 +194,21 @@ def brainQ(user_input: str) -> str:
         answer = handle_system_query(normalized_cmd)
         if answer and "not recognized" not in answer.lower():
             memory.add_exchange(user_input, answer)
-            return answer
+            yield answer
+            return
 
     # Fallback keyword heuristic if classifier failed or wasn't sure
-    query_lower = user_input.lower()
-    if any(kw in query_lower for kw in [
-        'open', 'close', 'play', 'launch', 'run', 'volume', 'shutdown', 'restart',
-        'file', 'folder', 'delete', 'window', 'minimize', 'maximize', 'settings'
-    ]):
+    # (the system skills' trigger words, see Backend/skills.py)
+    if skills.match(user_input, "system"):
         answer = handle_system_query(user_input)
         if answer and "not recognized" not in answer.lower():
             memory.add_exchange(user_input, answer)
-            return answer
+            yield answer
+            return
 
     # Step 3: Everything else → normal general LLM
-    answer = general(user_input)
-    print(realtime_result)
-    return answer or "I'm afraid I don't have an answer for that right now, Sir."
+    yield from general_stream(user_input)
+
+
+def brainQ(user_input: str, prefetched: Optional[Dict] = None) -> str:
+    return "".join(brainQ_stream(user_input, prefetched)).strip()
@@ -1,6 +1,7 @@
 # Backend/general_q.py
 import os
 import sys
+import time
 from groq import Groq
 from dotenv import load_dotenv
 
@@ -43,13 +44,14 @@ Example responses:
 - General   → "Certainly, Sir. Though I must say that's a rather bold question."
 """
 
-def general(user_query: str, extra_context: str = "") -> str:
+def general_stream(user_query: str, extra_context: str = ""):
     """
-    Main general answer generator.
+    Generator version of general(): yields text deltas as Groq streams them
+    so speech can start after the first sentence.
     - Uses shared memory
     - Can receive injected realtime facts via extra_context
     - Streams output to console (for debugging)
-    - Saves to memory automatically
+    - Saves to memory once the stream ends (or is closed early)
     """
     messages = memory.get_context()
 
@@ -62,6 +64,7 @@ def general(user_query: str, extra_context: str = "") -> str:
 
     messages.append({"role": "user", "content": user_query.strip()})
 
+    response_text = ""
     try:
         stream = client.chat.completions.create(
             model=MODEL,
@@ -73,7 +76,6 @@ def general(user_query: str, extra_context: str = "") -> str:
             stop=None
         )
 
-        response_text = ""
         print("Rex: ", end="", flush=True)
 
         for chunk in stream:
@@ -81,18 +83,45 @@ def general(user_query: str, extra_context: str = "") -> str:
                 delta = chunk.choices[0].delta.content
                 response_text += delta
                 print(delta, end="", flush=True)
+                yield delta
 
         print()  # final newline
 
-        clean_answer = response_text.strip()
+    except Exception as e:
+        print(f"\n[General LLM error]: {e}", file=sys.stderr)
+        if not response_text.strip():
+            fallback = "Apologies, Sir. A momentary lapse in the matrix. Could you repeat that?"
+            response_text = fallback
+            yield fallback
 
+    finally:
         # Save the full exchange to shared memory
-        memory.add_exchange(user_query, clean_answer)
+        memory.add_exchange(user_query, response_text.strip())
 
-        return clean_answer
 
+_last_warm = {}
+
+
+def warm_connection(groq_client=None, max_age: float = 60.0):
+    """
+    Open (or refresh) the HTTPS connection of a Groq client (default: the
+    one used for answers) so the next completion skips DNS + TLS setup.
+    Cheap no-op if done within max_age seconds.
+    """
+    groq_client = groq_client or client
+    now = time.monotonic()
+    if now - _last_warm.get(id(groq_client), -max_age) < max_age:
+        return
+    _last_warm[id(groq_client)] = now
+    try:
+        groq_client.models.list()
     except Exception as e:
-        print(f"\n[General LLM error]: {e}", file=sys.stderr)
-        fallback = "Apologies, Sir. A momentary lapse in the matrix. Could you repeat that?"
-        memory.add_exchange(user_query, fallback)
-        return fallback
\ No newline at end of file
+        print(f"[General LLM warm-up failed]: {e}", file=sys.stderr)
+
+
+def general(user_query: str, extra_context: str = "") -> str:
+    """
+    Main general answer generator.
+    Collects general_stream() into one string (same memory behaviour).
+    """
+    return "".join(general_stream(user_query, extra_context)).strip()
@@ -1,6 +1,7 @@
 # Backend/memory.py
 import json
 import os
+import threading
 from typing import List, Dict
 from datetime import datetime
 
@@ -10,8 +11,16 @@ Address the user as Sir. Keep answers concise unless more detail is requested.""
 
 class ConversationMemory:
     def __init__(self):
+        # Read from disk on first use (or by the startup warm-up), not at import
         self.history: List[Dict[str, str]] = []
-        self._load()
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def load(self):
+        with self._lock:
+            if not self._loaded:
+                self._load()
+                self._loaded = True
 
     def _load(self):
         if os.path.exists(HISTORY_FILE):
@@ -40,6 +49,7 @@ class ConversationMemory:
             print(f"Warning: Could not save history → {e}")
 
     def add_exchange(self, user_text: str, assistant_text: str):
+        self.load()
         self.history.append({"role": "user", "content": user_text.strip()})
         if assistant_text and assistant_text.strip():
             self.history.append({"role": "assistant", "content": assistant_text.strip()})
@@ -48,10 +58,13 @@ class ConversationMemory:
         self.save()
 
     def get_context(self) -> List[Dict[str, str]]:
+        self.load()
         return self.history.copy()
 
     def clear(self):
-        self.history = [{"role": "system", "content": SYSTEM_PROMPT}]
+        with self._lock:
+            self._loaded = True
+            self.history = [{"role": "system", "content": SYSTEM_PROMPT}]
         self.save()
 
 
@@ -1,125 +1,180 @@
 # Backend/realtime_q.py
 import datetime
-import requests
-import yfinance as yf
-from newsapi import NewsApiClient
 from dotenv import load_dotenv
 import os
 
+from Backend.skills import registry
+
+# requests / yfinance / newsapi are imported by the handler that needs them,
+# on first use (see Backend/skills.py)
+
 load_dotenv('api.env')
 NEWS_API_KEY = os.getenv('NEWS_API_KEY')
 
-def get_realtime_data(query: str) -> dict | None:
+def _weather_location(query_lower: str) -> str:
+    location = "Indore"  # default
+    if 'in' in query_lower:
+        parts = query_lower.split('in')
+        if len(parts) > 1:
+            location = parts[1].strip().title()
+    return location
+
+
+def _stock_symbol(query_lower: str) -> str:
+    # Simple mapping for common Tata companies
+    company_map = {
+        'tata': 'TATAMOTORS.NS',      # Tata Motors
+        'tcs': 'TCS.NS',              # Tata Consultancy
+        'tatamotors': 'TATAMOTORS.NS',
+        'tataconsultancy': 'TCS.NS',
+        'reliance': 'RELIANCE.NS'
+    }
+
+    symbol = "RELIANCE.NS"  # fallback
+    words = query_lower.split()
+    for word in words:
+        if word in company_map:
+            symbol = company_map[word]
+            break
+        # Fallback: take uppercase word as ticker
+        if word.isupper() and 3 <= len(word) <= 8:
+            symbol = word.upper() + ".NS"
+            break
+    return symbol
+
+
+# ── Keys: which lookup a query means, no network ──────────────
+
+def time_key(query_lower: str) -> tuple:
+    return ("time",)
+
+
+def date_key(query_lower: str) -> tuple:
+    return ("date", 'tomorrow' in query_lower)
+
+
+def weather_key(query_lower: str) -> tuple:
+    return ("weather", _weather_location(query_lower))
+
+
+def stock_key(query_lower: str) -> tuple:
+    return ("stock", _stock_symbol(query_lower))
+
+
+def news_key(query_lower: str) -> tuple:
+    return ("news",)
+
+
+def realtime_key(query: str) -> tuple | None:
+    """
+    Which realtime lookup get_realtime_data() would do for this query, as a
+    hashable key — same keyword rules, no network. Used to decide whether a
+    result fetched for a partial transcript is valid for the final one.
+    """
     query_lower = query.lower().strip()
-    result = {"category": None, "key_data": None, "display_str": None}
-
-    # ── Time / Date ───────────────────────────────────────────────
-    if any(w in query_lower for w in ['time', 'clock', 'hour', 'now']):
-        now = datetime.datetime.now()
-        result.update({
-            "category": "time",
-            "key_data": now.strftime('%I:%M %p'),
-            "display_str": f"Current time: {now.strftime('%I:%M %p')}"
-        })
-        return result
-
-    if any(w in query_lower for w in ['date', 'today', 'day', 'tomorrow']):
-        if 'tomorrow' in query_lower:
-            tomorrow = datetime.date.today() + datetime.timedelta(days=1)
-            disp = tomorrow.strftime('%A, %B %d, %Y')
-            result.update({
-                "category": "date",
-                "key_data": disp,
-                "display_str": f"Tomorrow is {disp}"
-            })
-        else:
-            today = datetime.date.today()
-            disp = today.strftime('%A, %B %d, %Y')
-            result.update({
-                "category": "date",
-                "key_data": disp,
-                "display_str": f"Today is {disp}"
-            })
-        return result
-
-    # ── Weather (current + forecast tomorrow) ──────────────────────
-    if any(w in query_lower for w in ['weather', 'temperature', 'forecast', 'climate']):
-        location = "Indore"  # default
-        if 'in' in query_lower:
-            parts = query_lower.split('in')
-            if len(parts) > 1:
-                location = parts[1].strip().title()
-
-        forecast_day = "today" if 'today' in query_lower or 'current' in query_lower else "tomorrow" if 'tomorrow' in query_lower else "today"
+    for skill in registry.match(query_lower, "realtime"):
+        return registry.key(skill, query_lower)
+    return None
 
+
+def get_realtime_data(query: str) -> dict | None:
+    query_lower = query.lower().strip()
+    # Skills come back in priority order; a failed fetch falls through to the next one
+    for skill in registry.match(query_lower, "realtime"):
         try:
-            # wttr.in format=3 is current; use %l for location + %c %t for condition/temp
-            url = f'https://wttr.in/{location}?format="%l:+%c+%t"'
-            resp = requests.get(url, timeout=6)
-            if resp.status_code == 200:
-                data = resp.text.strip().strip('"')
-                result.update({
-                    "category": "weather",
-                    "key_data": data,
-                    "display_str": f"{forecast_day.capitalize()} weather in {location}: {data}"
-                })
-                return result
-        except Exception as e:
-            print(f"Weather fetch failed: {e}")
-
-    # ── Stock — better company name parsing ────────────────────────
-    if any(w in query_lower for w in ['stock', 'price', 'share', 'nse', 'bse']):
-        # Simple mapping for common Tata companies
-        company_map = {
-            'tata': 'TATAMOTORS.NS',      # Tata Motors
-            'tcs': 'TCS.NS',              # Tata Consultancy
-            'tatamotors': 'TATAMOTORS.NS',
-            'tataconsultancy': 'TCS.NS',
-            'reliance': 'RELIANCE.NS'
+            result = registry.call(skill, query_lower)
+        except ImportError as e:
+            print(f"[SKILLS] {skill.name} unavailable: {e}", flush=True)
+            continue
+        if result:
+            return result
+    return None
+
+
+# ── Time / Date ───────────────────────────────────────────────
+
+def time_data(query_lower: str) -> dict:
+    now = datetime.datetime.now()
+    return {
+        "category": "time",
+        "key_data": now.strftime('%I:%M %p'),
+        "display_str": f"Current time: {now.strftime('%I:%M %p')}"
+    }
+
+
+def date_data(query_lower: str) -> dict:
+    if 'tomorrow' in query_lower:
+        tomorrow = datetime.date.today() + datetime.timedelta(days=1)
+        disp = tomorrow.strftime('%A, %B %d, %Y')
+        return {"category": "date", "key_data": disp, "display_str": f"Tomorrow is {disp}"}
+    today = datetime.date.today()
+    disp = today.strftime('%A, %B %d, %Y')
+    return {"category": "date", "key_data": disp, "display_str": f"Today is {disp}"}
+
+
+# ── Weather (current + forecast tomorrow) ──────────────────────
+
+def weather_data(query_lower: str) -> dict | None:
+    import requests
+
+    location = _weather_location(query_lower)
+
+    forecast_day = "today" if 'today' in query_lower or 'current' in query_lower else "tomorrow" if 'tomorrow' in query_lower else "today"
+
+    try:
+        # wttr.in format=3 is current; use %l for location + %c %t for condition/temp
+        url = f'https://wttr.in/{location}?format="%l:+%c+%t"'
+        resp = requests.get(url, timeout=6)
+        if resp.status_code == 200:
+            data = resp.text.strip().strip('"')
+            return {
+                "category": "weather",
+                "key_data": data,
+                "display_str": f"{forecast_day.capitalize()} weather in {location}: {data}"
+            }
+    except Exception as e:
+        print(f"Weather fetch failed: {e}")
+    return None
+
+
+# ── Stock — better company name parsing ────────────────────────
+
+def stock_data(query_lower: str) -> dict | None:
+    symbol = _stock_symbol(query_lower)
+
+    try:
+        import yfinance as yf
+        ticker = yf.Ticker(symbol)
+        info = ticker.info
+        price = info.get('currentPrice') or info.get('regularMarketPrice', 'N/A')
+        company_name = info.get('shortName', symbol.replace('.NS', ''))
+        return {
+            "category": "stock",
+            "key_data": {"symbol": symbol, "price": price},
+            "display_str": f"Current price of {company_name} ({symbol}): ₹{price}"
         }
+    except Exception as e:
+        print(f"Stock fetch failed: {e}")
+    return None
 
-        symbol = "RELIANCE.NS"  # fallback
-        words = query_lower.split()
-        for word in words:
-            if word in company_map:
-                symbol = company_map[word]
-                break
-            # Fallback: take uppercase word as ticker
-            if word.isupper() and 3 <= len(word) <= 8:
-                symbol = word.upper() + ".NS"
-                break
 
-        try:
-            ticker = yf.Ticker(symbol)
-            info = ticker.info
-            price = info.get('currentPrice') or info.get('regularMarketPrice', 'N/A')
-            company_name = info.get('shortName', symbol.replace('.NS', ''))
-            result.update({
-                "category": "stock",
-                "key_data": {"symbol": symbol, "price": price},
-                "display_str": f"Current price of {company_name} ({symbol}): ₹{price}"
-            })
-            return result
-        except Exception as e:
-            print(f"Stock fetch failed: {e}")
+# ── News ───────────────────────────────────────────────────────
 
-    # ── News ───────────────────────────────────────────────────────
-    if any(w in query_lower for w in ['news', 'headline', 'latest', 'breaking', "today's news"]):
-        if not NEWS_API_KEY:
-            return None
-        try:
-            newsapi = NewsApiClient(api_key=NEWS_API_KEY)
-            headlines = newsapi.get_top_headlines(language='en', country='in', page_size=4)
-            articles = headlines.get('articles', [])
-            if articles:
-                top_news = [f"{a['title']} — {a['source']['name']}" for a in articles[:3]]
-                result.update({
-                    "category": "news",
-                    "key_data": top_news,
-                    "display_str": "Top headlines in India right now:\n" + "\n".join(top_news)
-                })
-                return result
-        except Exception as e:
-            print(f"News fetch failed: {e}")
-
-    return None
\ No newline at end of file
+def news_data(query_lower: str) -> dict | None:
+    if not NEWS_API_KEY:
+        return None
+    try:
+        from newsapi import NewsApiClient
+        newsapi = NewsApiClient(api_key=NEWS_API_KEY)
+        headlines = newsapi.get_top_headlines(language='en', country='in', page_size=4)
+        articles = headlines.get('articles', [])
+        if articles:
+            top_news = [f"{a['title']} — {a['source']['name']}" for a in articles[:3]]
+            return {
+                "category": "news",
+                "key_data": top_news,
+                "display_str": "Top headlines in India right now:\n" + "\n".join(top_news)
+            }
+    except Exception as e:
+        print(f"News fetch failed: {e}")
+    return None
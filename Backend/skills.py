@@ -0,0 +1,172 @@
+# Backend/skills.py
+"""
+Skill registry for the non-LLM handlers.
+
+Each skill declares the trigger words that route a query to it and the
+modules it needs; nothing is imported until a skill is first used, so a
+session that only ever asks for the time never loads yfinance/pandas, and
+one that never touches the volume never loads pycaw/comtypes. Triggers are
+indexed per kind with duplicates merged, so a query is checked once against
+each distinct trigger, and matches come back in priority order.
+"""
+
+import importlib
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class Skill:
+    name: str
+    kind: str                    # "realtime" | "system"
+    module: str                  # imported on first use
+    handler: str                 # function in `module`
+    triggers: Tuple[str, ...]    # substrings of the lower-cased query
+    deps: Tuple[str, ...] = ()   # heavy modules the handler needs (imported before the first call)
+    key: Optional[str] = None    # realtime: cheap function naming the lookup (no network)
+
+
+class SkillRegistry:
+    def __init__(self):
+        self._skills: List[Skill] = []
+        self._indexes: Dict[Optional[str], tuple] = {}
+        self._lock = threading.RLock()
+        self._functions: Dict[Tuple[str, str], Callable] = {}
+        self.load_times: Dict[str, float] = {}   # module -> seconds spent importing it
+
+    def register(self, skill: Skill):
+        with self._lock:
+            self._skills.append(skill)
+            self._indexes = {}
+
+    @property
+    def skills(self) -> List[Skill]:
+        return list(self._skills)
+
+    # ────────────────────────────────────────────────
+    #  Trigger index
+    # ────────────────────────────────────────────────
+
+    def _index(self, kind: Optional[str]) -> Tuple[Tuple[str, Tuple[Skill, ...]], ...]:
+        """(trigger, skills) pairs for one kind (None = all), built once per registration change."""
+        index = self._indexes.get(kind)
+        if index is None:
+            with self._lock:
+                by_trigger: Dict[str, List[Skill]] = {}
+                for skill in self._skills:
+                    if kind is None or skill.kind == kind:
+                        for trigger in skill.triggers:
+                            by_trigger.setdefault(trigger, []).append(skill)
+                index = tuple((t, tuple(skills)) for t, skills in by_trigger.items())
+                self._indexes[kind] = index
+        return index
+
+    def match(self, query: str, kind: Optional[str] = None) -> List[Skill]:
+        """Skills with a trigger in the query (substring, like the old keyword checks), in priority order."""
+        query = query.lower()
+        hits = set()
+        for trigger, skills in self._index(kind):
+            if trigger in query:
+                hits.update(skills)
+        if not hits:
+            return []
+        return [s for s in self._skills if s in hits]
+
+    # ────────────────────────────────────────────────
+    #  Lazy loading
+    # ────────────────────────────────────────────────
+
+    def import_module(self, name: str):
+        """importlib.import_module that records how long the first import took."""
+        with self._lock:
+            start = time.perf_counter()
+            module = importlib.import_module(name)
+            if name not in self.load_times:
+                self.load_times[name] = time.perf_counter() - start
+                if self.load_times[name] > 0.05:
+                    print(f"[SKILLS] Loaded {name} in {self.load_times[name] * 1000:.0f} ms", flush=True)
+            return module
+
+    def _function(self, module: str, name: str) -> Callable:
+        fn = self._functions.get((module, name))
+        if fn is None:
+            fn = getattr(self.import_module(module), name)
+            self._functions[(module, name)] = fn
+        return fn
+
+    def load(self, skill: Skill) -> Callable:
+        """Import the skill's dependencies and module; returns its handler."""
+        for dep in skill.deps:
+            self.import_module(dep)
+        return self._function(skill.module, skill.handler)
+
+    def call(self, skill: Skill, *args, **kwargs):
+        return self.load(skill)(*args, **kwargs)
+
+    def key(self, skill: Skill, *args):
+        """The skill's cheap key function (imports the module, not the deps)."""
+        if skill.key is None:
+            return (skill.name,)
+        return self._function(skill.module, skill.key)(*args)
+
+    def preload(self, kind: Optional[str] = None) -> Dict[str, Optional[str]]:
+        """Import every skill up front (the old eager behaviour); name -> error or None."""
+        errors = {}
+        for skill in self._skills:
+            if kind is not None and skill.kind != kind:
+                continue
+            try:
+                self.load(skill)
+                errors[skill.name] = None
+            except Exception as e:
+                errors[skill.name] = f"{type(e).__name__}: {e}"
+        return errors
+
+
+class LazyModule:
+    """Module stand-in that imports the real module on first attribute access."""
+
+    def __init__(self, name: str, registry: Optional[SkillRegistry] = None):
+        self._name = name
+        self._registry = registry
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = (self._registry or registry).import_module(self._name)
+        return getattr(self._module, attr)
+
+
+registry = SkillRegistry()
+
+# ────────────────────────────────────────────────
+#  Built-in skills (registration order = priority)
+# ────────────────────────────────────────────────
+
+for _name, _triggers, _deps in [
+    ("time", ('time', 'clock', 'hour', 'now'), ()),
+    ("date", ('date', 'today', 'day', 'tomorrow'), ()),
+    ("weather", ('weather', 'temperature', 'forecast', 'climate'), ("requests",)),
+    ("stock", ('stock', 'price', 'share', 'nse', 'bse'), ("yfinance",)),
+    ("news", ('news', 'headline', 'latest', 'breaking', "today's news"), ("newsapi",)),
+]:
+    registry.register(Skill(
+        _name, "realtime", "Backend.realtime_q", f"{_name}_data", _triggers, _deps, key=f"{_name}_key",
+    ))
+
+for _name, _triggers, _module in [
+    ("apps", ('open', 'close', 'play', 'launch', 'run'), "app_control"),
+    ("volume", ('volume',), "volume_control"),
+    ("files", ('file', 'folder', 'delete'), "file_control"),
+    ("power", ('shutdown', 'restart', 'settings'), "system_control"),
+    ("windows", ('window', 'minimize', 'maximize'), "window_control"),
+    # Only reached through the classifier ("search in files ..."), no keyword fallback
+    ("search", (), "search_control"),
+    # Whole phrases only: a bare 'job' would catch "steve jobs" and "job interview"
+    ("jobs", ('job status', 'cancel job', 'stop job', 'running jobs', 'background jobs'), "jobs"),
+]:
+    registry.register(Skill(
+        _name, "system", "Backend.systemq", "handle_system_query", _triggers, (f"Backend.system.{_module}",),
+    ))
@@ -0,0 +1,127 @@
+# Backend/speculation.py
+"""
+Speculative work on partial transcripts.
+
+While the user is still talking, a streaming recognizer already tells us
+"what's the weather in indore". The intent matcher (realtime_key) runs on
+every partial; a likely realtime lookup is fetched in the background and
+its template answer handed to on_answer (e.g. to pre-synthesize speech),
+and LLM-bound turns get their Groq connections warmed. When the final
+transcript arrives, resolve() commits the prefetch only if the final text
+maps to the same lookup; everything else is discarded.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+from Backend.realtime_q import get_realtime_data, realtime_key
+from Backend import templates
+
+
+class Speculator:
+    def __init__(
+        self,
+        fetch: Callable[[str], Optional[dict]] = get_realtime_data,
+        warm_llm: Optional[Callable[[], None]] = None,
+        on_answer: Optional[Callable[[str], None]] = None,
+        max_age: float = 10.0,
+        workers: int = 2,
+    ):
+        self.fetch = fetch
+        self.warm_llm = warm_llm
+        self.on_answer = on_answer
+        self.max_age = max_age
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="speculate")
+        self._lock = threading.Lock()
+        self._jobs: Dict[tuple, tuple] = {}   # realtime key -> (started, future)
+        self._warmed = False
+        self.turns = 0
+        self.speculated = 0
+        self.hits = 0
+        self.saved = []   # seconds of lookup that overlapped the user's speech
+
+    # ────────────────────────────────────────────────
+    #  During the utterance
+    # ────────────────────────────────────────────────
+
+    def on_partial(self, text: str):
+        """Feed every partial transcript; cheap when nothing new is recognised."""
+        key = realtime_key(text)
+        with self._lock:
+            if key is None:
+                # Probably an LLM turn: open the connections once per turn
+                if self.warm_llm is not None and not self._warmed and len(text.split()) >= 2:
+                    self._warmed = True
+                    self._pool.submit(self._safe, self.warm_llm)
+                return
+            if key in self._jobs:
+                return
+            self._jobs[key] = (time.perf_counter(), self._pool.submit(self._prefetch, text))
+
+    def _prefetch(self, text: str) -> Optional[dict]:
+        start = time.perf_counter()
+        result = self.fetch(text)
+        if not result:
+            return None
+        answer = templates.answer(text, result)
+        if answer and self.on_answer is not None:
+            self._safe(self.on_answer, answer)
+        return {"realtime": result, "answer": answer, "fetch_s": time.perf_counter() - start}
+
+    @staticmethod
+    def _safe(fn, *args):
+        try:
+            fn(*args)
+        except Exception as e:
+            print(f"[SPECULATE] {getattr(fn, '__name__', 'task')} failed: {e}", flush=True)
+
+    # ────────────────────────────────────────────────
+    #  Final transcript
+    # ────────────────────────────────────────────────
+
+    def resolve(self, final_text: str) -> Optional[dict]:
+        """
+        Commit the prefetch that matches the final transcript (waiting for it
+        if it is still in flight) and drop the rest. Returns brainQ's
+        `prefetched` argument, or None.
+        """
+        now = time.perf_counter()
+        with self._lock:
+            jobs, self._jobs = self._jobs, {}
+            self._warmed = False
+        self.turns += 1
+        if jobs:
+            self.speculated += 1
+
+        key = realtime_key(final_text) if final_text else None
+        job = jobs.pop(key, None) if key is not None else None
+        for _, future in jobs.values():
+            future.cancel()
+        if job is None or now - job[0] > self.max_age:
+            return None
+
+        started, future = job
+        try:
+            data = future.result(timeout=self.max_age)
+        except Exception as e:
+            print(f"[SPECULATE] Prefetch failed: {e}", flush=True)
+            return None
+        if not data:
+            return None
+        self.hits += 1
+        # Lookup time already spent while the user was still talking
+        self.saved.append(min(data["fetch_s"], now - started))
+        return data
+
+    def report(self) -> str:
+        hit_rate = self.hits / self.speculated if self.speculated else 0.0
+        saved = sum(self.saved) / len(self.saved) * 1000 if self.saved else 0.0
+        return (
+            f"{self.speculated}/{self.turns} turns speculated, {self.hits} correct ({hit_rate:.0%}), "
+            f"avg saved {saved:.0f} ms"
+        )
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
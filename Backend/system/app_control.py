@@ -1,10 +1,37 @@
 import os
-import subprocess
+import shutil
 import platform
 import webbrowser
-from youtube_search import YoutubeSearch
 import urllib.parse
 
+from Backend.system.app_index import index as app_index
+from Backend.system.launcher import check_allowed, launcher
+
+WINDOWS = platform.system() == "Windows"
+
+
+def _open_entry(name, entry):
+    """Start an indexed app without waiting for it (tracked by the launcher when it has a PID)."""
+    if entry.kind == "url":
+        webbrowser.open(entry.target)
+    elif entry.kind == "desktop":
+        launcher.launch_command(name, entry.command, entry.image)
+    elif entry.kind == "exe":
+        launcher.launch(name, [entry.target], entry.image)
+    elif entry.kind == "command":
+        path = shutil.which(entry.target)
+        if path:
+            launcher.launch(name, [path], entry.image)
+        elif WINDOWS:
+            # App Paths names (msedge) only resolve through `start`
+            launcher.hand_off(["cmd", "/c", "start", "", entry.target], entry.target)
+        else:
+            raise FileNotFoundError(f"{entry.target} is not installed")
+    elif entry.kind == "macapp":
+        launcher.hand_off(["open", "-a", entry.target], entry.target)
+    else:
+        os.startfile(entry.target)  # Start Menu shortcut
+
 def open_application(app_name):
     """
     Opens an application based on the app_name.
@@ -12,107 +39,49 @@ def open_application(app_name):
     Also supports playing songs/videos on YouTube by saying 'play {query}'
     """
     try:
-        if platform.system() == "Windows":
-            # Check for play command
-            if app_name.lower().startswith("play "):
-                query = app_name[5:].strip()
-                try:
-                    results = YoutubeSearch(query, max_results=1).to_dict()
-                    if results:
-                        video_id = results[0]['id']
-                        url = f"https://www.youtube.com/watch?v={video_id}"
-                        webbrowser.open(url)
-                        return f"Playing '{query}' on YouTube"
-                    else:
-                        search_url = f"https://www.youtube.com/results?search_query={query.replace(' ', '+')}"
-                        webbrowser.open(search_url)
-                        return f"No results found, searching for '{query}' on YouTube"
-                except Exception as e:
+        # Check for play command
+        if app_name.lower().startswith("play "):
+            query = app_name[5:].strip()
+            try:
+                from youtube_search import YoutubeSearch
+                results = YoutubeSearch(query, max_results=1).to_dict()
+                if results:
+                    video_id = results[0]['id']
+                    url = f"https://www.youtube.com/watch?v={video_id}"
+                    webbrowser.open(url)
+                    return f"Playing '{query}' on YouTube"
+                else:
                     search_url = f"https://www.youtube.com/results?search_query={query.replace(' ', '+')}"
                     webbrowser.open(search_url)
-                    return f"Error searching, opened search for '{query}' on YouTube: {str(e)}"
-            
-            # Map common app names to executables or URLs
-            app_map = {
-                "browser": "msedge",
-                "chrome": "chrome",
-                "firefox": "firefox",
-                "edge": "msedge",
-                "notepad": "notepad",
-                "calculator": "calc",
-                "calc": "calc",
-                "explorer": "explorer",
-                "cmd": "cmd",
-                "powershell": "powershell",
-                "wordpad": "wordpad",
-                "control panel": "control",
-                "control": "control",
-                "settings": "control",
-                "vscode": "code",
-                "visual studio code": "code",
-                "whatsapp": "https://web.whatsapp.com",  # Fallback to web if desktop not found
-                "instagram": "https://www.instagram.com",
-                "telegram": "https://web.telegram.org",
-                "youtube": "https://www.youtube.com",
-                "anti gravity": "antigravity",
-            }
-            if app_name.lower() in app_map:
-                exe = app_map[app_name.lower()]
-                if exe.startswith("http"):
-                    webbrowser.open(exe)
-                    return f"Opened {app_name} in browser"
-                else:
-                    os.system(f"start {exe}")
-                    return f"Opened {app_name}"
-            else:
-                # Try to open as executable
-                subprocess.run([app_name], shell=True)
-                return f"Attempted to open {app_name}"
-        else:
-            return f"Platform {platform.system()} not fully supported yet"
+                    return f"No results found, searching for '{query}' on YouTube"
+            except Exception as e:
+                search_url = f"https://www.youtube.com/results?search_query={query.replace(' ', '+')}"
+                webbrowser.open(search_url)
+                return f"Error searching, opened search for '{query}' on YouTube: {str(e)}"
+
+        entry = app_index.find(app_name)
+        if entry is None:
+            # Never hand what was heard to a shell
+            return f"{app_name} is not installed"
+        _open_entry(entry.name, entry)
+        if entry.kind == "url":
+            return f"Opened {app_name} in browser"
+        return f"Opened {app_name}"
     except Exception as e:
         return f"Error opening {app_name}: {str(e)}"
 
 def close_application(app_name):
     """
-    Closes an application by name.
-    Note: This is basic; for better control, might need psutil.
+    Closes an application by name: the processes Rex launched for it
+    (gracefully, then forcefully), otherwise by its process image name.
     """
     try:
-        if platform.system() == "Windows":
-            # Map common app names to executables or URLs
-            app_map = {
-                "browser": "msedge",
-                "chrome": "chrome",
-                "firefox": "firefox",
-                "edge": "msedge",
-                "notepad": "notepad",
-                "calculator": "calc",
-                "calc": "calc",
-                "explorer": "explorer",
-                "cmd": "cmd",
-                "powershell": "powershell",
-                "wordpad": "wordpad",
-                "control panel": "control",
-                "control": "control",
-                "settings": "control",
-                "vscode": "code",
-                "visual studio code": "code",
-                "whatsapp": "https://web.whatsapp.com",  # Fallback to web if desktop not found
-                "instagram": "https://www.instagram.com",
-                "telegram": "https://web.telegram.org",
-                "youtube": "https://www.youtube.com",
-                "anti gravity": "antigravity",
-            }
-            if app_name.lower() in app_map:
-                exe = app_map[app_name.lower()]
-                os.system(f"taskkill /f /im {exe}.exe")
-                return f"Closed {app_name}"
-            else:
-                os.system(f"taskkill /f /im {app_name}.exe")
-                return f"Closed {app_name}"
-        else:
-            return f"Platform {platform.system()} not supported"
+        entry = app_index.find(app_name)
+        name = entry.name if entry is not None else app_name
+        image = entry.image if entry is not None and entry.image else (f"{app_name}.exe" if WINDOWS else app_name)
+        if launcher.close(name, image) is None:
+            return f"{app_name} is not running"
+        return f"Closed {app_name}"
     except Exception as e:
         return f"Error closing {app_name}: {str(e)}"
 
@@ -121,41 +90,20 @@ def launch_program(program_path):
     Launches a program from a given path or name.
     """
     try:
-        # Map common app names to executables or URLs
-        app_map = {
-            "browser": "msedge",
-            "chrome": "chrome",
-            "firefox": "firefox",
-            "edge": "msedge",
-            "notepad": "notepad",
-            "calculator": "calc",
-            "calc": "calc",
-            "explorer": "explorer",
-            "cmd": "cmd",
-            "powershell": "powershell",
-            "wordpad": "wordpad",
-            "control panel": "control",
-            "control": "control",
-            "settings": "control",
-            "vscode": "code",
-            "visual studio code": "code",
-            "whatsapp": "https://web.whatsapp.com",  # Fallback to web if desktop not found
-            "instagram": "https://www.instagram.com",
-            "telegram": "https://web.telegram.org",
-            "youtube": "https://www.youtube.com",
-            "anti gravity": "antigravity",
-        }
-        if program_path.lower() in app_map:
-            exe = app_map[program_path.lower()]
-            if exe.startswith("http"):
-                webbrowser.open(exe)
-                return f"Launched {program_path} in browser"
+        entry = app_index.find(program_path)
+        if entry is None:
+            if not os.path.isfile(program_path):
+                return f"{program_path} is not installed"
+            check_allowed(program_path)
+            if WINDOWS:
+                os.startfile(program_path)
             else:
-                os.system(f"start {exe}")
-                return f"Launched {program_path}"
-        else:
-            os.startfile(program_path)
+                launcher.launch(program_path, [program_path])
             return f"Launched {program_path}"
+        _open_entry(entry.name, entry)
+        if entry.kind == "url":
+            return f"Launched {program_path} in browser"
+        return f"Launched {program_path}"
     except Exception as e:
         return f"Error launching {program_path}: {str(e)}"
 
@@ -0,0 +1,421 @@
+"""
+Index of installed applications, for "open / close / launch <app>".
+
+Sources: Start Menu shortcuts and PATH executables on Windows, .desktop
+files and PATH on Linux, /Applications on macOS, plus the built-in
+aliases ("browser", "control panel", web apps). The index is saved to
+disk (REX_APP_INDEX, default .cache/apps.json) and refreshed per
+directory: a directory whose mtime hasn't changed is not listed again,
+and .desktop files whose own mtime hasn't changed are not re-parsed.
+
+Lookups never touch the disk. Spoken names are matched exactly, then
+with spaces removed ("note pad"), with spelled-out letters joined ("vee
+ess code"), by a phonetic key ("fire focks"), by prefix, and finally
+fuzzily; results are memoized. PATH executables only match by name
+(exact, spaces removed or spelled out), so "open power" can't reach
+poweroff, and sbin directories are not indexed at all. A refresh builds
+new tables and swaps them in, so it runs on a background thread (the
+startup warm-up, or the first lookup starts one) while turns keep
+looking up. A name that isn't found may be an app installed since: a
+miss starts another refresh (at most once per REX_APP_RESCAN seconds)
+and waits briefly for it before giving up.
+"""
+
+import bisect
+import difflib
+import functools
+import json
+import os
+import platform
+import re
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional
+
+INDEX_PATH = os.getenv("REX_APP_INDEX", ".cache/apps.json")
+INDEX_VERSION = 2      # 2: sbin directories dropped
+RESCAN_INTERVAL = float(os.getenv("REX_APP_RESCAN", "30"))   # min seconds between refreshes after a miss
+RESCAN_WAIT = 0.5     # how long a missed lookup waits for that refresh (incremental ones take ms)
+
+# Spoken name -> app name (looked up in the index) or URL / command
+APP_ALIASES = {
+    "browser": "msedge",
+    "chrome": "chrome",
+    "firefox": "firefox",
+    "edge": "msedge",
+    "notepad": "notepad",
+    "calculator": "calc",
+    "calc": "calc",
+    "explorer": "explorer",
+    "cmd": "cmd",
+    "powershell": "powershell",
+    "wordpad": "wordpad",
+    "control panel": "control",
+    "control": "control",
+    "settings": "control",
+    "vscode": "code",
+    "visual studio code": "code",
+    "whatsapp": "https://web.whatsapp.com",  # Fallback to web if desktop not found
+    "instagram": "https://www.instagram.com",
+    "telegram": "https://web.telegram.org",
+    "youtube": "https://www.youtube.com",
+    "anti gravity": "antigravity",
+}
+
+# Lower wins when several entries share a name
+SOURCE_RANK = {"alias": 0, "startmenu": 1, "desktop": 1, "macapp": 1, "path": 2}
+# Sources matched by phonetic key, prefix and similarity too; PATH entries need their name
+FUZZY_SOURCES = ("alias", "startmenu", "desktop", "macapp")
+PHONETIC_MIN = 4      # shorter keys collide ("files" and "false" are both "fls")
+SIMILARITY = 0.7      # a sound-alike must also be spelled roughly the same, once respelled
+
+
+@dataclass
+class AppEntry:
+    name: str                # display name ("Visual Studio Code")
+    target: str              # shortcut / .desktop / executable path, URL, or bare command
+    kind: str                # "shortcut" | "desktop" | "exe" | "macapp" | "url" | "command"
+    source: str              # see SOURCE_RANK
+    image: str = ""          # process image name, for closing ("code.exe", "firefox")
+    command: str = ""        # .desktop Exec line
+    mtime: float = 0.0       # of the file it came from
+
+
+# ============ Name keys ============
+
+_PHONETIC_RULES = [("ph", "f"), ("ck", "k"), ("qu", "kw"), ("q", "k"), ("x", "ks"), ("z", "s"),
+                   ("c", "k"), ("v", "f"), ("w", "v")]
+# Letters spelled out by speech recognizers ("vee ess code")
+_SPELLED = {"ay": "a", "bee": "b", "see": "c", "dee": "d", "ee": "e", "eff": "f", "gee": "g",
+            "jay": "j", "kay": "k", "el": "l", "em": "m", "en": "n", "oh": "o", "pee": "p",
+            "cue": "q", "ar": "r", "ess": "s", "tee": "t", "you": "u", "vee": "v", "ex": "x", "zed": "z"}
+
+
+def normalize(name: str) -> str:
+    """Lower-case words: 'Visual-Studio Code.exe' -> 'visual studio code'."""
+    name = re.sub(r"\.(exe|lnk|url|desktop|app|appref-ms|bat|cmd|com)$", "", name.strip().lower())
+    return " ".join(re.findall(r"[a-z0-9]+", name))
+
+
+def compact(name: str) -> str:
+    return normalize(name).replace(" ", "")
+
+
+def spelled(name: str) -> str:
+    """Letters a recognizer spelled out joined back: 'vee ess code' -> 'vscode'."""
+    words = normalize(name).split()
+    return "".join(_SPELLED.get(w, w) for w in words)
+
+
+@functools.lru_cache(maxsize=65536)
+def _keys(name: str) -> tuple:
+    """(normalized, compact, phonetic) of an indexed name, cached across rebuilds."""
+    return normalize(name), compact(name), phonetic(name)
+
+
+def respell(name: str) -> str:
+    """Compact name with spelling variants collapsed: 'fire focks' -> 'firefoks'."""
+    s = compact(name)
+    for a, b in _PHONETIC_RULES:
+        s = s.replace(a, b)
+    return s
+
+
+def phonetic(name: str) -> str:
+    """Rough sound-alike key: spelling variants collapse, vowels after the first letter drop."""
+    s = respell(name)
+    if not s:
+        return ""
+    rest = re.sub(r"[aeiouyh]", "", s[1:])
+    return s[0] + re.sub(r"(.)\1+", r"\1", rest)
+
+
+# ============ Sources ============
+
+def _source_dirs() -> List[tuple]:
+    """(directory, source, recursive) for this platform."""
+    system = platform.system()
+    dirs = []
+    if system == "Windows":
+        for base in (os.getenv("APPDATA"), os.getenv("PROGRAMDATA")):
+            if base:
+                dirs.append((os.path.join(base, "Microsoft", "Windows", "Start Menu", "Programs"), "startmenu", True))
+    elif system == "Darwin":
+        dirs += [("/Applications", "macapp", False), (os.path.expanduser("~/Applications"), "macapp", False)]
+    else:
+        data_dirs = os.getenv("XDG_DATA_DIRS", "/usr/local/share:/usr/share").split(":")
+        data_dirs.insert(0, os.getenv("XDG_DATA_HOME", os.path.expanduser("~/.local/share")))
+        data_dirs += ["/var/lib/flatpak/exports/share", os.path.expanduser("~/.local/share/flatpak/exports/share")]
+        for base in data_dirs:
+            if base:
+                dirs.append((os.path.join(base, "applications"), "desktop", True))
+    for d in os.getenv("PATH", "").split(os.pathsep):
+        # System administration binaries (shutdown, wipefs, ...) are never launched by voice
+        if d and (system == "Windows" or os.path.basename(os.path.normpath(d)) != "sbin"):
+            dirs.append((d, "path", False))
+    seen, out = set(), []
+    for d, source, recursive in dirs:
+        key = os.path.normcase(os.path.abspath(d))
+        if key not in seen:
+            seen.add(key)
+            out.append((key, source, recursive))
+    return out
+
+
+def _parse_desktop(path: str) -> List[AppEntry]:
+    """Name / GenericName / Exec of a .desktop file; hidden entries are skipped."""
+    fields = {}
+    try:
+        with open(path, "r", encoding="utf-8", errors="ignore") as f:
+            in_entry = False
+            for line in f:
+                line = line.strip()
+                if line.startswith("["):
+                    in_entry = line == "[Desktop Entry]"
+                elif in_entry and "=" in line:
+                    key, value = line.split("=", 1)
+                    fields.setdefault(key.strip(), value.strip())
+    except OSError:
+        return []
+    if fields.get("Type", "Application") != "Application" or fields.get("NoDisplay") == "true" \
+            or fields.get("Hidden") == "true" or not fields.get("Name"):
+        return []
+    command = re.sub(r"\s*%[a-zA-Z]", "", fields.get("Exec", "")).strip()
+    image = os.path.basename(command.split()[0]) if command else ""
+    mtime = os.path.getmtime(path)
+    names = [fields["Name"]] + ([fields["GenericName"]] if fields.get("GenericName") else [])
+    return [AppEntry(n, path, "desktop", "desktop", image, command, mtime) for n in names]
+
+
+def _is_executable(entry: os.DirEntry, windows: bool, pathext) -> bool:
+    if windows:
+        return os.path.splitext(entry.name)[1].lower() in pathext
+    try:
+        return entry.is_file() and os.access(entry.path, os.X_OK)
+    except OSError:
+        return False
+
+
+def _scan_dir(directory: str, source: str, previous: Dict[str, dict]) -> List[dict]:
+    """Entries directly in one directory; unchanged .desktop files reuse their previous parse."""
+    windows = platform.system() == "Windows"
+    pathext = {e.lower() for e in os.getenv("PATHEXT", ".exe;.bat;.cmd;.com").split(";") if e}
+    out = []
+    with os.scandir(directory) as it:
+        for entry in it:
+            name = entry.name
+            lower = name.lower()
+            if source == "startmenu" and lower.endswith((".lnk", ".url", ".appref-ms")):
+                out.append(asdict(AppEntry(os.path.splitext(name)[0], entry.path, "shortcut", source)))
+            elif source == "desktop" and lower.endswith(".desktop"):
+                try:
+                    mtime = entry.stat().st_mtime
+                except OSError:
+                    continue
+                cached = previous.get(entry.path)
+                if cached and cached[0]["mtime"] == mtime:
+                    out.extend(cached)
+                else:
+                    out.extend(asdict(e) for e in _parse_desktop(entry.path))
+            elif source == "macapp" and lower.endswith(".app"):
+                out.append(asdict(AppEntry(name[:-4], entry.path, "macapp", source, name[:-4])))
+            elif source == "path" and _is_executable(entry, windows, pathext):
+                stem = os.path.splitext(name)[0] if windows else name
+                out.append(asdict(AppEntry(stem, entry.path, "exe", source, name)))
+    return out
+
+
+# ============ Index ============
+
+class AppIndex:
+    def __init__(self, path: str = INDEX_PATH, sources: Optional[List[tuple]] = None,
+                 rescan_interval: float = RESCAN_INTERVAL):
+        self.path = path
+        self.sources = sources            # (dir, source, recursive); None = this platform's
+        self.rescan_interval = rescan_interval
+        self._refreshed_at = None         # monotonic time the last refresh started
+        self._dirs: Dict[str, dict] = {}  # dir -> {"mtime", "source", "entries"}
+        self._refresh_lock = threading.Lock()
+        self._loaded = False
+        self._refreshing = None
+        self.last_refresh = {}
+        self._build([])
+
+    # ── Lookup tables (swapped in whole; readers need no lock) ──
+
+    def _build(self, entries: List[AppEntry]):
+        aliases = [AppEntry(name, target, "url" if target.startswith("http") else "command", "alias",
+                            "" if target.startswith("http") else target + (".exe" if platform.system() == "Windows" else ""))
+                   for name, target in APP_ALIASES.items()]
+        exact, squashed, sounds, by_initial = {}, {}, {}, {}
+        ordered = sorted(aliases + entries, key=lambda e: (SOURCE_RANK.get(e.source, 9), len(e.name)))
+        for entry in ordered:
+            words, squashed_key, sound = _keys(entry.name)
+            exact.setdefault(words, entry)
+            fuzzy = entry.source in FUZZY_SOURCES
+            if squashed_key not in squashed:
+                squashed[squashed_key] = entry
+                if fuzzy:
+                    by_initial.setdefault(squashed_key[:1], []).append(squashed_key)
+            if fuzzy and len(sound) >= PHONETIC_MIN:
+                sounds.setdefault(sound, entry)
+        keys = sorted(k for keys in by_initial.values() for k in keys)
+        self._tables = (exact, squashed, sounds, keys, by_initial)
+        self._memo: Dict[str, Optional[AppEntry]] = {}
+
+    def __len__(self):
+        return len(self._tables[0])
+
+    def find(self, spoken: str) -> Optional[AppEntry]:
+        """Best entry for a spoken app name, or None. Aliases are followed to an installed app."""
+        if self._refreshing is None and not self.last_refresh:
+            self.refresh_async()  # nobody scanned yet: start now, answer from what we have
+        memo = self._memo
+        if spoken in memo and (memo[spoken] is not None or not self._rescan_due()):
+            return memo[spoken]
+        entry = self._match(spoken)
+        if entry is None and self._rescan_due():
+            entry = self._rescan_for(spoken)
+            memo = self._memo
+        if entry is not None and entry.source == "alias" and entry.kind == "command":
+            # "calculator" -> "calc": prefer what is actually installed under that name
+            installed = self._tables[0].get(normalize(entry.target))
+            if installed is not None and installed.source != "alias":
+                entry = installed
+        if len(memo) > 1024:
+            memo.clear()
+        memo[spoken] = entry
+        return entry
+
+    def _rescan_due(self) -> bool:
+        if self._refresh_lock.locked():
+            return False   # a refresh is running now
+        return self._refreshed_at is None or time.monotonic() - self._refreshed_at >= self.rescan_interval
+
+    def _rescan_for(self, spoken: str) -> Optional[AppEntry]:
+        """A missed name may have been installed since the last scan: refresh, then look again."""
+        tables = self._tables
+        self.refresh_async().join(RESCAN_WAIT)
+        if self._tables is tables:
+            return None   # nothing changed (or still scanning): a later lookup sees the result
+        return self._match(spoken)
+
+    def _match(self, spoken: str) -> Optional[AppEntry]:
+        exact, squashed, sounds, keys, by_initial = self._tables
+        name = normalize(spoken)
+        if not name:
+            return None
+        key = compact(name)
+        entry = exact.get(name) or squashed.get(key) or squashed.get(spelled(name))
+        if entry is not None:
+            return entry
+        sound = phonetic(name)
+        entry = sounds.get(sound) if len(sound) >= PHONETIC_MIN else None
+        if entry is not None and \
+                difflib.SequenceMatcher(None, respell(name), respell(entry.name)).ratio() >= SIMILARITY:
+            return entry
+        if len(key) >= 3:
+            # Shortest name starting with what was said: a run in the sorted keys (PATH excluded)
+            i = bisect.bisect_left(keys, key)
+            best = None
+            while i < len(keys) and keys[i].startswith(key):
+                if best is None or len(keys[i]) < len(best):
+                    best = keys[i]
+                i += 1
+            if best is not None:
+                return squashed[best]
+        # Misheard names: same first letter, similar length
+        candidates = [k for k in by_initial.get(key[:1], ()) if abs(len(k) - len(key)) <= 2]
+        close = difflib.get_close_matches(key, candidates, n=1, cutoff=0.8)
+        return squashed[close[0]] if close else None
+
+    # ── Persistence and refresh ──
+
+    def load(self):
+        """Read the saved index (fast; no directory scan)."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == INDEX_VERSION:
+                self._dirs = data.get("dirs", {})
+                self._build(self._entries())
+        except (OSError, ValueError):
+            pass
+        self._loaded = True
+
+    def save(self):
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp = self.path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                # dumps() uses the C encoder; dump() to a file streams through the pure-Python one
+                f.write(json.dumps({"version": INDEX_VERSION, "dirs": self._dirs}))
+            os.replace(tmp, self.path)
+        except OSError as e:
+            print(f"[APPS] Could not save index: {e}", flush=True)
+
+    def _entries(self) -> List[AppEntry]:
+        return [AppEntry(**e) for d in self._dirs.values() for e in d["entries"]]
+
+    def refresh(self) -> dict:
+        """Rescan directories whose mtime changed; returns scan statistics."""
+        self._refreshing = self._refreshing or threading.current_thread()
+        with self._refresh_lock:
+            if not self._loaded:
+                self.load()
+            self._refreshed_at = time.monotonic()
+            start = time.perf_counter()
+            stats = {"dirs": 0, "rescanned": 0, "entries": 0}
+            dirs: Dict[str, dict] = {}
+            pending = [(d, source, recursive) for d, source, recursive in (self.sources or _source_dirs())]
+            while pending:
+                directory, source, recursive = pending.pop()
+                try:
+                    mtime = os.stat(directory).st_mtime
+                except OSError:
+                    continue
+                stats["dirs"] += 1
+                old = self._dirs.get(directory)
+                if old is not None and old["mtime"] == mtime and old["source"] == source:
+                    dirs[directory] = old
+                else:
+                    previous = {}
+                    for e in (old or {}).get("entries", []):
+                        previous.setdefault(e["target"], []).append(e)
+                    try:
+                        dirs[directory] = {"mtime": mtime, "source": source,
+                                           "entries": _scan_dir(directory, source, previous),
+                                           "subdirs": self._subdirs(directory) if recursive else []}
+                    except OSError:
+                        continue
+                    stats["rescanned"] += 1
+                if recursive:
+                    pending += [(sub, source, True) for sub in dirs[directory].get("subdirs", [])]
+            changed = stats["rescanned"] > 0 or set(dirs) != set(self._dirs)
+            self._dirs = dirs
+            entries = self._entries()
+            stats["entries"] = len(entries)
+            if changed or len(self) <= len(APP_ALIASES):
+                self._build(entries)
+            if changed:
+                self.save()
+            stats["ms"] = (time.perf_counter() - start) * 1000
+            self.last_refresh = stats
+            print(f"[APPS] {stats['entries']} apps, rescanned {stats['rescanned']}/{stats['dirs']} "
+                  f"directories in {stats['ms']:.0f} ms", flush=True)
+            return stats
+
+    @staticmethod
+    def _subdirs(directory: str) -> List[str]:
+        with os.scandir(directory) as it:
+            return [e.path for e in it if e.is_dir(follow_symlinks=False)]
+
+    def refresh_async(self) -> threading.Thread:
+        self._refreshed_at = time.monotonic()
+        self._refreshing = threading.Thread(target=self.refresh, name="app-index", daemon=True)
+        self._refreshing.start()
+        return self._refreshing
+
+
+index = AppIndex()
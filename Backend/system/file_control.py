@@ -1,5 +1,7 @@
 import os
-import shutil
+import stat
+
+from Backend.system.jobs import Job, JobStopped
 
 def open_file(file_path):
     """
@@ -35,16 +37,53 @@ def delete_file(file_path):
     except Exception as e:
         return f"Error deleting {file_path}: {str(e)}"
 
-def delete_folder(folder_path):
+def _remove(path, remove):
+    try:
+        remove(path)
+    except PermissionError:
+        os.chmod(path, stat.S_IWRITE)  # read-only files on Windows
+        remove(path)
+
+def _count_entries(folder_path, job):
+    total = 0
+    for root, dirs, files in os.walk(folder_path):
+        job.check()
+        total += len(dirs) + len(files)
+    return total
+
+def delete_folder(folder_path, job=None):
     """
     Deletes a folder (and contents).
+    Run as a background job, it counts the entries first and then removes
+    them bottom-up, reporting progress and stopping between entries when
+    the job is cancelled (what was already deleted stays deleted).
     """
+    job = job or Job()
     try:
-        if os.path.isdir(folder_path):
-            shutil.rmtree(folder_path)
-            return f"Deleted folder {folder_path}"
-        else:
+        if os.path.islink(folder_path) or not os.path.isdir(folder_path):
             return f"{folder_path} is not a folder"
+        total = _count_entries(folder_path, job)
+        removed = 0
+        try:
+            for root, dirs, files in os.walk(folder_path, topdown=False):
+                for name in files:
+                    job.check()
+                    _remove(os.path.join(root, name), os.unlink)
+                    removed += 1
+                for name in dirs:
+                    job.check()
+                    path = os.path.join(root, name)
+                    _remove(path, os.unlink if os.path.islink(path) else os.rmdir)
+                    removed += 1
+                job.progress(removed, total, f"{removed} of {total} items")
+            os.rmdir(folder_path)
+        except JobStopped:
+            job.summary = f"{removed} of {total} items had been deleted."
+            raise
+        job.summary = f"Deleted {total} items."
+        return f"Deleted folder {folder_path}"
+    except JobStopped:
+        raise
     except Exception as e:
         return f"Error deleting {folder_path}: {str(e)}"
 
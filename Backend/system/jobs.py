@@ -0,0 +1,243 @@
+"""
+Background jobs for long-running system commands (deleting a folder,
+running a shell command, searching files), so a voice turn never waits
+for them.
+
+submit() queues a job on a small worker pool and waits briefly: a job
+that finishes within REX_JOB_INLINE seconds is answered directly, as
+before; anything longer is answered with "Started" and announced through
+the on_finish() callbacks when it is done. Job functions take a `job`
+keyword and call job.check() between units of work, which raises
+JobStopped once the job is cancelled or past its timeout; they report
+progress with job.progress() and stream output lines with job.write().
+"""
+
+import itertools
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+WORKERS = int(os.getenv("REX_JOB_WORKERS", "2"))
+JOB_TIMEOUT = float(os.getenv("REX_JOB_TIMEOUT", "600"))   # commands and searches, 0 = none
+INLINE_WAIT = float(os.getenv("REX_JOB_INLINE", "1.0"))
+OUTPUT_LINES = 200
+
+QUEUED, RUNNING, DONE, FAILED, CANCELLED, TIMED_OUT = (
+    "queued", "running", "done", "failed", "cancelled", "timed out",
+)
+FINISHED = (DONE, FAILED, CANCELLED, TIMED_OUT)
+
+
+def _sentence(text: str) -> str:
+    return text[:1].upper() + text[1:]
+
+
+class JobStopped(Exception):
+    """Raised by Job.check() once the job is cancelled or has run out of time."""
+
+
+class Job:
+    """
+    One unit of background work. Also usable on its own (job functions
+    called synchronously get a fresh Job that is never stopped).
+    """
+
+    def __init__(self, title: str = "", timeout: Optional[float] = None, job_id: int = 0):
+        self.id = job_id
+        self.title = title
+        self.timeout = timeout or None
+        self.state = QUEUED
+        self.result = ""
+        self.summary = ""               # short spoken form of the result, if the function sets one
+        self.done_count = 0
+        self.total = None
+        self.detail = ""
+        self.output = deque(maxlen=OUTPUT_LINES)
+        self.created = time.monotonic()
+        self.started = None
+        self.finished = None
+        self.inline = True              # the submitting turn is still waiting for it
+        self._cancel = threading.Event()
+        self._done = threading.Event()
+
+    # ── Called from the job function ──
+
+    def check(self):
+        """Raise JobStopped if the job was cancelled or is past its timeout."""
+        if self._cancel.is_set():
+            raise JobStopped(CANCELLED)
+        if self.timeout and self.started and time.monotonic() - self.started > self.timeout:
+            raise JobStopped(TIMED_OUT)
+
+    def progress(self, done: int, total: Optional[int] = None, detail: str = ""):
+        self.done_count = done
+        if total is not None:
+            self.total = total
+        if detail:
+            self.detail = detail
+
+    def write(self, line: str):
+        self.output.append(line.rstrip("\n"))
+
+    # ── Called from anywhere ──
+
+    def cancel(self):
+        self._cancel.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._done.wait(timeout)
+
+    @property
+    def percent(self) -> Optional[int]:
+        if not self.total:
+            return None
+        return min(100, int(self.done_count * 100 / self.total))
+
+    @property
+    def seconds(self) -> float:
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.monotonic()) - self.started
+
+    def tail(self, n: int = 5) -> List[str]:
+        return list(self.output)[-n:]
+
+    def status(self) -> str:
+        """One spoken line: what it is doing and how far along it is."""
+        text = f"Job {self.id}, {self.title}: {self.state}"
+        if self.state == RUNNING:
+            if self.percent is not None:
+                text += f", {self.percent}%"
+            if self.detail:
+                text += f" ({self.detail})"
+            text += f", {self.seconds:.0f} seconds so far"
+        elif self.state in FINISHED and self.summary:
+            text += f", {self.summary}"
+        return text
+
+    def announcement(self) -> str:
+        """What the assistant says when the job finishes in the background."""
+        title = _sentence(self.title)
+        if self.state == DONE:
+            return f"{title} is done, Sir. {self.summary or self.result}".strip()
+        if self.state == CANCELLED:
+            return f"{title} was cancelled, Sir. {self.summary}".strip()
+        if self.state == TIMED_OUT:
+            return f"{title} timed out after {self.seconds:.0f} seconds, Sir. {self.summary}".strip()
+        return f"{title} failed, Sir: {self.result}"
+
+
+class JobScheduler:
+    def __init__(self, workers: int = WORKERS, inline_wait: float = INLINE_WAIT):
+        self.inline_wait = inline_wait
+        self._pool = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="job")
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._jobs: Dict[int, Job] = {}
+        self._callbacks: List[Callable[[Job], None]] = []
+
+    def on_finish(self, callback: Callable[[Job], None]):
+        """Call callback(job) when a job the submitting turn stopped waiting for finishes."""
+        self._callbacks.append(callback)
+
+    # ── Submitting ──
+
+    def start(self, title: str, fn: Callable, *args, timeout: Optional[float] = None, **kwargs) -> Job:
+        """Queue fn(*args, job=job, **kwargs) and return its Job without waiting."""
+        job = Job(title, timeout, next(self._ids))
+        with self._lock:
+            self._forget_old()
+            self._jobs[job.id] = job
+        self._pool.submit(self._run, job, fn, args, kwargs)
+        return job
+
+    def submit(self, title: str, fn: Callable, *args, timeout: Optional[float] = None, **kwargs) -> str:
+        """
+        Run fn as a job and answer for the current turn: its result if it
+        finishes within the inline wait, else "Started" (completion is
+        announced through on_finish).
+        """
+        job = self.start(title, fn, *args, timeout=timeout, **kwargs)
+        job.wait(self.inline_wait)
+        with self._lock:
+            if job.state not in FINISHED:
+                job.inline = False
+        if job.inline:
+            return job.result if job.state in (DONE, FAILED) else job.announcement()
+        print(f"[JOBS] {job.id} '{job.title}' continues in the background", flush=True)
+        return f"Started, Sir. {_sentence(job.title)} is job {job.id}; I'll tell you when it's done."
+
+    def _run(self, job: Job, fn: Callable, args, kwargs):
+        job.started = time.monotonic()
+        if job.cancelled:   # cancelled while queued
+            state = CANCELLED
+        else:
+            job.state = RUNNING
+            try:
+                job.result = fn(*args, job=job, **kwargs) or ""
+                state = DONE
+            except JobStopped as e:
+                state = str(e)
+            except Exception as e:
+                job.result = f"Error: {e}"
+                state = FAILED
+        job.finished = time.monotonic()
+        with self._lock:
+            job.state = state
+            announce = not job.inline
+        job._done.set()
+        print(f"[JOBS] {job.id} '{job.title}' {state} in {job.seconds:.1f}s", flush=True)
+        if announce:
+            for callback in self._callbacks:
+                try:
+                    callback(job)
+                except Exception as e:
+                    print(f"[JOBS] Announcement failed: {e}", flush=True)
+
+    def _forget_old(self, keep: int = 50):
+        finished = [j.id for j in self._jobs.values() if j.state in FINISHED]
+        for job_id in finished[:max(0, len(finished) - keep)]:
+            del self._jobs[job_id]
+
+    # ── Queries ──
+
+    def get(self, job_id: Optional[int] = None) -> Optional[Job]:
+        """A job by id, or the most recent unfinished one (else the most recent)."""
+        with self._lock:
+            if job_id is not None:
+                return self._jobs.get(job_id)
+            jobs = list(self._jobs.values())
+        active = [j for j in jobs if j.state not in FINISHED]
+        return (active or jobs or [None])[-1]
+
+    def active(self) -> List[Job]:
+        with self._lock:
+            return [j for j in self._jobs.values() if j.state not in FINISHED]
+
+    def cancel(self, job_id: Optional[int] = None) -> str:
+        job = self.get(job_id)
+        if job is None:
+            return "There is no such job, Sir." if job_id is not None else "No jobs are running, Sir."
+        if job.state in FINISHED:
+            return f"Job {job.id} has already {'finished' if job.state == DONE else job.state}."
+        job.cancel()
+        return f"Cancelling job {job.id}, {job.title}."
+
+    def status(self, job_id: Optional[int] = None) -> str:
+        if job_id is not None:
+            job = self.get(job_id)
+            return job.status() if job else "There is no such job, Sir."
+        active = self.active()
+        if not active:
+            return "No jobs are running, Sir."
+        return ". ".join(j.status() for j in active)
+
+
+scheduler = JobScheduler()
@@ -0,0 +1,259 @@
+"""
+Non-blocking process launcher with a registry of what it started.
+
+launch() spawns with Popen and returns at once (no shell waiting for the
+app), in a new process group / session so the whole tree can be closed
+later. close() looks the app up by name among the tracked processes and
+asks the tree to exit (SIGTERM to the group; taskkill /T without /F, i.e.
+WM_CLOSE, on Windows); anything still alive after the timeout is killed
+from a background timer, so the turn never waits for a slow app.
+
+Apps started by the shell (Windows `start`, .lnk shortcuts, URLs) hand
+off to another process and can't be tracked by PID; those are closed by
+image name instead, with the same graceful-then-forceful escalation.
+
+Nothing is run through a shell, and system programs (anything in an sbin
+directory, or named like shutdown, wipefs, format) are refused: the names
+come from speech.
+"""
+
+import os
+import platform
+import re
+import shlex
+import shutil
+import signal
+import subprocess
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from Backend.system.app_index import normalize
+
+WINDOWS = platform.system() == "Windows"
+CLOSE_TIMEOUT = float(os.getenv("REX_CLOSE_TIMEOUT", "3"))
+
+# Power, disk, process and privilege tools; also refused where they live outside sbin
+SYSTEM_PROGRAMS = re.compile(
+    r"(shutdown|poweroff|reboot|halt|init|telinit|systemctl|loginctl|rm|rmdir|del|dd|shred|"
+    r"mkfs(\..*)?|mkswap|wipefs|fdisk|sfdisk|cfdisk|gdisk|parted|delpart|partx|blkdiscard|format|"
+    r"diskpart|bcdedit|cipher|kill|killall|pkill|taskkill|sudo|su|doas|pkexec|runas)")
+
+
+@dataclass(eq=False)
+class Launched:
+    name: str                       # normalized spoken name it was launched as
+    argv: List[str]
+    process: subprocess.Popen
+    image: str = ""
+    started: float = field(default_factory=time.monotonic)
+
+    @property
+    def pid(self) -> int:
+        return self.process.pid
+
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+
+def _quiet(argv, timeout=5.0) -> int:
+    try:
+        return subprocess.run(argv, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=timeout).returncode
+    except (OSError, subprocess.TimeoutExpired):
+        return -1
+
+
+def _group_alive(pgid: int) -> bool:
+    """Anything left in the process group (zombies not yet reaped included)."""
+    try:
+        os.killpg(pgid, 0)
+        return True
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+
+
+def _live_in_group(pgid: int) -> bool:
+    """
+    Confirm through /proc that a non-zombie member is left. Zombies answer
+    killpg(pgid, 0) until their parent reaps them, so this is checked once,
+    before a forced kill, not while polling (it reads every /proc/*/stat).
+    """
+    if not os.path.isdir("/proc"):
+        return _group_alive(pgid)
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", "rb") as f:
+                fields = f.read().rsplit(b")", 1)[1].split()
+        except OSError:
+            continue
+        if int(fields[2]) == pgid and fields[0] != b"Z":
+            return True
+    return False
+
+
+def check_allowed(program: str):
+    """Raise PermissionError for a system program (see SYSTEM_PROGRAMS) or one in an sbin directory."""
+    path = shutil.which(program) or program
+    name = re.sub(r"\.(exe|com|bat|cmd)$", "", os.path.basename(path).lower())
+    parts = os.path.realpath(path).replace("\\", "/").lower().split("/")
+    if SYSTEM_PROGRAMS.fullmatch(name) or "sbin" in parts[:-1]:
+        raise PermissionError(f"{name} is a system program, not starting it by voice")
+
+
+def new_group() -> dict:
+    """Popen arguments that start the child in its own process group, for kill_tree()."""
+    if WINDOWS:
+        return {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    return {"start_new_session": True}
+
+
+def kill_tree(process: subprocess.Popen, timeout: float = CLOSE_TIMEOUT):
+    """Force-kill a process started with new_group() and everything it spawned."""
+    if WINDOWS:
+        _quiet(["taskkill", "/pid", str(process.pid), "/t", "/f"])
+    else:
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            process.kill()
+    try:
+        process.wait(timeout)
+    except subprocess.TimeoutExpired:
+        pass
+
+
+class Launcher:
+    def __init__(self, close_timeout: float = CLOSE_TIMEOUT):
+        self.close_timeout = close_timeout
+        self._lock = threading.Lock()
+        self._procs: Dict[int, Launched] = {}
+
+    # ── Launching ──
+
+    def launch(self, name: str, argv, image: str = "") -> Launched:
+        """Start argv (a list, never through a shell) without waiting; tracked under name."""
+        argv = list(argv)
+        check_allowed(argv[0])
+        # Own process group: close() reaches the children
+        process = subprocess.Popen(argv, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                                   stderr=subprocess.DEVNULL, **new_group())
+        launched = Launched(normalize(name), argv, process, image or os.path.basename(argv[0]))
+        with self._lock:
+            self._reap()
+            self._procs[process.pid] = launched
+        print(f"[LAUNCH] {name} started (pid {process.pid})", flush=True)
+        return launched
+
+    def launch_command(self, name: str, command: str, image: str = "") -> Launched:
+        """A .desktop Exec= command line, split into argv; FileNotFoundError if its program isn't installed."""
+        try:
+            argv = shlex.split(command, posix=not WINDOWS)
+        except ValueError:
+            argv = []
+        if not argv or not shutil.which(argv[0]):
+            raise FileNotFoundError(f"{argv[0] if argv else command} is not installed")
+        return self.launch(name, argv, image)
+
+    def hand_off(self, argv, target: str = ""):
+        """Shell hand-offs (Windows `start`, shortcuts): fire and forget, nothing to track."""
+        if target:
+            check_allowed(target)
+        subprocess.Popen(argv, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                         **new_group())
+
+    # ── Registry ──
+
+    def _reap(self):
+        for pid in [pid for pid, p in self._procs.items() if not p.alive()]:
+            del self._procs[pid]
+
+    def running(self, name: Optional[str] = None) -> List[Launched]:
+        """Tracked processes still alive, newest first (optionally only those launched as name)."""
+        key = normalize(name) if name else None
+        with self._lock:
+            self._reap()
+            procs = [p for p in self._procs.values() if key is None or p.name == key]
+        return sorted(procs, key=lambda p: -p.started)
+
+    # ── Closing ──
+
+    def close(self, name: str, image: str = "") -> Optional[str]:
+        """
+        Close everything launched as name (tracked PIDs), else by image name.
+        Returns None when there was nothing to close.
+        """
+        procs = self.running(name)
+        if procs:
+            for launched in procs:
+                self._terminate_tree(launched)
+            return f"{len(procs)} process{'es' if len(procs) > 1 else ''}"
+        if image:
+            return self._close_image(image)
+        return None
+
+    def _terminate_tree(self, launched: Launched):
+        pid = launched.pid
+        if WINDOWS:
+            _quiet(["taskkill", "/pid", str(pid), "/t"])
+        else:
+            try:
+                os.killpg(pid, signal.SIGTERM)
+            except (ProcessLookupError, PermissionError):
+                launched.process.terminate()
+
+        def gone():
+            if launched.alive():
+                return False
+            return WINDOWS or not _group_alive(pid)   # children left in the group?
+
+        def force():
+            if launched.alive() or WINDOWS or _live_in_group(pid):
+                self._kill_tree(launched)
+
+        self._escalate(gone, force)
+
+    def _kill_tree(self, launched: Launched):
+        print(f"[LAUNCH] {launched.name} (pid {launched.pid}) ignored close, killing", flush=True)
+        kill_tree(launched.process, self.close_timeout)
+
+    def _close_image(self, image: str) -> Optional[str]:
+        if WINDOWS:
+            if _quiet(["taskkill", "/im", image, "/t"]) == 128:   # no such process
+                return None
+            running = lambda: self._image_running(image)
+            force = lambda: _quiet(["taskkill", "/im", image, "/t", "/f"])
+        else:
+            if not shutil.which("pkill") or _quiet(["pkill", "-TERM", "-x", image]) == 1:
+                return None
+            running = lambda: _quiet(["pgrep", "-x", image]) == 0
+            force = lambda: _quiet(["pkill", "-KILL", "-x", image])
+        self._escalate(lambda: not running(), force, poll=0.2)
+        return image
+
+    @staticmethod
+    def _image_running(image: str) -> bool:
+        try:
+            out = subprocess.run(["tasklist", "/fi", f"imagename eq {image}", "/nh"],
+                                 capture_output=True, text=True, timeout=5).stdout
+            return image.lower() in out.lower()
+        except (OSError, subprocess.TimeoutExpired):
+            return False
+
+    def _escalate(self, gone, force, poll: float = 0.05):
+        """Wait in the background for gone() to turn true; force() if it hasn't by the timeout."""
+        def run():
+            deadline = time.monotonic() + self.close_timeout
+            while time.monotonic() < deadline:
+                if gone():
+                    return
+                time.sleep(poll)
+            force()
+        threading.Thread(target=run, name="close-escalate", daemon=True).start()
+
+
+launcher = Launcher()
@@ -1,28 +1,45 @@
 import os
 import re
 
-def search_with_regex(pattern, path=".", case_sensitive=False):
+from Backend.system.jobs import Job, JobStopped
+
+def search_with_regex(pattern, path=".", case_sensitive=False, job=None):
     """
     Search for a regex pattern in files within the given path.
+    Matches are streamed to the job's output as they are found.
     """
+    job = job or Job()
     results = []
+    scanned = 0
     flags = 0 if case_sensitive else re.IGNORECASE
+    try:
+        regex = re.compile(pattern, flags)
+    except re.error as e:
+        return f"Invalid search pattern {pattern}: {str(e)}"
     try:
         for root, dirs, files in os.walk(path):
             for file in files:
+                job.check()
                 file_path = os.path.join(root, file)
                 try:
                     with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
                         content = f.read()
-                        matches = re.findall(pattern, content, flags)
-                        if matches:
-                            results.append(f"Found in {file_path}: {matches}")
+                    matches = regex.findall(content)
+                    if matches:
+                        results.append(f"Found in {file_path}: {matches}")
+                        job.write(results[-1])
                 except Exception as e:
                     continue  # Skip files that can't be read
+                scanned += 1
+            job.progress(scanned, detail=f"{scanned} files searched, {len(results)} with matches")
+    except JobStopped:
+        job.summary = f"{len(results)} of the {scanned} files searched so far had matches."
+        raise
     except Exception as e:
         return f"Error during search: {str(e)}"
 
+    job.summary = f"Found matches in {len(results)} of {scanned} files." if results else "No matches found."
     if results:
         return "\n".join(results)
     else:
-        return "No matches found."
\ No newline at end of file
+        return "No matches found."
@@ -1,5 +1,10 @@
 import os
 import platform
+import subprocess
+import threading
+
+from Backend.system.jobs import Job, JobStopped
+from Backend.system.launcher import kill_tree, new_group
 
 def shutdown_system():
     """
@@ -27,15 +32,42 @@ def restart_system():
     except Exception as e:
         return f"Error restarting: {str(e)}"
 
-def execute_command(command):
+def _pump(stream, job):
+    for line in stream:
+        job.write(line)
+    stream.close()
+
+def execute_command(command, job=None):
     """
     Executes a system command.
+    Its output is captured line by line into the job; a cancelled or timed
+    out job kills the command and everything it started.
     """
+    job = job or Job()
     try:
-        result = os.system(command)
-        return f"Executed: {command} (exit code: {result})"
+        process = subprocess.Popen(
+            command, shell=True, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT, text=True, errors="replace", **new_group(),
+        )
     except Exception as e:
         return f"Error executing {command}: {str(e)}"
+    reader = threading.Thread(target=_pump, args=(process.stdout, job), name="job-output", daemon=True)
+    reader.start()
+    try:
+        while True:
+            job.check()
+            try:
+                result = process.wait(0.1)
+                break
+            except subprocess.TimeoutExpired:
+                continue
+    except JobStopped:
+        kill_tree(process)
+        raise
+    reader.join(1.0)
+    last = job.tail(1)
+    job.summary = f"Exit code {result}." + (f" It said: {last[0]}" if last and last[0].strip() else "")
+    return f"Executed: {command} (exit code: {result})"
 
 def open_settings():
     """
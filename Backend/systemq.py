@@ -35,16 +35,51 @@
 # - Search in browser
 # - Search in files with regex
 #
+# Background Jobs (delete folder, execute and file search run as jobs, see Backend/system/jobs.py):
+# - Job status / Job 2
+# - Cancel job / Stop job 2
+#
 # Note: These queries are detected using keywords like: open, close, modify, volume, shutdown,
 # restart, start, stop, launch, run, execute, file, folder, directory, window, application,
 # program, browser, settings, control, search
 
-from Backend.system import app_control, volume_control, file_control, system_control, window_control, search_control
+import re
+
+from Backend.skills import LazyModule
+
+# Imported on first use: volume_control pulls in pycaw/comtypes, window_control
+# pywin32 and app_control youtube_search, none of which most turns need
+app_control = LazyModule("Backend.system.app_control")
+volume_control = LazyModule("Backend.system.volume_control")
+file_control = LazyModule("Backend.system.file_control")
+system_control = LazyModule("Backend.system.system_control")
+window_control = LazyModule("Backend.system.window_control")
+search_control = LazyModule("Backend.system.search_control")
+jobs = LazyModule("Backend.system.jobs")
+
+# Explicit job commands only: "steve jobs" or "my job interview" are not
+JOB_LIST = re.compile(r'^(?:list |show )?(?:the )?(?:running |background )?jobs$')
+JOB_STATUS = re.compile(r'\bjob status\b|\bstatus of job (\d+)\b|^job (\d+)$')
+JOB_CANCEL = re.compile(r'\b(?:cancel|stop) job (\d+)\b|^(?:cancel|stop) (?:the )?job$')
+
+def _job_command(query_lower):
+    """("status" | "cancel", job id or None) for an explicit job command, else None."""
+    query_lower = query_lower.strip().rstrip(".?!")
+    if query_lower.startswith("search"):
+        return None
+    for action, pattern in (("cancel", JOB_CANCEL), ("status", JOB_STATUS), ("status", JOB_LIST)):
+        match = pattern.search(query_lower)
+        if match:
+            job_id = next((int(g) for g in match.groups() if g), None)
+            return action, job_id
+    return None
+
 def handle_system_query(query):
     """
     Dispatches system queries to appropriate handlers.
     """
     query_lower = query.lower()
+    job_command = _job_command(query_lower)
     result = ""
 
     # Application control
@@ -57,6 +92,15 @@ def handle_system_query(query):
     elif "play" in query_lower:
         query_part = query_lower.replace("play", "").strip()
         result = app_control.open_application(f"play {query_part}")
+
+    # Background jobs: "job status", "cancel job 2" (before "run", which "running jobs" contains)
+    elif job_command:
+        action, job_id = job_command
+        if action == "cancel":
+            result = jobs.scheduler.cancel(job_id)
+        else:
+            result = jobs.scheduler.status(job_id)
+
     elif "close" in query_lower and "application" in query_lower:
         app = query_lower.replace("close application", "").strip()
         result = app_control.close_application(app)
@@ -66,7 +110,6 @@ def handle_system_query(query):
 
     # Volume control
     elif "volume" in query_lower:
-        import re
         # Check for specific percentage in the query
         percent_match = re.search(r'(\d+)%?', query_lower)
         if percent_match:
@@ -96,7 +139,7 @@ def handle_system_query(query):
             result = file_control.delete_file(file_path)
         elif "folder" in query_lower:
             folder_path = query.replace("delete folder", "").strip()
-            result = file_control.delete_folder(folder_path)
+            result = jobs.scheduler.submit(f"deleting folder {folder_path}", file_control.delete_folder, folder_path)
 
     # System control
     elif "shutdown" in query_lower:
@@ -105,7 +148,9 @@ def handle_system_query(query):
         result = system_control.restart_system()
     elif "execute" in query_lower:
         command = query_lower.replace("execute", "").strip()
-        result = system_control.execute_command(command)
+        result = jobs.scheduler.submit(
+            f"running {command}", system_control.execute_command, command, timeout=jobs.JOB_TIMEOUT,
+        )
     elif "settings" in query_lower:
         result = system_control.open_settings()
 
@@ -136,7 +181,9 @@ def handle_system_query(query):
             # Regex search in files
             parts = query_lower.replace("search", "").replace("in files", "").strip()
             pattern = parts.strip()
-            result = search_control.search_with_regex(pattern)
+            result = jobs.scheduler.submit(
+                f"searching files for {pattern}", search_control.search_with_regex, pattern, timeout=jobs.JOB_TIMEOUT,
+            )
         else:
             # Default to web search
             search_term = query_lower.replace("search", "").strip()
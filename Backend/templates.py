@@ -0,0 +1,171 @@
+# Backend/templates.py
+import random
+import re
+import datetime
+from typing import Optional, Dict
+
+# ────────────────────────────────────────────────
+#  Rex personality templates for deterministic answers
+# ────────────────────────────────────────────────
+# Time and date readings don't need an LLM to be phrased — these templates
+# keep the Rex voice while answering in microseconds instead of a full
+# streamed Groq completion.
+
+TIME_TEMPLATES = {
+    "morning": [
+        "It's {time}, Sir. A fine hour to get things done.",
+        "{time} in the morning, Sir. Coffee is strongly advised.",
+        "The clock reads {time}, Sir. The day is still young.",
+    ],
+    "afternoon": [
+        "It's {time}, Sir.",
+        "{time} in the afternoon, Sir. Productivity levels remain... debatable.",
+        "The clock reads {time}, Sir. Lunch is, I trust, behind us.",
+    ],
+    "evening": [
+        "It's {time} in the evening, Sir. Still conquering the world at this hour?",
+        "{time}, Sir. The evening is yours.",
+        "The clock reads {time}, Sir. Perhaps time to wind down.",
+    ],
+    "night": [
+        "It's {time}, Sir. Rather late, if I may say so.",
+        "{time}, Sir. Even geniuses need sleep.",
+        "The clock reads {time}, Sir. The night shift continues, I see.",
+    ],
+}
+
+DATE_TEMPLATES = {
+    "today": [
+        "Today is {date}, Sir.",
+        "It's {date}, Sir. Do try to make it count.",
+        "{date}, Sir. Another day, another opportunity.",
+    ],
+    "tomorrow": [
+        "Tomorrow is {date}, Sir.",
+        "That would be {date}, Sir. Planning ahead, I see.",
+    ],
+}
+
+WEATHER_TEMPLATES = [
+    "It's {temp} in {location} right now, Sir.",
+    "Currently {temp} in {location}, Sir.",
+    "{location} is sitting at {temp} at the moment, Sir.",
+]
+
+# Phrases that mean the user wants more than a reading → let the LLM answer
+ELABORATION_KEYWORDS = [
+    'explain', 'elaborate', 'tell me more', 'in detail', 'detailed', 'describe',
+    'why', 'should i', 'suggest', 'recommend', 'advice', 'what do you think',
+    'how long', 'how many', 'until', 'plan', 'wear', 'joke', 'funny',
+]
+
+# Realtime skills match on bare substrings ('now' in "know", 'today' in "how
+# are you today"); a canned reading is only given for an explicit question
+EXPLICIT_QUESTIONS = {
+    "time": re.compile(
+        r"\bwhat(?:'s| is)? the time\b|\bwhat time\b|\btell me the time\b|\bcurrent time\b"
+    ),
+    "date": re.compile(
+        r"\bwhat(?:'s| is)? (?:the |today's |tomorrow's )?date\b|\bwhat day is (?:it|today|tomorrow)\b"
+        r"|\btoday's date\b|\bcurrent date\b"
+    ),
+    "weather": re.compile(
+        r"\bwhat(?:'s| is)? the (?:weather|temperature)\b|\bhow(?:'s| is)? the weather\b"
+        r"|\bcurrent (?:weather|temperature)\b|\bhow (?:hot|cold) is it\b"
+    ),
+}
+
+_TEMP_RE = re.compile(r'([+-]?\d+(?:\.\d+)?)\s*°\s*([CF])')
+
+
+class Rendered(str):
+    """A template answer: fixed wording, so its audio is worth caching (see assistant.speak_stream)."""
+
+
+def wants_elaboration(query: str) -> bool:
+    """True if the user asked for more than a plain reading."""
+    query_lower = query.lower()
+    return any(kw in query_lower for kw in ELABORATION_KEYWORDS)
+
+
+def asks_for(query: str, category: str) -> bool:
+    """True if the query is an explicit time/date/weather question for this category."""
+    pattern = EXPLICIT_QUESTIONS.get(category)
+    return bool(pattern and pattern.search(query.lower()))
+
+
+def _part_of_day(hour: int) -> str:
+    if 5 <= hour < 12:
+        return "morning"
+    if 12 <= hour < 17:
+        return "afternoon"
+    if 17 <= hour < 22:
+        return "evening"
+    return "night"
+
+
+def _spoken_time(value: str) -> str:
+    """'07:42 PM' → '7:42 PM' (TTS reads the leading zero otherwise)."""
+    return value.lstrip('0') or value
+
+
+def render_time(key_data: str, now: Optional[datetime.datetime] = None) -> str:
+    now = now or datetime.datetime.now()
+    options = TIME_TEMPLATES[_part_of_day(now.hour)]
+    return random.choice(options).format(time=_spoken_time(key_data))
+
+
+def render_date(key_data: str, display_str: str = "") -> str:
+    which = "tomorrow" if display_str.lower().startswith("tomorrow") else "today"
+    return random.choice(DATE_TEMPLATES[which]).format(date=key_data)
+
+
+def render_weather(key_data: str, display_str: str = "") -> Optional[str]:
+    """Only phrase weather locally when a temperature can be parsed out."""
+    match = _TEMP_RE.search(key_data or "")
+    if not match:
+        return None
+    value, unit = match.groups()
+    temp = f"{value.lstrip('+')} degrees {'Celsius' if unit == 'C' else 'Fahrenheit'}"
+
+    location = key_data.split(':', 1)[0].strip() if ':' in key_data else ""
+    if not location:
+        # display_str looks like "Today weather in Indore: ..."
+        head = display_str.split(':', 1)[0]
+        location = head.split(' in ', 1)[1].strip() if ' in ' in head else "your area"
+    return random.choice(WEATHER_TEMPLATES).format(temp=temp, location=location)
+
+
+def render(realtime_result: Dict) -> Optional[str]:
+    """
+    Render a realtime result with a local template.
+    Returns None for categories that still need the LLM (stock, news, ...).
+    """
+    if not realtime_result:
+        return None
+
+    category = realtime_result.get("category")
+    key_data = realtime_result.get("key_data")
+    display_str = realtime_result.get("display_str") or ""
+
+    if category == "time" and isinstance(key_data, str):
+        return render_time(key_data)
+    if category == "date" and isinstance(key_data, str):
+        return render_date(key_data, display_str)
+    if category == "weather" and isinstance(key_data, str):
+        return render_weather(key_data, display_str)
+    return None
+
+
+def answer(query: str, realtime_result: Dict) -> Optional[str]:
+    """
+    The template answer for query, or None when the LLM should phrase it:
+    the user asked for more than a reading, or the question isn't an
+    explicit one for the category that matched.
+    """
+    if not realtime_result or wants_elaboration(query):
+        return None
+    if not asks_for(query, realtime_result.get("category", "")):
+        return None
+    text = render(realtime_result)
+    return Rendered(text) if text else None
@@ -1,17 +1,34 @@
 import os
+import threading
 import time
 from dotenv import load_dotenv
 
 # Audio / TTS / STT
 import speech_recognition as sr
-import winsound
-import pyttsx3
-import soundfile as sf
-import sounddevice as sd
-from elevenlabs import ElevenLabs
+
+from audio import levels
+from audio.stream_player import StreamPlayer
+from audio.sources import AudioSource, MicrophoneSource
+from audio.sinks import AudioSink, DeviceSink
+from audio.capture import CaptureEngine
+from audio.sr_source import CaptureAudioSource
+from audio.vad import UtteranceSegmenter, VADConfig, listen_for_utterance
+from audio.stt import HedgedSTT, StreamingTranscriber, Transcript, create_backend
+from audio.wakeword import DTWWakeModel, VoskKeywordModel, WakeWordListener
+from audio.bargein import BargeInDetector
+from audio.tts_cache import TTSCache
+from audio.tts_worker import (
+    TTSWorker, ElevenLabsEngine, Pyttsx3Engine, DummyEngine, PRIORITY_NORMAL, PRIORITY_BACKGROUND,
+)
+from audio.speech_pipeline import split_sentences
 
 # Backend brain
-from Backend import brain
+from Backend import brain, templates
+from Backend.memory import memory
+from Backend.speculation import Speculator
+from Backend.system import jobs
+
+from warmup import WarmUp
 
 # Load env
 env_file = 'api.env'
@@ -21,17 +38,23 @@ load_dotenv(env_file)
 _set_idle_cb = lambda: None
 _set_listening_cb = lambda: None
 _set_speaking_cb = lambda: None
+_partial_cb = lambda text: None
+_timings_cb = lambda timings: None
 
 
-def register_gui_callbacks(idle_cb=None, listening_cb=None, speaking_cb=None):
+def register_gui_callbacks(idle_cb=None, listening_cb=None, speaking_cb=None, partial_cb=None, timings_cb=None):
     """Register GUI callbacks for state updates."""
-    global _set_idle_cb, _set_listening_cb, _set_speaking_cb
+    global _set_idle_cb, _set_listening_cb, _set_speaking_cb, _partial_cb, _timings_cb
     if idle_cb is not None:
         _set_idle_cb = idle_cb
     if listening_cb is not None:
         _set_listening_cb = listening_cb
     if speaking_cb is not None:
         _set_speaking_cb = speaking_cb
+    if partial_cb is not None:
+        _partial_cb = partial_cb
+    if timings_cb is not None:
+        _timings_cb = timings_cb
 
 
 def set_idle():
@@ -58,40 +81,333 @@ def set_speaking():
         pass
 
 
+def show_partial(text):
+    """Forward a partial transcript while the user is still speaking."""
+    print(f"[LISTEN] ... {text}", flush=True)
+    speculator = get_speculator()
+    if speculator is not None:
+        speculator.on_partial(text)
+    try:
+        _partial_cb(text)
+    except Exception:
+        pass
+
+
+def show_turn_timings():
+    """Forward the last turn's stage durations (ms) to the GUI."""
+    stages = [
+        ("endpoint -> transcript", "endpoint_at", "transcribed_at"),
+        ("transcript -> first audio", "transcribed_at", "first_audio_at"),
+        ("turn-around", "endpoint_at", "first_audio_at"),
+    ]
+    timings = {
+        label: (last_turn[b] - last_turn[a]) * 1000
+        for label, a, b in stages if a in last_turn and b in last_turn
+    }
+    if last_turn.get("warmup_wait"):
+        timings["waiting for warm-up"] = last_turn["warmup_wait"] * 1000
+    if not timings:
+        return
+    try:
+        _timings_cb(timings)
+    except Exception:
+        pass
+
+
+# Audio I/O: the microphone and sound card unless configure_audio() swaps them
+# (e.g. WAV files in and captured PCM out for headless runs)
+_audio_source = None
+_audio_sink = DeviceSink()
+
+
+def configure_audio(source: AudioSource = None, sink: AudioSink = None):
+    """Replace the input source and/or output sink; takes effect on next use."""
+    global _audio_source, _audio_sink, _capture_engine, _barge_in, _wake_listener, _stream_player
+    if source is not None:
+        if _barge_in is not None:
+            _barge_in.close()
+            _barge_in = None
+        if _wake_listener is not None:
+            _wake_listener.stop()
+            _wake_listener = None
+        if _capture_engine is not None:
+            _capture_engine.stop()
+            _capture_engine = None
+        _audio_source = source
+    if sink is not None:
+        _audio_sink = sink
+        if _stream_player is not None:
+            _stream_player.close()
+            _stream_player = None
+        if _tts_worker is not None:
+            _tts_worker.player = _get_stream_player()
+
+
 def play_listen_sound():
     """Play a beep sound."""
     try:
-        winsound.Beep(1300, 150)
+        _audio_sink.beep(1300, 150)
     except Exception:
         pass
 
 
-def listen():
-    """Listen for speech and return recognized text."""
-    print("[LISTEN] Starting listen cycle", flush=True)
+# Microphone: one persistent input stream for the whole session
+PERSISTENT_MIC = os.getenv("REX_PERSISTENT_MIC", "1") == "1"
+MIC_SAMPLE_RATE = 16000
+
+_capture_engine = None
+
+# Local VAD endpointing (needs the persistent mic); 0 falls back to Recognizer.listen
+USE_VAD = os.getenv("REX_VAD", "1") == "1"
+_segmenter = None
+
+# Speech-to-text backend: google (online), vosk (offline, streams partials),
+# or a comma list to hedge across several
+STT_BACKEND = os.getenv("REX_STT", "google")
+_stt_backend = None
+
+# Wake word: off (the GUI button starts listening), dtw (enrolled recordings) or vosk
+WAKE_MODE = os.getenv("REX_WAKE", "off").lower()
+WAKE_TEMPLATES = os.getenv("REX_WAKE_TEMPLATES", ".cache/wakeword/rex.npz")
+_wake_listener = None
+
+# Barge-in: keep listening while speaking and stop the answer when the user talks over it
+BARGE_IN = os.getenv("REX_BARGE_IN", "1") == "1"
+_barge_in = None
+_interrupt_pos = None     # ring position where the interrupting speech began
+# Speculative prefetch on partial transcripts (needs a streaming STT backend)
+SPECULATE = os.getenv("REX_SPECULATE", "1") == "1"
+_speculator = None
+_prefetched = (None, None)   # (final transcript, brainQ prefetched data)
+
+# Timings of the current turn (perf_counter seconds): endpoint_at, transcribed_at,
+# first_audio_at, plus speech_end_pos (capture ring position) with the VAD
+last_turn = {}
+
+
+def get_capture_engine() -> CaptureEngine:
+    """Open the microphone once and keep capturing in the background."""
+    global _capture_engine
+    if _capture_engine is None:
+        _capture_engine = CaptureEngine(
+            _audio_source or MicrophoneSource(samplerate=MIC_SAMPLE_RATE), levels=levels.ring("capture")
+        )
+    if not _capture_engine.running:
+        _capture_engine.start()
+    return _capture_engine
+
+
+def _configure_recognizer() -> sr.Recognizer:
     r = sr.Recognizer()
 
     r.energy_threshold = 300
     r.dynamic_energy_threshold = True
     r.dynamic_energy_adjustment_damping = 0.15
     r.dynamic_energy_ratio = 1.5
+    return r
+
+
+def _open_source(r: sr.Recognizer):
+    """Source for this turn: the shared capture ring, or a fresh sr.Microphone."""
+    if PERSISTENT_MIC:
+        engine = get_capture_engine()
+        engine.wait_ready(timeout=1.0)
+        # Noise floor is tracked continuously — no per-turn calibration
+        r.energy_threshold = engine.energy_threshold(ratio=r.dynamic_energy_ratio)
+        r.dynamic_energy_threshold = False
+        print(f"[LISTEN] Energy threshold: {r.energy_threshold:.1f} (tracked)", flush=True)
+        return CaptureAudioSource(engine)
+    return sr.Microphone()
+
+
+def _get_segmenter() -> UtteranceSegmenter:
+    global _segmenter
+    if _segmenter is None:
+        _segmenter = UtteranceSegmenter(MIC_SAMPLE_RATE, VADConfig(
+            hangover_ms=int(os.getenv("REX_VAD_HANGOVER_MS", "350")),
+            preroll_ms=300,
+        ))
+    return _segmenter
+
+
+def get_stt_backend():
+    global _stt_backend
+    if _stt_backend is None:
+        if "," in STT_BACKEND:
+            # e.g. REX_STT=google,vosk: hedge the first backend with the others
+            _stt_backend = create_backend(
+                STT_BACKEND,
+                hedge_delay=int(os.getenv("REX_STT_HEDGE_MS", "300")) / 1000.0,
+                min_confidence=float(os.getenv("REX_STT_MIN_CONFIDENCE", "0.6")),
+            )
+        else:
+            _stt_backend = create_backend(STT_BACKEND)
+    return _stt_backend
+
+
+def _transcribe_turn(r: sr.Recognizer, source, from_pos=None) -> Transcript:
+    """
+    Endpoint the next utterance (local VAD, or Recognizer.listen) and
+    transcribe it. Streaming backends decode while the user is speaking, so
+    only the tail of the utterance is left when the endpoint fires.
+    from_pos starts from audio already captured (after a barge-in).
+    """
+    backend = get_stt_backend()
+    backend.warm_up()
+
+    if not (PERSISTENT_MIC and USE_VAD):
+        audio = r.listen(source, timeout=5, phrase_time_limit=8)
+        last_turn["endpoint_at"] = time.perf_counter()
+        print("[LISTEN] Audio captured, processing...", flush=True)
+        pcm = audio.get_raw_data(convert_rate=MIC_SAMPLE_RATE, convert_width=2)
+        return backend.transcribe(pcm, MIC_SAMPLE_RATE)
+
+    transcriber = []
+
+    def on_speech_audio(samples):
+        if not transcriber:
+            transcriber.append(StreamingTranscriber(backend, MIC_SAMPLE_RATE, on_partial=show_partial))
+        transcriber[0].feed(samples.tobytes())
+
+    segment = listen_for_utterance(
+        get_capture_engine(), _get_segmenter(), start_timeout=5.0,
+        on_speech_audio=on_speech_audio if backend.streaming else None,
+        from_pos=from_pos,
+    )
+    if segment is None:
+        if transcriber:
+            transcriber[0].close()
+        raise sr.WaitTimeoutError("listening timed out while waiting for phrase to start")
+    last_turn["endpoint_at"] = time.perf_counter()
+    last_turn["speech_end_pos"] = segment.speech_end_pos
+    print(
+        f"[LISTEN] VAD segment {segment.duration:.2f}s, "
+        f"endpoint after {segment.endpoint_delay * 1000:.0f} ms of silence",
+        flush=True,
+    )
+    if transcriber:
+        return transcriber[0].finish()
+    return backend.transcribe(segment.to_bytes(), segment.samplerate)
+
+
+def get_speculator():
+    global _speculator
+    if _speculator is None and SPECULATE:
+        _speculator = Speculator(warm_llm=brain.warm_llm, on_answer=_presynthesize_answer)
+    return _speculator
+
+
+def _presynthesize_answer(text: str):
+    """Render a speculative answer into the TTS cache so speaking it is a cache hit."""
+    if get_elevenlabs_client() is not None:
+        tts_cache.presynthesize([text], _synthesize_pcm, VOICE_ID, MODEL_ID, PCM_FORMAT)
+
+
+def _load_wake_model():
+    if WAKE_MODE == "vosk":
+        return VoskKeywordModel(keyword=os.getenv("REX_WAKE_WORD", "rex"), samplerate=MIC_SAMPLE_RATE)
+    threshold = os.getenv("REX_WAKE_THRESHOLD")
+    return DTWWakeModel.load(WAKE_TEMPLATES, float(threshold) if threshold else None)
+
+
+def get_wake_listener():
+    """Wake-word detector on the persistent mic, or None when disabled."""
+    global _wake_listener, WAKE_MODE
+    if _wake_listener is None and WAKE_MODE != "off" and PERSISTENT_MIC:
+        try:
+            _wake_listener = WakeWordListener(get_capture_engine(), _load_wake_model())
+            _wake_listener.pause()
+            _wake_listener.start()
+            print(f"[WAKE] Wake word enabled ({_wake_listener.model.name})", flush=True)
+        except Exception as e:
+            print(f"[WAKE] Wake word disabled: {e}", flush=True)
+            WAKE_MODE = "off"
+            _wake_listener = None
+    return _wake_listener
+
+
+def wait_for_wake_word(should_continue=lambda: True) -> bool:
+    """
+    Block until "Rex" is heard. Returns True straight away when the wake word
+    is off, and False if should_continue() turns false while waiting.
+    """
+    _await_warm("wake")
+    listener = get_wake_listener()
+    if listener is None or _interrupt_pos is not None:
+        return True
+    listener.resume()
+    print("[WAKE] Waiting for wake word...", flush=True)
+    try:
+        while should_continue():
+            if listener.wait(0.25):
+                play_listen_sound()
+                return True
+        return False
+    finally:
+        listener.pause()
+
+
+def enroll_wake_word(count: int = 3, path: str = WAKE_TEMPLATES) -> bool:
+    """Record `count` samples of the wake word and save DTW templates."""
+    engine = get_capture_engine()
+    engine.wait_ready(timeout=2.0)
+    segmenter = UtteranceSegmenter(MIC_SAMPLE_RATE, VADConfig(hangover_ms=300, max_utterance_s=2.0))
+    recordings = []
+    attempts = 0
+    while len(recordings) < count and attempts < count * 3:
+        attempts += 1
+        print(f"[WAKE] Say 'Rex' ({len(recordings) + 1}/{count})...", flush=True)
+        segment = listen_for_utterance(engine, segmenter, start_timeout=10.0)
+        if segment is None:
+            print("[WAKE] Nothing heard, try again", flush=True)
+            continue
+        recordings.append(segment.samples)
+    try:
+        model = DTWWakeModel.enroll(recordings, MIC_SAMPLE_RATE)
+        model.save(path)
+    except Exception as e:
+        print(f"[WAKE] Enrolment failed: {e}", flush=True)
+        return False
+    print(f"[WAKE] Saved {len(model.templates)} templates to {path} "
+          f"(threshold {model.threshold:.2f})", flush=True)
+    return True
+
+
+def listen():
+    """Listen for speech and return recognized text."""
+    global _interrupt_pos, _prefetched
+    print("[LISTEN] Starting listen cycle", flush=True)
+    r = _configure_recognizer()
+    from_pos, _interrupt_pos = _interrupt_pos, None
+    last_turn.clear()
+    _await_warm("mic", "stt")
 
     text = ''
 
     try:
-        with sr.Microphone() as source:
-            print("[LISTEN] Microphone opened, adjusting for ambient noise...", flush=True)
-            r.adjust_for_ambient_noise(source, duration=1.5)
-            print(f"[LISTEN] Energy threshold: {r.energy_threshold:.1f}", flush=True)
+        with _open_source(r) as source:
+            if not PERSISTENT_MIC:
+                print("[LISTEN] Microphone opened, adjusting for ambient noise...", flush=True)
+                r.adjust_for_ambient_noise(source, duration=1.5)
+                print(f"[LISTEN] Energy threshold: {r.energy_threshold:.1f}", flush=True)
 
             set_listening()
             print("[LISTEN] Listening now... Speak clearly", flush=True)
 
             try:
-                audio = r.listen(source, timeout=5, phrase_time_limit=8)
-                print("[LISTEN] Audio captured, processing...", flush=True)
-                text = r.recognize_google(audio, language="en-IN")
-                print(f"[LISTEN] You said: {text}", flush=True)
+                transcript = _transcribe_turn(r, source, from_pos)
+                text = transcript.text
+                last_turn["transcribed_at"] = time.perf_counter()
+                if get_speculator() is not None:
+                    _prefetched = (text.strip(), _speculator.resolve(text))
+                    print(f"[SPECULATE] {_speculator.report()}", flush=True)
+                print(
+                    f"[LISTEN] You said: {text} ({transcript.backend}, "
+                    f"{transcript.latency * 1000:.0f} ms, conf {transcript.confidence:.2f})",
+                    flush=True,
+                )
+                if isinstance(get_stt_backend(), HedgedSTT):
+                    print(f"[STT] Hedging so far: {get_stt_backend().report()}", flush=True)
 
             except sr.WaitTimeoutError:
                 print("[LISTEN] No speech detected within timeout.", flush=True)
@@ -99,11 +415,11 @@ def listen():
 
             except sr.UnknownValueError:
                 play_listen_sound()
-                print("[LISTEN] Google could not understand the audio", flush=True)
+                print("[LISTEN] Could not understand the audio", flush=True)
                 text = ""
 
             except sr.RequestError as e:
-                print(f"[LISTEN] Google service error: {e}", flush=True)
+                print(f"[LISTEN] Speech recognition error: {e}", flush=True)
                 text = ""
     except Exception as e:
         print(f"[LISTEN] Microphone error: {e}", flush=True)
@@ -116,81 +432,305 @@ def listen():
     return text.strip()
 
 
-# ElevenLabs client
+# ElevenLabs client, created on first use: the SDK takes ~150 ms to import
+# and isn't needed at all with REX_TTS_ENGINE=pyttsx3/dummy
 api_key = os.getenv("ELEVENLABS_API_KEY")
-client = None
-if api_key:
-    try:
-        client = ElevenLabs(api_key=api_key)
-    except Exception:
-        client = None
+_client = None
+_client_failed = False
+_client_lock = threading.Lock()
+
+
+def get_elevenlabs_client():
+    global _client, _client_failed
+    with _client_lock:
+        if _client is None and not _client_failed:
+            if not api_key or TTS_ENGINE not in ("auto", "elevenlabs"):
+                _client_failed = True
+                return None
+            try:
+                from elevenlabs import ElevenLabs
+                _client = ElevenLabs(api_key=api_key)
+            except Exception as e:
+                print(f"[TTS] ElevenLabs unavailable: {e}", flush=True)
+                _client_failed = True
+        return _client
+
+VOICE_ID = "TX3LPaxmHKxFdv7VOQHJ"
+MODEL_ID = "eleven_multilingual_v2"
+
+# Streaming mode plays raw PCM chunks as ElevenLabs produces them;
+# REX_STREAMING_TTS=0 renders each utterance fully before playing it
+STREAMING_TTS = os.getenv("REX_STREAMING_TTS", "1") == "1"
+PCM_SAMPLE_RATE = 22050
 
+_stream_player = None
 
-def speak(text: str):
-    """Speak text using ElevenLabs or pyttsx3."""
-    global client
+# Repeated phrases are replayed from an on-disk LRU cache
+PCM_FORMAT = f"pcm_{PCM_SAMPLE_RATE}"
+tts_cache = TTSCache(
+    os.getenv("REX_TTS_CACHE_DIR", ".cache/tts"),
+    max_bytes=int(os.getenv("REX_TTS_CACHE_MB", "100")) * 1024 * 1024,
+)
+
+# Known phrases synthesized ahead of time (see warm_tts_cache)
+PRESYNTH_PHRASES = [
+    "Good bye, sir",
+    "Sorry, I couldn't process that.",
+    "Sorry Sir, I didn't catch that. Could you repeat?",
+    "Apologies, Sir. A momentary lapse in the matrix. Could you repeat that?",
+    "I'm afraid I don't have an answer for that right now, Sir.",
+    "Closed current tab",
+    "Closed current window",
+    "Volume set to 50%",
+]
+
+
+_FIXED_PHRASES = {p.strip() for p in PRESYNTH_PHRASES}
+
+
+def _cacheable(text: str) -> bool:
+    """Only fixed phrases (and template answers, see speak_stream) go into the TTS cache."""
+    return text.strip() in _FIXED_PHRASES
+
+
+def _get_stream_player() -> StreamPlayer:
+    """Lazily open the session-wide output stream."""
+    global _stream_player
+    if _stream_player is None:
+        _stream_player = StreamPlayer(
+            samplerate=PCM_SAMPLE_RATE, jitter_ms=80, stream_factory=_audio_sink.open_stream,
+            levels=levels.ring("playback"),
+        )
+    return _stream_player
+
+
+# TTS engines: auto | elevenlabs | pyttsx3 | dummy (dummy = silent tone, for headless testing)
+TTS_ENGINE = os.getenv("REX_TTS_ENGINE", "auto").lower()
+
+_tts_worker = None
+
+
+def _build_tts_engines() -> list:
+    """Engines in fallback order, each created once for the whole session."""
+    if TTS_ENGINE == "dummy":
+        return [DummyEngine(samplerate=PCM_SAMPLE_RATE)]
+    engines = []
+    client = get_elevenlabs_client()
+    if client is not None:
+        engines.append(ElevenLabsEngine(client, VOICE_ID, MODEL_ID, PCM_FORMAT, cache=tts_cache))
+    if TTS_ENGINE in ("auto", "pyttsx3"):
+        engines.append(Pyttsx3Engine(driver="sapi5", voice_hint="zira", rate=165))
+    return engines
+
+
+def get_tts_worker() -> TTSWorker:
+    """Start the long-lived TTS worker on first use."""
+    global _tts_worker
+    if _tts_worker is None:
+        _tts_worker = TTSWorker(
+            _build_tts_engines(),
+            _get_stream_player(),
+            on_play_start=lambda utt: set_speaking(),
+        )
+        _tts_worker.start()
+    return _tts_worker
+
+
+# Assumed playback RMS while a direct engine (pyttsx3) speaks outside the player
+DIRECT_ECHO_LEVEL = 3000.0
+
+
+def _playback_level() -> float:
+    if _tts_worker is not None and _tts_worker.playing_direct():
+        return DIRECT_ECHO_LEVEL
+    return _get_stream_player().level
+
+
+def get_barge_in():
+    """Echo-aware speech detector on the persistent mic, or None when disabled."""
+    global _barge_in, BARGE_IN
+    if _barge_in is None and BARGE_IN and PERSISTENT_MIC:
+        try:
+            _barge_in = BargeInDetector(get_capture_engine(), _playback_level)
+        except Exception as e:
+            print(f"[BARGE] Barge-in disabled: {e}", flush=True)
+            BARGE_IN = False
+    return _barge_in
+
+
+def _synthesize_pcm(text: str) -> bytes:
+    """Render text to raw PCM via ElevenLabs (no cache)."""
+    audio_stream = get_elevenlabs_client().text_to_speech.convert(
+        text=text,
+        voice_id=VOICE_ID,
+        model_id=MODEL_ID,
+        output_format=PCM_FORMAT,
+    )
+    return b"".join(chunk for chunk in audio_stream)
+
+
+def warm_tts_cache():
+    """Pre-synthesize PRESYNTH_PHRASES in the background (REX_TTS_PRESYNTH=0 disables)."""
+    if os.getenv("REX_TTS_PRESYNTH", "1") != "1" or get_elevenlabs_client() is None:
+        return None
+    return tts_cache.presynthesize(PRESYNTH_PHRASES, _synthesize_pcm, VOICE_ID, MODEL_ID, PCM_FORMAT)
+
+
+def _warm_elevenlabs():
+    """Create the client and open its HTTPS connection so the first answer skips DNS + TLS."""
+    client = get_elevenlabs_client()
+    if client is not None:
+        client.models.list()
+
+
+def _refresh_app_index():
+    """Load the saved application index and rescan changed Start Menu / PATH folders."""
+    from Backend.system.app_index import index
+    index.refresh()
+
+
+# Startup warm-up (see warmup.py): everything a first turn would otherwise
+# initialize serially runs in parallel while the GUI comes up
+_warmup = None
+
+
+def start_warmup() -> WarmUp:
+    """Start warming up mic, STT, LLM/TTS connections, voices and history (idempotent)."""
+    global _warmup
+    if _warmup is None:
+        warm = WarmUp()
+        warm.add("history", memory.load)
+        warm.add("llm", brain.warm_llm)
+        if PERSISTENT_MIC:
+            warm.add("mic", lambda: get_capture_engine().wait_ready(timeout=2.0))
+        warm.add("stt", lambda: get_stt_backend().warm_up())
+        warm.add("tts", lambda: get_tts_worker().warm_up().wait(10.0))
+        warm.add("elevenlabs", _warm_elevenlabs)
+        warm.add("presynth", warm_tts_cache, after=("elevenlabs",))
+        warm.add("apps", _refresh_app_index)
+        if WAKE_MODE != "off":
+            warm.add("wake", get_wake_listener, after=("mic",))
+        _warmup = warm.start()
+    return _warmup
+
+
+def _await_warm(*subsystems):
+    """Wait for the warm-up of just these subsystems (no-op if it wasn't started)."""
+    if _warmup is None:
+        return
+    start = time.perf_counter()
+    _warmup.wait(*subsystems)
+    last_turn["warmup_wait"] = last_turn.get("warmup_wait", 0.0) + time.perf_counter() - start
+
+
+def speak(text: str, priority: int = PRIORITY_NORMAL):
+    """Speak text through the TTS worker (ElevenLabs, falling back to pyttsx3)."""
     print(f"[SPEAK] Starting to speak: {text[:50]}...", flush=True)
-    
     try:
-        if client is not None:
-            print("[SPEAK] Using ElevenLabs", flush=True)
-            try:
-                audio_stream = client.text_to_speech.convert(
-                    text=text,
-                    voice_id="TX3LPaxmHKxFdv7VOQHJ",
-                    model_id="eleven_multilingual_v2",
-                )
-                audio_bytes = b"".join(chunk for chunk in audio_stream)
-                print(f"[SPEAK] Got {len(audio_bytes)} bytes from ElevenLabs", flush=True)
-
-                set_speaking()
-                with open("output.wav", "wb") as f:
-                    f.write(audio_bytes)
-                print("[SPEAK] Wrote WAV file", flush=True)
-
-                data, samplerate = sf.read("output.wav")
-                print(f"[SPEAK] Read WAV: {len(data)} samples at {samplerate} Hz", flush=True)
-                
-                sd.play(data, samplerate)
-                print("[SPEAK] Audio playing... waiting for completion", flush=True)
-                
-                sd.wait()
-                print("[SPEAK] Audio complete", flush=True)
-                time.sleep(1.0)  # Extra buffer
-                sd.stop()
-                print("[SPEAK] Playback stopped", flush=True)
-                
-            except Exception as e:
-                print(f"[SPEAK] ElevenLabs error: {e}", flush=True)
-                raise
+        _await_warm("tts")
+        utt = get_tts_worker().say(text, priority=priority, stream=STREAMING_TTS, cacheable=_cacheable(text))
+        utt.wait()
+        if utt.error is not None and not utt.engine:
+            print(f"[SPEAK] Failed: {utt.error}", flush=True)
+    except Exception as e:
+        print(f"[SPEAK] Error: {e}", flush=True)
+    finally:
+        print(f"[SPEAK] Setting idle state (TTS cache {tts_cache.report()})\n", flush=True)
+        set_idle()
 
-        else:
-            raise RuntimeError("No ElevenLabs client configured")
 
+def _announce_job(job):
+    """Say that a background job finished; queued behind any answer in progress, never waited for."""
+    text = job.announcement()
+    print(f"[JOBS] Announcing: {text}", flush=True)
+    try:
+        get_tts_worker().say(text, priority=PRIORITY_BACKGROUND, stream=STREAMING_TTS)
     except Exception as e:
-        print(f"[SPEAK] Trying pyttsx3 fallback: {e}", flush=True)
-        try:
-            set_speaking()
-            engine = pyttsx3.init("sapi5")
-            engine.setProperty("rate", 165)
-            engine.setProperty("volume", 1.0)
-            for v in engine.getProperty("voices"):
-                if "zira" in v.name.lower():
-                    engine.setProperty("voice", v.id)
-                    break
-            
-            print("[SPEAK] pyttsx3 speaking...", flush=True)
-            engine.say(text)
-            engine.runAndWait()
-            print("[SPEAK] pyttsx3 complete, sleeping 1 second", flush=True)
-            time.sleep(1.0)
-
-        except Exception as e2:
-            print(f"[SPEAK] pyttsx3 failed: {e2}", flush=True)
-
+        print(f"[JOBS] Announcement error: {e}", flush=True)
+
+
+jobs.scheduler.on_finish(_announce_job)
+
+
+def speak_stream(pieces, interruptible: bool = True) -> str:
+    """
+    Speak a stream of text pieces (e.g. LLM tokens) sentence by sentence:
+    each sentence is queued on the TTS worker as soon as it is complete, so
+    it is synthesized while the previous one plays and the LLM keeps going.
+    If the user starts talking over the answer, playback stops, queued
+    sentences are dropped and the text stream is closed; the next listen()
+    picks up the interrupting speech. Returns the text that was spoken.
+    """
+    print("[SPEAK] Starting pipelined speech", flush=True)
+    _await_warm("tts")
+    worker = get_tts_worker()
+    start = time.perf_counter()
+    utterances = []
+    interrupted = threading.Event()
+
+    def on_barge_in(pos):
+        global _interrupt_pos
+        _interrupt_pos = pos
+        interrupted.set()
+        worker.cancel_all()
+        set_listening()
+
+    # Template answers arrive whole as templates.Rendered; any LLM token turns this off
+    fixed = [True]
+
+    def tracked(pieces):
+        for piece in pieces:
+            fixed[0] = fixed[0] and (isinstance(piece, templates.Rendered) or not piece)
+            yield piece
+
+    detector = get_barge_in() if interruptible else None
+    if detector is not None:
+        detector.arm(on_barge_in)
+    try:
+        for segment in split_sentences(tracked(pieces)):
+            if interrupted.is_set():
+                break
+            utt = worker.say(segment, cacheable=fixed[0] or _cacheable(segment))
+            utterances.append(utt)
+            if interrupted.is_set():
+                worker.cancel(utt)
+        if interrupted.is_set() and hasattr(pieces, "close"):
+            pieces.close()  # stops the LLM stream
+        for utt in utterances:
+            utt.wait()
+
+        first = min((u.timings["first_audio"] for u in utterances if "first_audio" in u.timings), default=None)
+        endpoint = last_turn.get("endpoint_at")
+        if first:
+            last_turn["first_audio_at"] = first
+        turn = f", turn-around {(first - endpoint) * 1000:.0f} ms" if first and endpoint else ""
+        print(
+            f"[SPEAK] {len(utterances)} segments, first audio after "
+            f"{(first - start) if first else 0:.3f}s, total {time.perf_counter() - start:.3f}s{turn}, "
+            f"TTS cache {tts_cache.report()}",
+            flush=True,
+        )
+        if first:
+            show_turn_timings()
+        if interrupted.is_set():
+            print("[SPEAK] Interrupted by the user", flush=True)
+        return " ".join(u.text for u in utterances if not u.cancelled)
+    except Exception as e:
+        print(f"[SPEAK] Pipeline error: {e}", flush=True)
+        for utt in utterances:
+            worker.cancel(utt)
+        return ""
     finally:
-        print("[SPEAK] Setting idle state\n", flush=True)
-        set_idle()
+        if detector is not None:
+            detector.disarm()
+        if not interrupted.is_set():
+            print("[SPEAK] Setting idle state\n", flush=True)
+            set_idle()
+
+
+def was_interrupted() -> bool:
+    """True if the last answer was cut off and the user's speech is waiting to be heard."""
+    return _interrupt_pos is not None
 
 
 def process_query(query: str) -> str:
@@ -200,3 +740,67 @@ def process_query(query: str) -> str:
     except Exception as e:
         print("Error in brain processing:", e)
         return "Sorry, I couldn't process that."
+
+
+
+def process_query_stream(query: str):
+    """Yield the brain's answer in pieces as it is generated."""
+    global _prefetched
+    prefetch_query, prefetched = _prefetched
+    _prefetched = (None, None)
+    if prefetch_query != query:
+        prefetched = None
+    try:
+        yield from brain.brainQ_stream(query, prefetched=prefetched)
+    except Exception as e:
+        print("Error in brain processing:", e)
+        yield "Sorry, I couldn't process that."
+
+
+def conversation_loop(should_continue=lambda: True):
+    """Listen -> process -> speak until should_continue() is False or the user says goodbye."""
+    while should_continue():
+        try:
+            # WAKE (returns immediately unless REX_WAKE is set)
+            if not wait_for_wake_word(should_continue):
+                break
+
+            # LISTEN
+            print("[WORKER] Calling listen()...", flush=True)
+            query = listen()
+
+            if not should_continue():
+                break
+
+            if not query:
+                print("[WORKER] No query, continuing...", flush=True)
+                continue
+
+            print(f"[WORKER] Got query: {query}", flush=True)
+
+            # Check exit commands
+            if query.lower().strip() in ["exit", "bye", "goodbye"]:
+                print("[WORKER] Exit command detected", flush=True)
+                try:
+                    speak("Good bye, sir")
+                except Exception as e:
+                    print(f"[WORKER] Error in goodbye: {e}", flush=True)
+                break
+
+            # PROCESS + SPEAK (pipelined: speech starts after the first sentence)
+            if should_continue():
+                print("[WORKER] Processing query (streamed)...", flush=True)
+                try:
+                    answer = speak_stream(process_query_stream(query))
+                    print(f"[WORKER] Spoke answer: {answer[:50]}...", flush=True)
+                    # Playback has drained and barge-in audio is kept in the
+                    # capture ring, so the next turn can start right away
+                    if was_interrupted():
+                        print("[WORKER] Interrupted, listening to the user...", flush=True)
+                except Exception as e:
+                    print(f"[WORKER] Speak error: {e}", flush=True)
+
+        except Exception as e:
+            print(f"[WORKER] Loop error: {e}", flush=True)
+            if should_continue():
+                time.sleep(0.5)
@@ -0,0 +1,105 @@
+"""
+Barge-in: notice the user talking over the assistant.
+
+Runs on the capture thread while an answer is playing. The speech threshold
+is raised by an estimate of how much of the playback leaks back into the
+microphone (playback level × a tracked echo coupling), so the assistant's
+own voice doesn't interrupt it but the user's does.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from typing import Callable, Optional
+
+import numpy as np
+
+from audio.capture import NoiseFloorTracker, frame_rms
+from audio.vad import VADConfig, VoiceActivityDetector
+
+
+class BargeInDetector:
+    """
+    arm(on_barge_in) while speaking, disarm() afterwards. on_barge_in(pos)
+    gets the ring position where the interrupting speech began (pre-roll
+    included) and fires at most once per arm().
+    """
+
+    def __init__(
+        self,
+        engine,
+        level_fn: Callable[[], float],
+        config: Optional[VADConfig] = None,
+        start_ms: int = 200,
+        window_ms: int = 400,
+        echo_decay: float = 0.8,
+    ):
+        self.engine = engine
+        self.level_fn = level_fn
+        self.config = config or VADConfig(energy_ratio=3.0, min_energy=300.0)
+        self.vad = VoiceActivityDetector(engine.samplerate, self.config)
+        # start_ms of speech within window_ms, so gaps between syllables don't reset it
+        self.start_frames = max(1, start_ms // self.config.frame_ms)
+        self._recent: deque = deque(maxlen=max(self.start_frames, window_ms // self.config.frame_ms))
+        self.preroll = int(self.config.preroll_ms * engine.samplerate / 1000)
+        self.echo_decay = echo_decay
+        # mic RMS per unit of playback RMS; rises fast, falls slowly
+        self.coupling = NoiseFloorTracker(initial=0.5, fall=0.02, rise=0.2, minimum=0.05)
+        self._echo = 0.0
+        self._callback: Optional[Callable[[int], None]] = None
+        self._lock = threading.Lock()
+        self.fired_at: Optional[int] = None
+        engine.add_listener(self._on_frame)
+
+    def arm(self, on_barge_in: Callable[[int], None]):
+        with self._lock:
+            self._callback = on_barge_in
+            self._recent.clear()
+            self.fired_at = None
+
+    def disarm(self):
+        with self._lock:
+            self._callback = None
+
+    def close(self):
+        self.disarm()
+        self.engine.remove_listener(self._on_frame)
+
+    def echo_floor(self) -> float:
+        """Expected echo RMS at the microphone right now."""
+        return self._echo * self.coupling.floor
+
+    def _on_frame(self, frame: np.ndarray, end_pos: int):
+        level = self.level_fn()
+        # Echo lags playback by the device latency, so let the estimate decay rather than drop
+        self._echo = max(level, self._echo * self.echo_decay)
+        with self._lock:
+            callback = self._callback
+        if callback is None:
+            return
+
+        rms = frame_rms(frame)
+        floor = self.engine.noise.floor + self.echo_floor()
+        speech = self.vad.is_speech(frame, floor, rms)
+        self._recent.append(speech)
+        if not any(self._recent):
+            # Only learn the echo coupling while the user is clearly silent
+            if level > 0:
+                self.coupling.update(rms / level)
+            return
+        if sum(self._recent) < self.start_frames:
+            return
+
+        first = next(i for i, hit in enumerate(self._recent) if hit)
+        start = max(0, end_pos - (len(self._recent) - first) * len(frame) - self.preroll)
+        with self._lock:
+            if self._callback is None:
+                return
+            self._callback = None
+        self.fired_at = start
+        print(f"[BARGE] User speech over playback (echo floor {self.echo_floor():.0f})", flush=True)
+        try:
+            callback(start)
+        except Exception as e:
+            print(f"[BARGE] Callback error: {e}", flush=True)
@@ -0,0 +1,204 @@
+"""
+Persistent microphone capture.
+
+One input stream stays open for the whole session. A capture thread writes
+fixed-size frames into a ring buffer and keeps a running estimate of the
+background noise floor, so a listen turn can start immediately instead of
+spending 1.5 s in adjust_for_ambient_noise every time.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable, List, Optional
+
+import numpy as np
+
+from audio.levels import LevelRing
+from audio.sources import AudioSource, MicrophoneSource
+
+
+class RingBuffer:
+    """Preallocated int16 ring; positions are absolute sample counts."""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._data = np.zeros(capacity, dtype=np.int16)
+        self.write_pos = 0  # total samples ever written
+
+    def write(self, samples: np.ndarray) -> int:
+        total = n = len(samples)
+        if n >= self.capacity:
+            # Only the newest `capacity` samples fit, but positions still advance by all of them
+            samples = samples[-self.capacity:]
+            n = self.capacity
+        start = (self.write_pos + total - n) % self.capacity
+        first = min(n, self.capacity - start)
+        self._data[start:start + first] = samples[:first]
+        if first < n:
+            self._data[:n - first] = samples[first:]
+        self.write_pos += total
+        return self.write_pos
+
+    def read(self, start: int, end: Optional[int] = None) -> np.ndarray:
+        """Copy samples [start, end) — clipped to what is still in the ring."""
+        end = self.write_pos if end is None else min(end, self.write_pos)
+        start = max(start, end - self.capacity, 0)
+        if end <= start:
+            return np.zeros(0, dtype=np.int16)
+        a, b = start % self.capacity, end % self.capacity
+        if a < b:
+            return self._data[a:b].copy()
+        return np.concatenate([self._data[a:], self._data[:b]])
+
+
+class NoiseFloorTracker:
+    """
+    Continuous noise-floor estimate from frame RMS: falls quickly to quiet
+    frames and rises slowly, so speech barely moves it but a fan switching
+    on is picked up within a few seconds.
+    """
+
+    def __init__(self, initial: float = 100.0, fall: float = 0.2, rise: float = 0.01, minimum: float = 10.0):
+        self.floor = initial
+        self.fall = fall
+        self.rise = rise
+        self.minimum = minimum
+        self.frames = 0
+
+    def update(self, rms: float) -> float:
+        alpha = self.fall if rms < self.floor else self.rise
+        self.floor = max(self.minimum, self.floor + alpha * (rms - self.floor))
+        self.frames += 1
+        return self.floor
+
+
+def frame_rms(samples: np.ndarray) -> float:
+    if len(samples) == 0:
+        return 0.0
+    x = samples.astype(np.float32)
+    return float(np.sqrt(np.mean(x * x)))
+
+
+class CaptureEngine:
+    """Owns the input stream, the ring buffer and the noise-floor tracker."""
+
+    def __init__(
+        self,
+        source: Optional[AudioSource] = None,
+        frame_ms: int = 20,
+        ring_seconds: float = 30.0,
+        levels: Optional[LevelRing] = None,
+    ):
+        self.source = source or MicrophoneSource()
+        self.samplerate = self.source.samplerate
+        self.frame_samples = int(self.samplerate * frame_ms / 1000)
+        self.frame_ms = frame_ms
+        self.ring = RingBuffer(int(self.samplerate * ring_seconds))
+        self.noise = NoiseFloorTracker()
+        self.last_rms = 0.0
+        self.levels = levels  # per-frame levels for the visualizer (optional)
+        self._listeners: List[Callable[[np.ndarray, int], None]] = []
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._ready = threading.Event()
+        self.exhausted = False
+
+    # ────────────────────────────────────────────────
+    #  Lifecycle
+    # ────────────────────────────────────────────────
+
+    def start(self):
+        if self._running:
+            return
+        self.source.open()
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="audio-capture", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(2.0)
+            self._thread = None
+        self.source.close()
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """True once enough frames were seen for a usable noise-floor estimate."""
+        return self._ready.wait(timeout)
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    # ────────────────────────────────────────────────
+    #  Readers
+    # ────────────────────────────────────────────────
+
+    def add_listener(self, callback: Callable[[np.ndarray, int], None]):
+        """callback(frame, end_pos) runs on the capture thread for every frame."""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    @property
+    def position(self) -> int:
+        return self.ring.write_pos
+
+    def wait_for(self, pos: int, timeout: Optional[float] = None) -> bool:
+        """Block until the ring has been written past `pos`."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self.ring.write_pos <= pos and self._running:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return self.ring.write_pos > pos
+
+    def read(self, start: int, end: Optional[int] = None) -> np.ndarray:
+        with self._cond:
+            return self.ring.read(start, end)
+
+    def energy_threshold(self, ratio: float = 1.5, minimum: float = 50.0) -> float:
+        """Speech threshold in speech_recognition energy units (int16 RMS)."""
+        return max(minimum, self.noise.floor * ratio)
+
+    # ────────────────────────────────────────────────
+    #  Capture thread
+    # ────────────────────────────────────────────────
+
+    def _run(self):
+        ready_after = max(1, int(300 / self.frame_ms))  # ~300 ms of audio
+        try:
+            while self._running:
+                data = self.source.read(self.frame_samples)
+                if data is None:
+                    self.exhausted = True
+                    break
+                frame = np.frombuffer(data, dtype=np.int16)
+                rms = frame_rms(frame)
+                with self._cond:
+                    pos = self.ring.write(frame)
+                    self.last_rms = rms
+                    self.noise.update(rms)
+                    self._cond.notify_all()
+                if self.levels is not None:
+                    self.levels.publish_block(frame, rms)
+                if self.noise.frames >= ready_after:
+                    self._ready.set()
+                for listener in list(self._listeners):
+                    try:
+                        listener(frame, pos)
+                    except Exception as e:
+                        print(f"[CAPTURE] Listener error: {e}", flush=True)
+        except Exception as e:
+            print(f"[CAPTURE] Input stream error: {e}", flush=True)
+        finally:
+            self._running = False
+            with self._cond:
+                self._cond.notify_all()
@@ -0,0 +1,96 @@
+"""
+In-memory audio decoding for TTS responses.
+
+Replaces the write-output.wav-then-sf.read round trip: the bytes returned by
+the TTS service are decoded straight from memory into a NumPy buffer ready
+for sounddevice. Set REX_AUDIO_DEBUG_DIR to keep a copy of every response
+on disk for debugging.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import time
+import wave
+from typing import Optional, Tuple
+
+import numpy as np
+
+DEBUG_DIR = os.getenv("REX_AUDIO_DEBUG_DIR", "")
+
+_EXTENSIONS = {"wav": "wav", "mp3": "mp3", "ogg": "ogg", "flac": "flac", "pcm": "pcm"}
+
+
+def detect_format(data: bytes) -> str:
+    """Guess the container from magic bytes: wav, mp3, ogg, flac or pcm (raw)."""
+    head = data[:12]
+    if head[:4] == b"RIFF" and head[8:12] == b"WAVE":
+        return "wav"
+    if head[:3] == b"ID3" or (len(head) >= 2 and head[0] == 0xFF and (head[1] & 0xE0) == 0xE0):
+        return "mp3"
+    if head[:4] == b"OggS":
+        return "ogg"
+    if head[:4] == b"fLaC":
+        return "flac"
+    return "pcm"
+
+
+def _decode_wav(data: bytes) -> Optional[Tuple[np.ndarray, int]]:
+    """Fast path for 16-bit PCM WAV using the stdlib (no libsndfile call)."""
+    with wave.open(io.BytesIO(data), "rb") as wf:
+        if wf.getsampwidth() != 2:
+            return None
+        channels = wf.getnchannels()
+        rate = wf.getframerate()
+        frames = np.frombuffer(wf.readframes(wf.getnframes()), dtype=np.int16)
+    samples = frames.astype(np.float32) / 32768.0
+    if channels > 1:
+        samples = samples.reshape(-1, channels)
+    return samples, rate
+
+
+def decode_audio(data: bytes, pcm_samplerate: int = 22050) -> Tuple[np.ndarray, int]:
+    """
+    Decode TTS bytes to (float32 samples, samplerate) without touching disk.
+    Raw PCM (ElevenLabs pcm_* formats) is treated as 16-bit mono at pcm_samplerate.
+    """
+    fmt = detect_format(data)
+    dump_debug_audio(data, fmt)
+
+    if fmt == "pcm":
+        usable = len(data) - len(data) % 2
+        samples = np.frombuffer(data[:usable], dtype=np.int16).astype(np.float32) / 32768.0
+        return samples, pcm_samplerate
+
+    if fmt == "wav":
+        decoded = _decode_wav(data)
+        if decoded is not None:
+            return decoded
+
+    import soundfile as sf
+    samples, rate = sf.read(io.BytesIO(data), dtype="float32")
+    return samples, rate
+
+
+def to_pcm16(samples: np.ndarray) -> bytes:
+    """Convert float samples (mono or multi-channel) to mono int16 PCM bytes."""
+    if samples.ndim > 1:
+        samples = samples.mean(axis=1)
+    return (np.clip(samples, -1.0, 1.0) * 32767).astype(np.int16).tobytes()
+
+
+def dump_debug_audio(data: bytes, fmt: str) -> Optional[str]:
+    """Write a copy of the response to REX_AUDIO_DEBUG_DIR (if set)."""
+    if not DEBUG_DIR:
+        return None
+    try:
+        os.makedirs(DEBUG_DIR, exist_ok=True)
+        name = f"tts_{time.strftime('%Y%m%d_%H%M%S')}_{time.time_ns() % 1_000_000:06d}.{_EXTENSIONS.get(fmt, 'bin')}"
+        path = os.path.join(DEBUG_DIR, name)
+        with open(path, "wb") as f:
+            f.write(data)
+        return path
+    except Exception as e:
+        print(f"[AUDIO] Could not write debug audio: {e}", flush=True)
+        return None
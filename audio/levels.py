@@ -0,0 +1,129 @@
+"""
+Per-block audio levels for the visualizer.
+
+The playback and capture threads publish (time, RMS, peak) for every block
+they handle into a preallocated ring; the GUI reads the last few dozen
+entries each frame. There is exactly one writer and one reader per ring,
+so no lock is taken: the writer fills a slot and only then advances the
+counter, and the reader checks the counter again after copying to drop
+anything overwritten meanwhile. The ring can live in a caller-supplied
+buffer (e.g. multiprocessing.shared_memory) so another process can read it.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Dict, Optional
+
+import numpy as np
+
+_HEADER = 2   # int64: [blocks ever written, capacity]
+_FIELDS = 3   # float64: monotonic time, rms, peak
+
+
+class LevelRing:
+    """Single-writer / single-reader ring of (time, rms, peak) per audio block."""
+
+    def __init__(self, capacity: int = 256, buffer=None):
+        if buffer is None:
+            buffer = bytearray(self.nbytes(capacity))
+        self.buffer = buffer
+        self._header = np.ndarray((_HEADER,), dtype=np.int64, buffer=buffer)
+        if self._header[1] == 0:
+            self._header[1] = capacity
+        else:
+            capacity = int(self._header[1])  # attaching to a ring someone else created
+        self.capacity = capacity
+        self._data = np.ndarray((capacity, _FIELDS), dtype=np.float64, buffer=buffer, offset=_HEADER * 8)
+
+    @staticmethod
+    def nbytes(capacity: int) -> int:
+        return (_HEADER + capacity * _FIELDS) * 8
+
+    @property
+    def count(self) -> int:
+        return int(self._header[0])
+
+    # ────────────────────────────────────────────────
+    #  Writer (audio thread)
+    # ────────────────────────────────────────────────
+
+    def publish(self, rms: float, peak: float, when: Optional[float] = None):
+        n = int(self._header[0])
+        row = self._data[n % self.capacity]
+        row[0] = time.monotonic() if when is None else when
+        row[1] = rms
+        row[2] = peak
+        self._header[0] = n + 1  # publish after the slot is complete
+
+    def publish_block(self, samples: np.ndarray, rms: Optional[float] = None):
+        """Levels of one int16 block; pass rms if the caller already has it."""
+        if len(samples) == 0:
+            self.publish(0.0, 0.0)
+            return
+        if rms is None:
+            x = samples.astype(np.float32)
+            rms = float(np.sqrt(np.dot(x, x) / len(x)))
+        peak = float(max(int(samples.max()), -int(samples.min())))
+        self.publish(rms, peak)
+
+    # ────────────────────────────────────────────────
+    #  Reader (GUI thread)
+    # ────────────────────────────────────────────────
+
+    def latest(self) -> tuple:
+        """(time, rms, peak) of the newest block, or zeros if none yet."""
+        n = self.count
+        if n == 0:
+            return 0.0, 0.0, 0.0
+        t, rms, peak = self._data[(n - 1) % self.capacity]
+        return float(t), float(rms), float(peak)
+
+    def recent(self, out: np.ndarray) -> int:
+        """
+        Copy the newest len(out) blocks into out (oldest first, shape (k, 3)).
+        Returns how many rows are valid; they are at the end of out.
+        """
+        want = min(len(out), self.capacity)
+        for _ in range(2):
+            end = self.count
+            k = min(want, end)
+            if k == 0:
+                return 0
+            start = end - k
+            a, b = start % self.capacity, end % self.capacity
+            dst = out[len(out) - k:]
+            if a < b:
+                dst[:] = self._data[a:b]
+            else:
+                split = self.capacity - a
+                dst[:split] = self._data[a:]
+                dst[split:] = self._data[:b]
+            # Anything older than count - capacity was overwritten while we copied
+            lost = self.count - self.capacity - start
+            if lost <= 0:
+                return k
+        return max(0, k - lost)
+
+
+# ============ Named rings ============
+
+_rings: Dict[str, LevelRing] = {}
+
+
+def ring(name: str, capacity: int = 256) -> LevelRing:
+    """Process-wide ring by name ("playback", "capture"), created on first use."""
+    if name not in _rings:
+        _rings[name] = LevelRing(capacity)
+    return _rings[name]
+
+
+def attach(name: str, buffer, capacity: int = 256) -> LevelRing:
+    """Back the named ring with an existing buffer (e.g. shared memory)."""
+    _rings[name] = LevelRing(capacity, buffer=buffer)
+    return _rings[name]
+
+
+def detach(name: str):
+    """Forget the named ring so its buffer can be released."""
+    _rings.pop(name, None)
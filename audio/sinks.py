@@ -0,0 +1,132 @@
+"""
+Audio output sinks: where TTS audio and the listen beep end up.
+
+DeviceSink is the sound card (sounddevice + winsound); CaptureSink records
+everything written to it, paced like a real device, so the assistant loop
+can run headless and be measured.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import wave
+from typing import List, Optional
+
+import numpy as np
+
+
+class AudioSink:
+    """Interface: open_stream(samplerate, channels) for StreamPlayer, beep()."""
+
+    def open_stream(self, samplerate: int, channels: int):
+        raise NotImplementedError
+
+    def beep(self, frequency: int = 1300, duration_ms: int = 150):
+        pass
+
+
+class DeviceSink(AudioSink):
+    """Default output device."""
+
+    def open_stream(self, samplerate: int, channels: int):
+        import sounddevice as sd
+        return sd.RawOutputStream(samplerate=samplerate, channels=channels, dtype="int16")
+
+    def beep(self, frequency: int = 1300, duration_ms: int = 150):
+        try:
+            import winsound
+            winsound.Beep(frequency, duration_ms)
+        except Exception:
+            pass
+
+
+class CaptureStream:
+    """
+    RawOutputStream stand-in that keeps the PCM. write() blocks like a device
+    once more than `buffer_s` of audio is queued (realtime=True), so
+    playback timing and cancellation behave as they would on speakers.
+    """
+
+    def __init__(self, sink: "CaptureSink", samplerate: int, channels: int, buffer_s: float = 0.1):
+        self.sink = sink
+        self.samplerate = samplerate
+        self.channels = channels
+        self.latency = buffer_s if sink.realtime else 0.0
+        self._play_head = None
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def close(self):
+        pass
+
+    def write(self, data: bytes):
+        now = time.perf_counter()
+        self.sink._record(now, bytes(data))
+        if not self.sink.realtime:
+            return False
+        if self._play_head is None or self._play_head < now:
+            self._play_head = now
+        self._play_head += len(data) / (self.samplerate * 2 * self.channels)
+        backlog = self._play_head - time.perf_counter()
+        if backlog > self.latency:
+            time.sleep(backlog - self.latency)
+        return False
+
+
+class CaptureSink(AudioSink):
+    """Records output PCM and beeps with timestamps; save() writes a WAV."""
+
+    def __init__(self, realtime: bool = True):
+        self.realtime = realtime
+        self.samplerate: Optional[int] = None
+        self.beeps: List[float] = []
+        self._chunks: List[bytes] = []
+        self._writes: List[float] = []
+        self._lock = threading.Lock()
+
+    def open_stream(self, samplerate: int, channels: int):
+        self.samplerate = samplerate
+        return CaptureStream(self, samplerate, channels)
+
+    def beep(self, frequency: int = 1300, duration_ms: int = 150):
+        now = time.perf_counter()
+        with self._lock:
+            self.beeps.append(now)
+        if self.samplerate:
+            t = np.arange(int(self.samplerate * duration_ms / 1000)) / self.samplerate
+            tone = (0.2 * np.sin(2 * np.pi * frequency * t) * 32767).astype(np.int16)
+            with self._lock:
+                self._chunks.append(tone.tobytes())  # kept in the recording, not in write timings
+
+    def _record(self, when: float, data: bytes):
+        with self._lock:
+            self._chunks.append(data)
+            self._writes.append(when)
+
+    def first_write_after(self, t: float) -> Optional[float]:
+        """Time of the first TTS audio written at or after t (beeps excluded)."""
+        with self._lock:
+            return next((w for w in self._writes if w >= t), None)
+
+    @property
+    def pcm(self) -> bytes:
+        with self._lock:
+            return b"".join(self._chunks)
+
+    def clear(self):
+        with self._lock:
+            self._chunks.clear()
+            self._writes.clear()
+            self.beeps.clear()
+
+    def save(self, path: str):
+        with wave.open(path, "wb") as wf:
+            wf.setnchannels(1)
+            wf.setsampwidth(2)
+            wf.setframerate(self.samplerate or 22050)
+            wf.writeframes(self.pcm)
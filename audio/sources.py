@@ -0,0 +1,126 @@
+"""
+Raw audio input sources: 16-bit mono PCM read in fixed-size frames.
+
+MicrophoneSource wraps a sounddevice input stream; WavFileSource replays a
+WAV file with realtime pacing so the capture pipeline can be driven without
+a microphone.
+"""
+
+from __future__ import annotations
+
+import time
+import wave
+from typing import Optional
+
+import numpy as np
+
+
+class AudioSource:
+    """Interface: open(), read(frames) -> int16 PCM bytes (blocking), close()."""
+
+    samplerate = 16000
+
+    def open(self):
+        pass
+
+    def read(self, frames: int) -> Optional[bytes]:
+        """Return exactly `frames` samples, or None once the source is exhausted."""
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class MicrophoneSource(AudioSource):
+    """Default input device through one persistent sounddevice stream."""
+
+    def __init__(self, samplerate: int = 16000, device=None):
+        self.samplerate = samplerate
+        self.device = device
+        self._stream = None
+
+    def open(self):
+        import sounddevice as sd
+        self._stream = sd.RawInputStream(
+            samplerate=self.samplerate, channels=1, dtype="int16", device=self.device
+        )
+        self._stream.start()
+
+    def read(self, frames: int) -> Optional[bytes]:
+        data, _overflowed = self._stream.read(frames)
+        return bytes(data)
+
+    def close(self):
+        if self._stream is not None:
+            self._stream.stop()
+            self._stream.close()
+            self._stream = None
+
+
+class WavFileSource(AudioSource):
+    """
+    Replay a 16-bit WAV file as if it were a microphone.
+    realtime=True paces reads to the clock; pad_seconds of silence (or
+    endless silence with pad_seconds=None) follows the recording.
+    """
+
+    def __init__(self, path: str, realtime: bool = True, pad_seconds: Optional[float] = 0.0):
+        self.path = path
+        self.realtime = realtime
+        self.pad_seconds = pad_seconds
+        with wave.open(path, "rb") as wf:
+            if wf.getsampwidth() != 2:
+                raise ValueError(f"{path}: only 16-bit WAV files are supported")
+            self.samplerate = wf.getframerate()
+            channels = wf.getnchannels()
+            data = np.frombuffer(wf.readframes(wf.getnframes()), dtype=np.int16)
+        if channels > 1:
+            data = data.reshape(-1, channels).mean(axis=1).astype(np.int16)
+        self._data = data
+        self._pos = 0
+        self._clock = None
+
+    @classmethod
+    def from_array(cls, samples: np.ndarray, samplerate: int, realtime: bool = True,
+                   pad_seconds: Optional[float] = 0.0) -> "WavFileSource":
+        """Build a source from int16 samples already in memory."""
+        src = cls.__new__(cls)
+        src.path = "<memory>"
+        src.realtime = realtime
+        src.pad_seconds = pad_seconds
+        src.samplerate = samplerate
+        src._data = np.asarray(samples, dtype=np.int16)
+        src._pos = 0
+        src._clock = None
+        return src
+
+    @property
+    def duration(self) -> float:
+        return len(self._data) / self.samplerate
+
+    @property
+    def started_at(self) -> Optional[float]:
+        """perf_counter() time of sample 0 (realtime sources only)."""
+        return self._clock
+
+    def open(self):
+        self._pos = 0
+        self._clock = time.perf_counter()
+
+    def read(self, frames: int) -> Optional[bytes]:
+        end = self._pos + frames
+        limit = None if self.pad_seconds is None else len(self._data) + int(self.pad_seconds * self.samplerate)
+        if limit is not None and self._pos >= limit:
+            return None
+
+        chunk = self._data[self._pos:end]
+        if len(chunk) < frames:
+            chunk = np.concatenate([chunk, np.zeros(frames - len(chunk), dtype=np.int16)])
+        self._pos = end
+
+        if self.realtime:
+            due = self._clock + self._pos / self.samplerate
+            delay = due - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        return chunk.tobytes()
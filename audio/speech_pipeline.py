@@ -0,0 +1,61 @@
+"""
+Sentence segmentation for pipelined speech: split an LLM token stream into
+sentences on the fly so each can be queued on the TTS worker while the LLM
+keeps generating.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Iterable, Iterator, Optional
+
+# Sentence end: terminal punctuation (plus closing quotes/brackets) then whitespace
+_SENTENCE_END = re.compile(r'[.!?…]+["\')\]]*\s')
+# Clause break used only when a sentence runs long
+_CLAUSE_END = re.compile(r'[,;:—]\s')
+_ABBREVIATIONS = {"mr.", "mrs.", "ms.", "dr.", "st.", "vs.", "e.g.", "i.e.", "etc.", "no."}
+
+
+def split_sentences(
+    tokens: Iterable[str],
+    min_chars: int = 12,
+    max_chars: int = 160,
+) -> Iterator[str]:
+    """
+    Yield speakable segments from a stream of text deltas as soon as each
+    sentence (or, for long sentences, clause) is complete.
+    """
+    buffer = ""
+    for delta in tokens:
+        if not delta:
+            continue
+        buffer += delta
+        while True:
+            cut = _find_cut(buffer, min_chars, max_chars)
+            if cut is None:
+                break
+            segment, buffer = buffer[:cut].strip(), buffer[cut:]
+            if segment:
+                yield segment
+    tail = buffer.strip()
+    if tail:
+        yield tail
+
+
+def _find_cut(buffer: str, min_chars: int, max_chars: int) -> Optional[int]:
+    for match in _SENTENCE_END.finditer(buffer):
+        end = match.end()
+        if end < min_chars:
+            continue
+        last_word = buffer[:match.start() + 1].rsplit(None, 1)[-1].lower()
+        if last_word in _ABBREVIATIONS:
+            continue
+        return end
+    if len(buffer) > max_chars:
+        clauses = [m.end() for m in _CLAUSE_END.finditer(buffer) if m.end() >= min_chars]
+        if clauses:
+            return clauses[-1]
+        space = buffer.rfind(' ', min_chars, max_chars)
+        if space > 0:
+            return space + 1
+    return None
@@ -0,0 +1,47 @@
+"""
+speech_recognition adapter over the persistent CaptureEngine, so
+Recognizer.listen() can read from the shared ring buffer instead of opening
+a new sr.Microphone every turn.
+"""
+
+from __future__ import annotations
+
+import speech_recognition as sr
+
+from audio.capture import CaptureEngine
+
+
+class _RingStream:
+    """File-like reader over the capture ring, starting at a fixed position."""
+
+    def __init__(self, engine: CaptureEngine, start: int):
+        self.engine = engine
+        self.pos = start
+
+    def read(self, size: int) -> bytes:
+        end = self.pos + size
+        # Returning b"" tells Recognizer.listen the stream has ended
+        if not self.engine.wait_for(end - 1, timeout=2.0):
+            return b""
+        samples = self.engine.read(self.pos, end)
+        self.pos = end
+        return samples.tobytes()
+
+
+class CaptureAudioSource(sr.AudioSource):
+    """Audio source that reads from a running CaptureEngine from 'now' onwards."""
+
+    def __init__(self, engine: CaptureEngine, chunk_size: int = 1024, preroll_seconds: float = 0.0):
+        self.engine = engine
+        self.SAMPLE_RATE = engine.samplerate
+        self.SAMPLE_WIDTH = 2
+        self.CHUNK = chunk_size
+        self.preroll = int(preroll_seconds * engine.samplerate)
+        self.stream = None
+
+    def __enter__(self):
+        self.stream = _RingStream(self.engine, max(0, self.engine.position - self.preroll))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stream = None
@@ -0,0 +1,155 @@
+"""
+Persistent raw PCM output stream fed from a chunk iterator.
+
+ElevenLabs can return raw 16-bit little-endian PCM (output_format="pcm_22050"),
+so chunks can go straight to the sound card as they arrive instead of waiting
+for the whole file. A small jitter buffer is filled before the first write so
+network hiccups right after the first chunk don't cause an underrun.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable, Iterable, Optional
+
+import numpy as np
+
+from audio.levels import LevelRing
+
+SAMPLE_WIDTH = 2  # int16
+
+
+def _default_stream_factory(samplerate: int, channels: int):
+    import sounddevice as sd
+    return sd.RawOutputStream(samplerate=samplerate, channels=channels, dtype="int16")
+
+
+class StreamPlayer:
+    """Keeps one output stream open for the session and writes PCM chunks to it."""
+
+    def __init__(
+        self,
+        samplerate: int = 22050,
+        channels: int = 1,
+        jitter_ms: int = 80,
+        block_ms: int = 50,
+        stream_factory: Optional[Callable] = None,
+        levels: Optional[LevelRing] = None,
+    ):
+        self.samplerate = samplerate
+        self.channels = channels
+        self.jitter_ms = jitter_ms
+        self.block_ms = block_ms
+        self._stream_factory = stream_factory or _default_stream_factory
+        self._stream = None
+        self._lock = threading.Lock()
+        # RMS (int16 units) of the block being played; 0 when silent. Lets the
+        # barge-in detector tell the assistant's own echo from the user.
+        self.level = 0.0
+        # Per-block levels for the visualizer (optional)
+        self.levels = levels
+
+    @property
+    def bytes_per_second(self) -> int:
+        return self.samplerate * self.channels * SAMPLE_WIDTH
+
+    def _ensure_stream(self):
+        if self._stream is None:
+            self._stream = self._stream_factory(self.samplerate, self.channels)
+            self._stream.start()
+        return self._stream
+
+    def play_chunks(
+        self,
+        chunks: Iterable[bytes],
+        on_first_audio: Optional[Callable[[], None]] = None,
+        cancel: Optional[threading.Event] = None,
+    ) -> dict:
+        """
+        Play PCM chunks as they arrive. Blocks until the last chunk is queued
+        and the device buffer has drained, or until `cancel` is set.
+        Returns timing info in seconds.
+        """
+        start = time.perf_counter()
+        frame_bytes = SAMPLE_WIDTH * self.channels
+        prefill = int(self.bytes_per_second * self.jitter_ms / 1000)
+        prefill -= prefill % frame_bytes
+        # Write in short blocks so a cancel takes effect within ~block_ms
+        block = int(self.bytes_per_second * self.block_ms / 1000)
+        block -= block % frame_bytes
+
+        pending = bytearray()
+        first_audio = None
+        total = 0
+        cancelled = False
+
+        with self._lock:
+            stream = self._ensure_stream()
+            chunk_iter = iter(chunks)
+            finished = False
+            while not finished:
+                chunk = next(chunk_iter, None)
+                if chunk is None:
+                    finished = True
+                elif chunk:
+                    pending.extend(chunk)
+                if not finished and first_audio is None and len(pending) < prefill:
+                    continue
+
+                # Only write whole frames; keep the odd tail for the next chunk
+                usable = len(pending) - len(pending) % frame_bytes
+                if usable == 0:
+                    continue
+                if first_audio is None:
+                    first_audio = time.perf_counter() - start
+                    if on_first_audio is not None:
+                        on_first_audio()
+                for offset in range(0, usable, block):
+                    if cancel is not None and cancel.is_set():
+                        cancelled = True
+                        break
+                    data = bytes(pending[offset:min(offset + block, usable)])
+                    samples = np.frombuffer(data, dtype=np.int16)
+                    x = samples.astype(np.float32)
+                    self.level = float(np.sqrt(np.mean(x * x))) if len(x) else 0.0
+                    if self.levels is not None:
+                        self.levels.publish_block(samples, self.level)
+                    stream.write(data)
+                    total += len(data)
+                del pending[:usable]
+                if cancelled:
+                    break
+
+            # Blocking writes return once data is queued; wait out the device buffer
+            latency = getattr(stream, "latency", 0.0) or 0.0
+            if total and latency and not cancelled:
+                time.sleep(latency)
+            self.level = 0.0
+            if self.levels is not None and total:
+                self.levels.publish(0.0, 0.0)
+
+        return {
+            "first_audio": first_audio,
+            "total": time.perf_counter() - start,
+            "audio_seconds": total / self.bytes_per_second,
+            "cancelled": cancelled,
+        }
+
+    def play_pcm(
+        self,
+        pcm: bytes,
+        on_first_audio: Optional[Callable[[], None]] = None,
+        cancel: Optional[threading.Event] = None,
+    ) -> dict:
+        """Play an already complete PCM buffer."""
+        return self.play_chunks([pcm], on_first_audio=on_first_audio, cancel=cancel)
+
+    def close(self):
+        with self._lock:
+            if self._stream is not None:
+                try:
+                    self._stream.stop()
+                    self._stream.close()
+                finally:
+                    self._stream = None
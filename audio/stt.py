@@ -0,0 +1,447 @@
+"""
+Pluggable speech-to-text backends.
+
+Every backend takes 16-bit mono PCM and returns a Transcript. Google (online,
+via speech_recognition) is one backend; Vosk runs offline on the CPU and can
+stream partial transcripts while the user is still speaking. Backends raise
+speech_recognition's UnknownValueError / RequestError like recognize_google
+does, so callers keep a single error-handling path.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import speech_recognition as sr
+
+
+@dataclass
+class Transcript:
+    text: str
+    confidence: float
+    backend: str
+    latency: float = 0.0   # seconds from request to result
+    is_final: bool = True
+
+
+class STTCancelled(Exception):
+    """A transcription was abandoned (another hedged backend already won)."""
+
+
+class STTBackend:
+    """
+    Interface: transcribe() a whole utterance; streaming backends also
+    start_stream(). transcribe() should stop early, raising STTCancelled,
+    once `cancel` is set.
+    """
+
+    name = "base"
+    streaming = False
+
+    def transcribe(self, pcm: bytes, samplerate: int, cancel: Optional[threading.Event] = None) -> Transcript:
+        raise NotImplementedError
+
+    def start_stream(self, samplerate: int) -> "StreamingSession":
+        raise NotImplementedError(f"{self.name} does not support streaming")
+
+    def warm_up(self):
+        """Load models / open connections ahead of the first turn."""
+
+
+class StreamingSession:
+    def accept(self, pcm: bytes) -> Optional[str]:
+        """Feed audio; returns the current partial transcript (if it changed)."""
+        raise NotImplementedError
+
+    def finish(self) -> Transcript:
+        raise NotImplementedError
+
+    def close(self):
+        """Abandon the session: a finish() in progress stops early with STTCancelled."""
+
+
+# ============ Google ============
+
+class GoogleSTT(STTBackend):
+    """recognize_google over the network (the original listen() behaviour)."""
+
+    name = "google"
+
+    def __init__(self, language: str = "en-IN"):
+        self.language = language
+        self.recognizer = sr.Recognizer()
+
+    def transcribe(self, pcm: bytes, samplerate: int, cancel: Optional[threading.Event] = None) -> Transcript:
+        start = time.perf_counter()
+        if cancel is not None and cancel.is_set():
+            raise STTCancelled()   # the request itself can't be interrupted once sent
+        audio = sr.AudioData(pcm, samplerate, 2)
+        result = self.recognizer.recognize_google(audio, language=self.language, show_all=True)
+        if not result or not result.get("alternative"):
+            raise sr.UnknownValueError()
+        best = result["alternative"][0]
+        return Transcript(
+            text=best.get("transcript", ""),
+            confidence=float(best.get("confidence", 0.8)),
+            backend=self.name,
+            latency=time.perf_counter() - start,
+        )
+
+
+# ============ Vosk (offline) ============
+
+class VoskSTT(STTBackend):
+    """
+    Offline Kaldi recognizer. Needs `pip install vosk` and a model folder
+    (e.g. vosk-model-small-en-in-0.4) at REX_VOSK_MODEL.
+    """
+
+    name = "vosk"
+    streaming = True
+
+    def __init__(self, model_path: Optional[str] = None):
+        self.model_path = model_path or os.getenv("REX_VOSK_MODEL", "models/vosk")
+        self._model = None
+        self._lock = threading.Lock()
+
+    def _get_model(self):
+        with self._lock:
+            if self._model is None:
+                import vosk
+                vosk.SetLogLevel(-1)
+                if not os.path.isdir(self.model_path):
+                    raise sr.RequestError(f"Vosk model not found at {self.model_path}")
+                self._model = vosk.Model(self.model_path)
+            return self._model
+
+    def warm_up(self):
+        self._get_model()
+
+    def start_stream(self, samplerate: int) -> "VoskSession":
+        return VoskSession(self._get_model(), samplerate)
+
+    def transcribe(self, pcm: bytes, samplerate: int, cancel: Optional[threading.Event] = None) -> Transcript:
+        start = time.perf_counter()
+        session = self.start_stream(samplerate)
+        chunk = samplerate // 2 * 2   # half a second of 16-bit audio per call
+        for offset in range(0, len(pcm), chunk):
+            if cancel is not None and cancel.is_set():
+                raise STTCancelled()
+            session.accept(pcm[offset:offset + chunk])
+        if cancel is not None and cancel.is_set():
+            raise STTCancelled()
+        transcript = session.finish()
+        transcript.latency = time.perf_counter() - start
+        return transcript
+
+
+class VoskSession(StreamingSession):
+    def __init__(self, model, samplerate: int):
+        import vosk
+        self.recognizer = vosk.KaldiRecognizer(model, samplerate)
+        self.recognizer.SetWords(True)
+        self._final_parts = []
+        self._last_partial = ""
+        self._started = time.perf_counter()
+        self._closed = threading.Event()
+
+    def _collect(self, raw: str):
+        result = json.loads(raw)
+        if result.get("text"):
+            self._final_parts.append(result)
+
+    def accept(self, pcm: bytes) -> Optional[str]:
+        if self._closed.is_set():
+            return None
+        if self.recognizer.AcceptWaveform(pcm):
+            self._collect(self.recognizer.Result())
+        partial = json.loads(self.recognizer.PartialResult()).get("partial", "")
+        text = " ".join([p["text"] for p in self._final_parts] + ([partial] if partial else []))
+        if text != self._last_partial:
+            self._last_partial = text
+            return text
+        return None
+
+    def close(self):
+        self._closed.set()
+
+    def finish(self) -> Transcript:
+        if self._closed.is_set():
+            raise STTCancelled()
+        self._collect(self.recognizer.FinalResult())
+        words = [w for part in self._final_parts for w in part.get("result", [])]
+        text = " ".join(p["text"] for p in self._final_parts).strip()
+        if not text:
+            raise sr.UnknownValueError()
+        confidence = sum(w.get("conf", 0.0) for w in words) / len(words) if words else 0.5
+        return Transcript(text=text, confidence=confidence, backend="vosk",
+                          latency=time.perf_counter() - self._started)
+
+
+# ============ Streaming helper ============
+
+class StreamingTranscriber:
+    """
+    Runs a StreamingSession on its own thread so feeding audio from the
+    capture thread never blocks it. Partial transcripts go to on_partial.
+    """
+
+    def __init__(self, backend: STTBackend, samplerate: int,
+                 on_partial: Optional[Callable[[str], None]] = None):
+        self.session = backend.start_stream(samplerate)
+        self.on_partial = on_partial
+        self._queue: queue.Queue = queue.Queue()
+        self._result: Optional[Transcript] = None
+        self._error: Optional[Exception] = None
+        self._finished_at = 0.0
+        self._thread = threading.Thread(target=self._run, name="stt-stream", daemon=True)
+        self._thread.start()
+
+    def feed(self, pcm: bytes):
+        self._queue.put(pcm)
+
+    def _run(self):
+        try:
+            while True:
+                pcm = self._queue.get()
+                if pcm is None:
+                    break
+                partial = self.session.accept(pcm)
+                if partial and self.on_partial is not None:
+                    self.on_partial(partial)
+            self._result = self.session.finish()
+        except Exception as e:
+            self._error = e
+
+    def close(self):
+        """Abandon the session (e.g. the utterance never completed)."""
+        self.session.close()
+        self._queue.put(None)
+
+    def finish(self, timeout: float = 10.0) -> Transcript:
+        """Flush queued audio and return the final transcript."""
+        start = time.perf_counter()
+        self._queue.put(None)
+        self._thread.join(timeout)
+        if self._error is not None:
+            raise self._error
+        if self._result is None:
+            raise sr.UnknownValueError()
+        # Latency that matters here is end-of-speech → final text
+        self._result.latency = time.perf_counter() - start
+        return self._result
+
+
+# ============ Hedging ============
+
+class HedgedSTT(STTBackend):
+    """
+    Sends the same utterance to several backends: the first one at once,
+    the others only if no result has cleared `min_confidence` after
+    `hedge_delay` seconds. The first result above the bar wins and the rest
+    are cancelled: racers not yet started never run, running ones are told
+    to stop (cancel event / session close()) and their results are ignored.
+    If nothing clears the bar, the most confident result wins.
+    Streaming backends in the list are fed live through start_stream().
+
+    Each turn records the latency hedging saved against the first backend:
+    its latency minus the winner's once it returns (a request that can't
+    be interrupted still does), or, when it was stopped, the time it had
+    run by then, which is a lower bound.
+    """
+
+    name = "hedged"
+
+    def __init__(self, backends, hedge_delay: float = 0.3, min_confidence: float = 0.6):
+        self.backends = list(backends)
+        self.hedge_delay = hedge_delay
+        self.min_confidence = min_confidence
+        self.streaming = any(b.streaming for b in self.backends)
+        self.wins = {b.name: 0 for b in self.backends}
+        self.turns = 0
+        self.cancelled = 0   # losing racers stopped before they finished
+        self.saved = []      # seconds saved per turn vs. waiting for the first backend alone
+        self.saved_bounds = 0   # of those, turns where it was stopped (at least that much saved)
+        self._lock = threading.Lock()
+        # Room for a second race while uninterruptible losers (an HTTP request) wind down
+        self._pool = ThreadPoolExecutor(max_workers=2 * max(1, len(self.backends)), thread_name_prefix="stt")
+
+    def warm_up(self):
+        for backend in self.backends:
+            try:
+                backend.warm_up()
+            except Exception as e:
+                print(f"[STT] {backend.name} warm-up failed: {e}", flush=True)
+
+    def transcribe(self, pcm: bytes, samplerate: int, cancel: Optional[threading.Event] = None) -> Transcript:
+        racers = []
+        for b in self.backends:
+            stop = threading.Event()
+            racers.append((b.name, lambda b=b, stop=stop: b.transcribe(pcm, samplerate, cancel=stop), stop.set))
+        return self._race(racers)
+
+    def start_stream(self, samplerate: int) -> "HedgedSession":
+        return HedgedSession(self, samplerate)
+
+    def report(self) -> str:
+        with self._lock:
+            wins = ", ".join(f"{k} {v}" for k, v in self.wins.items())
+            saved = sum(self.saved) / len(self.saved) * 1000 if self.saved else 0.0
+            return (f"{self.turns} turns, wins: {wins}, avg saved {saved:.0f} ms over {len(self.saved)} turns "
+                    f"({self.saved_bounds} at least), {self.cancelled} losers cancelled")
+
+    def _settle(self, race: dict):
+        """Record the turn's saved latency once both the winner and the first backend are known (under _lock)."""
+        if race["winner"] is None or race["primary"] is None or race.get("settled"):
+            return
+        race["settled"] = True
+        primary, complete = race["primary"]
+        saved = max(0.0, primary - race["winner"])
+        self.saved.append(saved)
+        self.saved_bounds += not complete
+        if race["winner_name"] != race["primary_name"]:
+            print(f"[STT] Hedging saved {'at least ' if not complete else ''}{saved * 1000:.0f} ms "
+                  f"vs {race['primary_name']}", flush=True)
+
+    def _race(self, racers) -> Transcript:
+        """racers: (name, fn, stop) — fn() transcribes, stop() asks a running fn() to give up."""
+        start = time.perf_counter()
+        results: queue.Queue = queue.Queue()
+        finished = {}
+        futures = {}
+        # The first backend may return after the turn is decided; whichever comes last settles it
+        race = {"primary_name": racers[0][0], "primary": None, "winner_name": None, "winner": None}
+
+        def run(name, fn):
+            outcome = None
+            try:
+                transcript = fn()
+                transcript.latency = time.perf_counter() - start
+                results.put((name, transcript, None))
+                outcome = (transcript.latency, True)
+            except STTCancelled:
+                outcome = (time.perf_counter() - start, False)
+                results.put((name, None, STTCancelled()))
+            except Exception as e:
+                results.put((name, None, e))
+            if name == race["primary_name"] and outcome is not None:
+                with self._lock:
+                    race["primary"] = outcome
+                    self._settle(race)
+
+        def launch(name, fn, stop):
+            futures[name] = self._pool.submit(run, name, fn)
+
+        launch(*racers[0])
+        launched = 1
+        deadline = start + self.hedge_delay
+        winner = None
+        errors = []
+        while winner is None and len(finished) < len(racers):
+            timeout = max(0.0, deadline - time.perf_counter()) if launched < len(racers) else None
+            try:
+                name, transcript, error = results.get(timeout=timeout)
+            except queue.Empty:
+                # Hedge delay passed without a confident answer: fire the rest
+                for racer in racers[launched:]:
+                    launch(*racer)
+                launched = len(racers)
+                continue
+            finished[name] = transcript
+            if error is not None:
+                errors.append(error)
+                if launched < len(racers):
+                    deadline = time.perf_counter()  # primary failed, hedge now
+                continue
+            if transcript.confidence >= self.min_confidence:
+                winner = transcript
+            elif launched < len(racers):
+                deadline = time.perf_counter()  # not confident enough, hedge now
+
+        # First good result is in: the others stop instead of running to completion
+        losers = 0
+        for name, _, stop in racers:
+            if name in finished:
+                continue
+            future = futures.get(name)
+            if future is not None and not future.cancel():
+                losers += 1   # already running: ask it to give up
+            stop()
+
+        if winner is None:
+            candidates = [t for t in finished.values() if t is not None]
+            if not candidates:
+                request_errors = [e for e in errors if isinstance(e, sr.RequestError)]
+                raise request_errors[0] if request_errors else sr.UnknownValueError()
+            winner = max(candidates, key=lambda t: t.confidence)
+
+        with self._lock:
+            self.turns += 1
+            self.cancelled += losers
+            self.wins[winner.backend] = self.wins.get(winner.backend, 0) + 1
+            race["winner_name"], race["winner"] = winner.backend, winner.latency
+            self._settle(race)
+        print(
+            f"[STT] Hedge winner: {winner.backend} after {winner.latency * 1000:.0f} ms"
+            + (f", cancelled {losers}" if losers else ""),
+            flush=True,
+        )
+        return winner
+
+
+class HedgedSession(StreamingSession):
+    """Feeds streaming backends live and buffers audio for the others."""
+
+    def __init__(self, hedged: HedgedSTT, samplerate: int):
+        self.hedged = hedged
+        self.samplerate = samplerate
+        self.sessions = {b.name: b.start_stream(samplerate) for b in hedged.backends if b.streaming}
+        self._pcm = bytearray()
+
+    def accept(self, pcm: bytes) -> Optional[str]:
+        self._pcm.extend(pcm)
+        partial = None
+        for session in self.sessions.values():
+            partial = session.accept(pcm) or partial
+        return partial
+
+    def close(self):
+        for session in self.sessions.values():
+            session.close()
+
+    def finish(self) -> Transcript:
+        pcm = bytes(self._pcm)
+        racers = []
+        for b in self.hedged.backends:
+            if b.name in self.sessions:
+                session = self.sessions[b.name]
+                racers.append((b.name, session.finish, session.close))
+            else:
+                stop = threading.Event()
+                racers.append((b.name, lambda b=b, stop=stop: b.transcribe(pcm, self.samplerate, cancel=stop),
+                               stop.set))
+        return self.hedged._race(racers)
+
+
+BACKENDS = {
+    "google": GoogleSTT,
+    "vosk": VoskSTT,
+}
+
+
+def create_backend(name: str, **kwargs) -> STTBackend:
+    """A single backend by name, or HedgedSTT for a comma list like "google,vosk"."""
+    if "," in name:
+        names = [n.strip() for n in name.split(",") if n.strip()]
+        return HedgedSTT([create_backend(n) for n in names], **kwargs)
+    try:
+        return BACKENDS[name.lower()](**kwargs)
+    except KeyError:
+        raise ValueError(f"Unknown STT backend '{name}' (choose from {', '.join(BACKENDS)})")
@@ -0,0 +1,183 @@
+"""
+Content-addressed on-disk cache for synthesized speech.
+
+Entries are keyed by a hash of (text, voice_id, model_id, output_format) and
+evicted least-recently-used once the cache grows past max_bytes. Repeated
+phrases ("Good bye, sir", "Volume set to 50%", fallback apologies) then play
+from disk in milliseconds instead of a fresh ElevenLabs round trip.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Iterable, Iterator, Optional
+
+DEFAULT_MAX_BYTES = 100 * 1024 * 1024
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.split())
+
+
+class TTSCache:
+    """LRU audio cache stored as <sha256>.audio files in one directory."""
+
+    def __init__(self, directory: str = ".cache/tts", max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, int]" = OrderedDict()  # key -> size, oldest first
+        self._total = 0
+        self._load_index()
+
+    # ────────────────────────────────────────────────
+    #  Keys & index
+    # ────────────────────────────────────────────────
+
+    @staticmethod
+    def key(text: str, voice_id: str, model_id: str, output_format: str = "") -> str:
+        raw = "\0".join([_normalize(text), voice_id, model_id, output_format])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.audio")
+
+    def _load_index(self):
+        """Rebuild LRU order from file mtimes (touched on every hit)."""
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            files = []
+            for name in os.listdir(self.directory):
+                if not name.endswith(".audio"):
+                    continue
+                st = os.stat(os.path.join(self.directory, name))
+                files.append((st.st_mtime, name[:-len(".audio")], st.st_size))
+        except OSError as e:
+            print(f"[TTS CACHE] Could not read cache dir: {e}", flush=True)
+            return
+        for _, key, size in sorted(files):
+            self._entries[key] = size
+            self._total += size
+
+    # ────────────────────────────────────────────────
+    #  Lookup / store
+    # ────────────────────────────────────────────────
+
+    def get(self, text: str, voice_id: str, model_id: str, output_format: str = "") -> Optional[bytes]:
+        key = self.key(text, voice_id, model_id, output_format)
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+            try:
+                with open(self._path(key), "rb") as f:
+                    data = f.read()
+                os.utime(self._path(key))
+            except OSError:
+                self._total -= self._entries.pop(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def put(self, text: str, voice_id: str, model_id: str, output_format: str, data: bytes):
+        if not data or len(data) > self.max_bytes:
+            return
+        key = self.key(text, voice_id, model_id, output_format)
+        path = self._path(key)
+        with self._lock:
+            try:
+                tmp = f"{path}.{threading.get_ident()}.tmp"
+                with open(tmp, "wb") as f:
+                    f.write(data)
+                os.replace(tmp, path)
+            except OSError as e:
+                print(f"[TTS CACHE] Write failed: {e}", flush=True)
+                return
+            self._total -= self._entries.pop(key, 0)
+            self._entries[key] = len(data)
+            self._total += len(data)
+            self._evict()
+
+    def _evict(self):
+        while self._total > self.max_bytes and self._entries:
+            key, size = self._entries.popitem(last=False)
+            self._total -= size
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+
+    def __contains__(self, item) -> bool:
+        return self.key(*item) in self._entries
+
+    def tee(
+        self,
+        chunks: Iterable[bytes],
+        text: str,
+        voice_id: str,
+        model_id: str,
+        output_format: str = "",
+    ) -> Iterator[bytes]:
+        """Pass chunks through while collecting them; store only if the stream completes."""
+        collected = []
+        for chunk in chunks:
+            collected.append(chunk)
+            yield chunk
+        self.put(text, voice_id, model_id, output_format, b"".join(collected))
+
+    # ────────────────────────────────────────────────
+    #  Warm-up & reporting
+    # ────────────────────────────────────────────────
+
+    def presynthesize(
+        self,
+        phrases: Iterable[str],
+        synthesize: Callable[[str], bytes],
+        voice_id: str,
+        model_id: str,
+        output_format: str = "",
+        background: bool = True,
+    ) -> Optional[threading.Thread]:
+        """Synthesize phrases that aren't cached yet (in a daemon thread by default)."""
+        def run():
+            done = 0
+            for phrase in phrases:
+                if (phrase, voice_id, model_id, output_format) in self:
+                    continue
+                try:
+                    self.put(phrase, voice_id, model_id, output_format, synthesize(phrase))
+                    done += 1
+                except Exception as e:
+                    print(f"[TTS CACHE] Pre-synthesis failed for '{phrase}': {e}", flush=True)
+            print(f"[TTS CACHE] Pre-synthesized {done} phrases ({len(self._entries)} cached)", flush=True)
+
+        if not background:
+            run()
+            return None
+        thread = threading.Thread(target=run, name="tts-presynth", daemon=True)
+        thread.start()
+        return thread
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self._entries),
+            "bytes": self._total,
+        }
+
+    def report(self) -> str:
+        s = self.stats()
+        return (
+            f"{s['hits']}/{s['hits'] + s['misses']} hits ({s['hit_rate']:.0%}), "
+            f"{s['entries']} entries, {s['bytes'] / 1024 / 1024:.1f} MB"
+        )
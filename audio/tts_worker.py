@@ -0,0 +1,485 @@
+"""
+Long-lived TTS worker.
+
+Owns one initialized engine per backend (ElevenLabs client, local pyttsx3
+voice, or a dummy engine for headless runs), takes utterances from a
+priority queue, synthesizes the next utterance while the current one plays,
+supports cancellation and records per-utterance timings.
+"""
+
+from __future__ import annotations
+
+import itertools
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+
+import numpy as np
+
+from audio.decode import dump_debug_audio
+
+# Priorities: lower runs first
+PRIORITY_URGENT = 0
+PRIORITY_NORMAL = 5
+PRIORITY_BACKGROUND = 9
+
+_STOP = object()
+
+
+class _WarmUp:
+    """Queue marker: start the engines on their own threads, then set `done`."""
+
+    def __init__(self):
+        self.done = threading.Event()
+
+
+# ============ Utterances ============
+
+@dataclass(eq=False)
+class Utterance:
+    text: str
+    priority: int = PRIORITY_NORMAL
+    stream: bool = False
+    cacheable: bool = False         # fixed phrase / template answer: worth keeping in the TTS cache
+    id: int = 0
+    engine: str = ""
+    timings: dict = field(default_factory=dict)
+    error: Optional[Exception] = None
+    _cancel: threading.Event = field(default_factory=threading.Event, repr=False)
+    _done: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def cancel(self):
+        self._cancel.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._done.wait(timeout)
+
+    def report(self) -> dict:
+        """Timings in ms: queue wait, synthesis, time to first audio, playback."""
+        t = self.timings
+
+        def span(a, b):
+            if a in t and b in t:
+                return (t[b] - t[a]) * 1000.0
+            return None
+
+        return {
+            "queue_ms": span("queued", "synth_start"),
+            "synth_ms": span("synth_start", "synth_end"),
+            "first_audio_ms": span("queued", "first_audio"),
+            "play_ms": span("play_start", "play_end"),
+        }
+
+
+# ============ Engines ============
+
+class _Prefetch:
+    """
+    Reads a chunk iterator (a streamed HTTP response) on its own thread into
+    a bounded queue. Creating it waits for the first chunk, so the request
+    is made, and fails, on the synth thread; the rest keeps downloading
+    while the previous utterance plays. close() stops the reader.
+    """
+
+    def __init__(self, chunks, max_chunks: int = 64):
+        self._q: queue.Queue = queue.Queue(maxsize=max_chunks)
+        self._stop = threading.Event()
+        threading.Thread(target=self._run, args=(iter(chunks),), name="tts-fetch", daemon=True).start()
+        self._first = self._q.get()
+        if isinstance(self._first, Exception):
+            raise self._first
+
+    def _put(self, item) -> bool:
+        while not self._stop.is_set():
+            try:
+                self._q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _run(self, chunks):
+        end = _STOP
+        try:
+            for chunk in chunks:
+                if not self._put(chunk):
+                    return
+        except Exception as e:
+            end = e
+        finally:
+            if hasattr(chunks, "close"):
+                chunks.close()   # a cache tee stopped early stores nothing
+        self._put(end)
+
+    def __iter__(self):
+        item = self._first
+        while item is not _STOP:
+            if isinstance(item, Exception):
+                raise item
+            yield item
+            item = self._q.get()
+
+    def close(self):
+        self._stop.set()
+
+
+class TTSEngine:
+    """
+    Backend interface. Engines either render audio (synthesize → PCM bytes or
+    a chunk iterator) or speak directly on the playback thread (direct=True).
+    """
+
+    name = "base"
+    direct = False
+
+    def __init__(self):
+        self._started = False
+
+    def ensure_started(self):
+        if not self._started:
+            self.start()
+            self._started = True
+
+    def start(self):
+        """One-time initialization, done lazily on the thread that uses the engine."""
+
+    def synthesize(self, text: str, stream: bool = False, cacheable: bool = False):
+        raise NotImplementedError
+
+    def speak(self, text: str):
+        raise NotImplementedError
+
+    def stop(self):
+        """Interrupt a direct speak() in progress."""
+
+
+class ElevenLabsEngine(TTSEngine):
+    """ElevenLabs client rendering raw PCM (cached via TTSCache when given)."""
+
+    name = "elevenlabs"
+
+    def __init__(self, client, voice_id: str, model_id: str, output_format: str = "pcm_22050", cache=None):
+        super().__init__()
+        self.client = client
+        self.voice_id = voice_id
+        self.model_id = model_id
+        self.output_format = output_format
+        self.cache = cache
+
+    def synthesize(self, text: str, stream: bool = False, cacheable: bool = False):
+        if self.cache is not None:
+            cached = self.cache.get(text, self.voice_id, self.model_id, self.output_format)
+            if cached is not None:
+                return cached
+        # One-off LLM sentences are looked up but never stored: they would
+        # evict the fixed phrases and template answers the cache is for
+        cache = self.cache if cacheable else None
+
+        if stream:
+            chunks = self.client.text_to_speech.stream(
+                text=text,
+                voice_id=self.voice_id,
+                model_id=self.model_id,
+                output_format=self.output_format,
+            )
+            if cache is not None:
+                chunks = cache.tee(chunks, text, self.voice_id, self.model_id, self.output_format)
+            # The SDK call is lazy: start the request here, not when playback first iterates it
+            return _Prefetch(chunks)
+
+        audio_stream = self.client.text_to_speech.convert(
+            text=text,
+            voice_id=self.voice_id,
+            model_id=self.model_id,
+            output_format=self.output_format,
+        )
+        pcm = b"".join(chunk for chunk in audio_stream)
+        dump_debug_audio(pcm, "pcm")
+        if cache is not None:
+            cache.put(text, self.voice_id, self.model_id, self.output_format, pcm)
+        return pcm
+
+
+class Pyttsx3Engine(TTSEngine):
+    """Local SAPI voice, initialized once (voice lookup included)."""
+
+    name = "pyttsx3"
+    direct = True
+
+    def __init__(self, driver: Optional[str] = "sapi5", voice_hint: str = "zira", rate: int = 165):
+        super().__init__()
+        self.driver = driver
+        self.voice_hint = voice_hint
+        self.rate = rate
+        self.engine = None
+
+    def start(self):
+        import pyttsx3
+        self.engine = pyttsx3.init(self.driver)
+        self.engine.setProperty("rate", self.rate)
+        self.engine.setProperty("volume", 1.0)
+        for v in self.engine.getProperty("voices"):
+            if self.voice_hint in v.name.lower():
+                self.engine.setProperty("voice", v.id)
+                break
+
+    def speak(self, text: str):
+        self.engine.say(text)
+        self.engine.runAndWait()
+
+    def stop(self):
+        if self.engine is not None:
+            self.engine.stop()
+
+
+class DummyEngine(TTSEngine):
+    """
+    Offline stand-in: renders a quiet tone whose length follows the text
+    (160 words per minute) after a configurable synthesis delay.
+    """
+
+    name = "dummy"
+
+    def __init__(self, samplerate: int = 22050, latency_s: float = 0.0, wpm: float = 160.0):
+        super().__init__()
+        self.samplerate = samplerate
+        self.latency_s = latency_s
+        self.wpm = wpm
+
+    def synthesize(self, text: str, stream: bool = False, cacheable: bool = False):
+        if self.latency_s:
+            time.sleep(self.latency_s)
+        seconds = max(0.2, len(text.split()) / self.wpm * 60.0)
+        t = np.arange(int(seconds * self.samplerate)) / self.samplerate
+        tone = 0.05 * np.sin(2 * np.pi * 220.0 * t)
+        return (tone * 32767).astype(np.int16).tobytes()
+
+
+# ============ Worker ============
+
+class TTSWorker:
+    """
+    Two threads: `tts-synth` renders queued utterances in priority order,
+    `tts-play` plays rendered audio through the StreamPlayer. Engines are
+    tried in order; the first that succeeds wins.
+    """
+
+    def __init__(
+        self,
+        engines: List[TTSEngine],
+        player,
+        on_play_start: Optional[Callable[[Utterance], None]] = None,
+        on_play_end: Optional[Callable[[Utterance], None]] = None,
+        max_rendered: int = 3,
+    ):
+        self.engines = engines
+        self.player = player
+        self.on_play_start = on_play_start
+        self.on_play_end = on_play_end
+        self._seq = itertools.count(1)
+        self._synth_q: queue.PriorityQueue = queue.PriorityQueue()
+        self._play_q: queue.PriorityQueue = queue.PriorityQueue(maxsize=max_rendered)
+        self._lock = threading.Lock()
+        self._pending: List[Utterance] = []
+        self._current: Optional[Utterance] = None
+        self._current_engine: Optional[TTSEngine] = None
+        self._threads: List[threading.Thread] = []
+
+    # ────────────────────────────────────────────────
+    #  Public API
+    # ────────────────────────────────────────────────
+
+    def start(self):
+        if self._threads:
+            return
+        for name, target in (("tts-synth", self._synth_loop), ("tts-play", self._play_loop)):
+            thread = threading.Thread(target=target, name=name, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def say(self, text: str, priority: int = PRIORITY_NORMAL, stream: bool = False,
+            cacheable: bool = False) -> Utterance:
+        """
+        Queue text for speech; returns immediately with a handle to wait on.
+        cacheable: store the rendered audio in the engine's TTS cache.
+        """
+        self.start()
+        seq = next(self._seq)
+        utt = Utterance(text=text, priority=priority, stream=stream, cacheable=cacheable, id=seq)
+        utt.timings["queued"] = time.perf_counter()
+        with self._lock:
+            self._pending.append(utt)
+        self._synth_q.put((priority, seq, utt))
+        return utt
+
+    def warm_up(self) -> threading.Event:
+        """
+        Initialize every engine on the thread that will use it (pyttsx3 init
+        and voice lookup happen on tts-play) ahead of the first utterance.
+        Returns an Event that is set once they are ready (or have failed).
+        """
+        self.start()
+        marker = _WarmUp()
+        self._synth_q.put((PRIORITY_URGENT, next(self._seq), marker))
+        return marker.done
+
+    def cancel(self, utt: Utterance):
+        utt.cancel()
+        with self._lock:
+            current = self._current is utt
+            if current and self._current_engine is not None and self._current_engine.direct:
+                self._current_engine.stop()
+        if not current:
+            # Not playing yet: release waiters now instead of when the synth queue reaches it
+            self._finish(utt)
+
+    def cancel_all(self):
+        """Drop everything queued and stop what is playing now."""
+        with self._lock:
+            pending = list(self._pending)
+        for utt in pending:
+            self.cancel(utt)
+
+    def playing_direct(self) -> bool:
+        """True while a direct engine (e.g. pyttsx3) is speaking, bypassing the player."""
+        with self._lock:
+            return self._current_engine is not None and self._current_engine.direct
+
+    def is_busy(self) -> bool:
+        with self._lock:
+            return bool(self._pending)
+
+    def shutdown(self, timeout: float = 2.0):
+        self.cancel_all()
+        self._synth_q.put((-1, 0, _STOP))
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    # ────────────────────────────────────────────────
+    #  Threads
+    # ────────────────────────────────────────────────
+
+    def _finish(self, utt: Utterance):
+        with self._lock:
+            if utt in self._pending:
+                self._pending.remove(utt)
+        utt._done.set()
+
+    def _start_engines(self, direct: bool):
+        for engine in self.engines:
+            if engine.direct == direct:
+                try:
+                    engine.ensure_started()
+                except Exception as e:
+                    print(f"[TTS] {engine.name} failed to start: {e}", flush=True)
+
+    def _synth_loop(self):
+        while True:
+            _, seq, utt = self._synth_q.get()
+            if utt is _STOP:
+                self._play_q.put((-1, 0, _STOP, None, None))
+                return
+            if isinstance(utt, _WarmUp):
+                self._start_engines(direct=False)
+                self._play_q.put((PRIORITY_URGENT, seq, utt, None, None))
+                continue
+            if utt.cancelled:
+                self._finish(utt)
+                continue
+
+            utt.timings["synth_start"] = time.perf_counter()
+            engine, audio = None, None
+            for candidate in self.engines:
+                try:
+                    if candidate.direct:
+                        engine = candidate  # started and spoken on the playback thread
+                        break
+                    candidate.ensure_started()
+                    audio = candidate.synthesize(utt.text, stream=utt.stream, cacheable=utt.cacheable)
+                    engine = candidate
+                    break
+                except Exception as e:
+                    print(f"[TTS] {candidate.name} failed: {e}", flush=True)
+                    utt.error = e
+            utt.timings["synth_end"] = time.perf_counter()
+
+            if engine is None:
+                print(f"[TTS] No engine could speak #{utt.id}", flush=True)
+                self._finish(utt)
+                continue
+            utt.engine = engine.name
+            self._play_q.put((utt.priority, seq, utt, engine, audio))
+
+    def _play_loop(self):
+        while True:
+            _, _, utt, engine, audio = self._play_q.get()
+            if utt is _STOP:
+                return
+            if isinstance(utt, _WarmUp):
+                self._start_engines(direct=True)
+                utt.done.set()
+                continue
+            if utt.cancelled:
+                if isinstance(audio, _Prefetch):
+                    audio.close()
+                self._finish(utt)
+                continue
+
+            with self._lock:
+                self._current, self._current_engine = utt, engine
+
+            def first_audio():
+                utt.timings["first_audio"] = time.perf_counter()
+                if self.on_play_start is not None:
+                    self.on_play_start(utt)
+
+            utt.timings["play_start"] = time.perf_counter()
+            try:
+                if engine.direct:
+                    engine.ensure_started()
+                    first_audio()
+                    engine.speak(utt.text)
+                else:
+                    chunks = [audio] if isinstance(audio, (bytes, bytearray)) else audio
+                    try:
+                        self.player.play_chunks(chunks, on_first_audio=first_audio, cancel=utt._cancel)
+                    finally:
+                        if isinstance(audio, _Prefetch):
+                            audio.close()
+            except Exception as e:
+                print(f"[TTS] Playback failed for #{utt.id}: {e}", flush=True)
+                utt.error = e
+                # A streamed response can fail before any audio — fall back to a local voice
+                fallback = next((c for c in self.engines if c.direct and c is not engine), None)
+                if "first_audio" not in utt.timings and fallback is not None and not utt.cancelled:
+                    try:
+                        with self._lock:
+                            self._current_engine = fallback
+                        fallback.ensure_started()
+                        first_audio()
+                        fallback.speak(utt.text)
+                        utt.engine = fallback.name
+                    except Exception as e2:
+                        print(f"[TTS] {fallback.name} failed: {e2}", flush=True)
+            utt.timings["play_end"] = time.perf_counter()
+
+            with self._lock:
+                self._current, self._current_engine = None, None
+
+            r = utt.report()
+            print(
+                f"[TTS] #{utt.id} {utt.engine}: synth {r['synth_ms'] or 0:.0f} ms, "
+                f"first audio {r['first_audio_ms'] or 0:.0f} ms, play {r['play_ms'] or 0:.0f} ms"
+                f"{' (cancelled)' if utt.cancelled else ''}",
+                flush=True,
+            )
+            if self.on_play_end is not None:
+                self.on_play_end(utt)
+            self._finish(utt)
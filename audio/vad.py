@@ -0,0 +1,260 @@
+"""
+Local voice-activity detection and utterance endpointing.
+
+Frame-level energy + zero-crossing rate (optionally speech-band energy)
+decide speech/non-speech; a small state machine turns that into utterances
+with a pre-roll so the first syllable isn't clipped and a configurable
+hangover so the utterance is handed off as soon as the user stops talking.
+"""
+
+from __future__ import annotations
+
+import queue
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import numpy as np
+
+from audio.capture import NoiseFloorTracker, frame_rms
+
+
+@dataclass
+class VADConfig:
+    frame_ms: int = 20
+    energy_ratio: float = 3.0       # speech must be this many times the noise floor
+    min_energy: float = 150.0       # absolute floor in int16 RMS units
+    zcr_max: float = 0.45           # above this a frame is treated as hiss, not voice
+    strong_ratio: float = 10.0      # frames this loud count regardless of ZCR
+    spectral: bool = False          # also require energy concentrated in 300-3400 Hz
+    band_ratio_min: float = 0.45
+    start_ms: int = 60              # consecutive speech needed to open an utterance
+    hangover_ms: int = 350          # trailing silence that closes it
+    preroll_ms: int = 300
+    min_speech_ms: int = 150
+    max_utterance_s: float = 15.0
+
+
+@dataclass
+class Segment:
+    samples: np.ndarray             # int16, including pre-roll
+    samplerate: int
+    start_pos: int                  # ring position of the first sample (pre-roll included)
+    speech_start_pos: int
+    speech_end_pos: int             # end of the last speech frame
+    detected_pos: int               # ring position at which the endpoint was decided
+
+    @property
+    def duration(self) -> float:
+        return len(self.samples) / self.samplerate
+
+    @property
+    def endpoint_delay(self) -> float:
+        """Seconds of audio between the end of speech and the hand-off."""
+        return (self.detected_pos - self.speech_end_pos) / self.samplerate
+
+    def to_bytes(self) -> bytes:
+        return self.samples.tobytes()
+
+
+def zero_crossing_rate(frame: np.ndarray) -> float:
+    if len(frame) < 2:
+        return 0.0
+    signs = np.signbit(frame)
+    return float(np.count_nonzero(signs[1:] != signs[:-1])) / (len(frame) - 1)
+
+
+def speech_band_ratio(frame: np.ndarray, samplerate: int) -> float:
+    """Fraction of frame energy between 300 and 3400 Hz."""
+    spectrum = np.abs(np.fft.rfft(frame.astype(np.float32))) ** 2
+    freqs = np.fft.rfftfreq(len(frame), 1.0 / samplerate)
+    total = float(spectrum.sum())
+    if total <= 0:
+        return 0.0
+    band = spectrum[(freqs >= 300) & (freqs <= 3400)].sum()
+    return float(band) / total
+
+
+class VoiceActivityDetector:
+    """Per-frame speech decision against a noise floor."""
+
+    def __init__(self, samplerate: int, config: Optional[VADConfig] = None):
+        self.samplerate = samplerate
+        self.config = config or VADConfig()
+
+    def is_speech(self, frame: np.ndarray, noise_floor: float, rms: Optional[float] = None) -> bool:
+        c = self.config
+        rms = frame_rms(frame) if rms is None else rms
+        threshold = max(c.min_energy, noise_floor * c.energy_ratio)
+        if rms < threshold:
+            return False
+        if rms < noise_floor * c.strong_ratio and zero_crossing_rate(frame) > c.zcr_max:
+            return False
+        if c.spectral and speech_band_ratio(frame, self.samplerate) < c.band_ratio_min:
+            return False
+        return True
+
+
+class UtteranceSegmenter:
+    """
+    Feed consecutive frames; returns a Segment the moment an utterance ends.
+    The noise floor is only updated on non-speech frames.
+    """
+
+    def __init__(self, samplerate: int, config: Optional[VADConfig] = None,
+                 noise: Optional[NoiseFloorTracker] = None):
+        self.samplerate = samplerate
+        self.config = config or VADConfig()
+        self.vad = VoiceActivityDetector(samplerate, self.config)
+        self.noise = noise or NoiseFloorTracker()
+        c = self.config
+        self._start_frames = max(1, c.start_ms // c.frame_ms)
+        self._hangover_frames = max(1, c.hangover_ms // c.frame_ms)
+        self._min_speech_frames = max(1, c.min_speech_ms // c.frame_ms)
+        self._preroll: deque = deque(maxlen=max(1, c.preroll_ms // c.frame_ms))
+        self.on_speech_start: Optional[Callable[[], None]] = None
+        # Receives utterance audio as it is captured (pre-roll first) for streaming STT
+        self.on_speech_audio: Optional[Callable[[np.ndarray], None]] = None
+        self.reset()
+
+    def reset(self):
+        self._preroll.clear()
+        self._frames = []
+        self._in_speech = False
+        self._run = 0
+        self._silence = 0
+        self._speech_frames = 0
+        self._start_pos = 0
+        self._speech_start = 0
+        self._speech_end = 0
+
+    @property
+    def in_speech(self) -> bool:
+        return self._in_speech
+
+    def feed(self, frame: np.ndarray, end_pos: int) -> Optional[Segment]:
+        """end_pos: ring position just after this frame."""
+        rms = frame_rms(frame)
+        speech = self.vad.is_speech(frame, self.noise.floor, rms)
+        frame_start = end_pos - len(frame)
+
+        if not self._in_speech:
+            self._preroll.append((frame, frame_start))
+            if not speech:
+                self.noise.update(rms)
+                self._run = 0
+                return None
+            self._run += 1
+            if self._run < self._start_frames:
+                return None
+            # Open an utterance, pulling in the pre-roll (which includes the onset frames)
+            self._in_speech = True
+            self._frames = [f for f, _ in self._preroll]
+            self._start_pos = self._preroll[0][1]
+            self._speech_start = end_pos - self._run * len(frame)
+            self._speech_end = end_pos
+            self._speech_frames = self._run
+            self._silence = 0
+            self._preroll.clear()
+            if self.on_speech_start is not None:
+                self.on_speech_start()
+            if self.on_speech_audio is not None:
+                self.on_speech_audio(np.concatenate(self._frames))
+            return None
+
+        self._frames.append(frame)
+        if self.on_speech_audio is not None:
+            self.on_speech_audio(frame)
+        if speech:
+            self._silence = 0
+            self._speech_frames += 1
+            self._speech_end = end_pos
+        else:
+            self._silence += 1
+            self.noise.update(rms)
+
+        too_long = (end_pos - self._start_pos) >= self.config.max_utterance_s * self.samplerate
+        if self._silence < self._hangover_frames and not too_long:
+            return None
+
+        enough = self._speech_frames >= self._min_speech_frames
+        segment = None
+        if enough:
+            segment = Segment(
+                samples=np.concatenate(self._frames),
+                samplerate=self.samplerate,
+                start_pos=self._start_pos,
+                speech_start_pos=self._speech_start,
+                speech_end_pos=self._speech_end,
+                detected_pos=end_pos,
+            )
+        self.reset()
+        return segment
+
+
+def listen_for_utterance(
+    engine,
+    segmenter: UtteranceSegmenter,
+    start_timeout: float = 5.0,
+    on_speech_start: Optional[Callable[[], None]] = None,
+    on_speech_audio: Optional[Callable[[np.ndarray], None]] = None,
+    from_pos: Optional[int] = None,
+) -> Optional[Segment]:
+    """
+    Segment the next utterance from a running CaptureEngine. Returns None if
+    nobody is speaking when start_timeout runs out, and never waits past one
+    deadline (start_timeout + max utterance + 1 s) fixed when the turn
+    starts, however many too-short blips were rejected on the way. from_pos
+    replays audio already in the ring (e.g. speech that interrupted
+    playback) first.
+    """
+    results: queue.Queue = queue.Queue()
+    next_pos = [from_pos]
+
+    def on_start():
+        if on_speech_start is not None:
+            on_speech_start()
+
+    def on_frame(frame, end_pos):
+        frame_start = end_pos - len(frame)
+        if next_pos[0] is not None:
+            # Catch up on the backlog from the capture thread so no frame is fed twice
+            pos, next_pos[0] = next_pos[0], None
+            while pos + len(frame) <= frame_start:
+                segment = segmenter.feed(engine.read(pos, pos + len(frame)), pos + len(frame))
+                pos += len(frame)
+                if segment is not None:
+                    results.put(segment)
+                    return
+        segment = segmenter.feed(frame, end_pos)
+        if segment is not None:
+            results.put(segment)
+
+    segmenter.reset()
+    segmenter.on_speech_start = on_start
+    segmenter.on_speech_audio = on_speech_audio
+    engine.add_listener(on_frame)
+    try:
+        start_deadline = time.monotonic() + start_timeout
+        deadline = start_deadline + segmenter.config.max_utterance_s + 1.0
+        while True:
+            now = time.monotonic()
+            if now >= deadline:
+                return None
+            if now < start_deadline:
+                timeout = start_deadline - now
+            elif segmenter.in_speech:
+                # Past the start timeout only an utterance in progress keeps us here;
+                # poll so a blip that gets rejected ends the wait
+                timeout = min(deadline - now, 0.1)
+            else:
+                return None
+            try:
+                return results.get(timeout=timeout)
+            except queue.Empty:
+                continue
+    finally:
+        engine.remove_listener(on_frame)
+        segmenter.on_speech_start = None
+        segmenter.on_speech_audio = None
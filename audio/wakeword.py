@@ -0,0 +1,287 @@
+"""
+Always-on wake word ("Rex") on the persistent capture stream.
+
+Cheap frame energy gating (the same VAD used for endpointing) keeps the
+detector asleep through silence; only short bursts of speech are turned into
+MFCC features and matched against a handful of enrolled recordings with
+subsequence DTW. Optionally, a Vosk keyword grammar can do the matching.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from typing import Callable, List, Optional, Sequence
+
+import numpy as np
+
+from audio.vad import UtteranceSegmenter, VADConfig
+
+
+# ============ Features ============
+
+_MEL_CACHE = {}
+
+
+def _mel_filterbank(samplerate: int, n_fft: int, n_mels: int) -> np.ndarray:
+    key = (samplerate, n_fft, n_mels)
+    if key not in _MEL_CACHE:
+        def hz_to_mel(hz):
+            return 2595.0 * np.log10(1.0 + hz / 700.0)
+
+        def mel_to_hz(mel):
+            return 700.0 * (10 ** (mel / 2595.0) - 1.0)
+
+        mels = np.linspace(hz_to_mel(60.0), hz_to_mel(samplerate / 2), n_mels + 2)
+        bins = np.floor((n_fft + 1) * mel_to_hz(mels) / samplerate).astype(int)
+        bank = np.zeros((n_mels, n_fft // 2 + 1), dtype=np.float32)
+        for m in range(1, n_mels + 1):
+            lo, mid, hi = bins[m - 1], bins[m], bins[m + 1]
+            if mid > lo:
+                bank[m - 1, lo:mid] = (np.arange(lo, mid) - lo) / (mid - lo)
+            if hi > mid:
+                bank[m - 1, mid:hi] = (hi - np.arange(mid, hi)) / (hi - mid)
+        dct = np.cos(np.pi / n_mels * (np.arange(n_mels) + 0.5)[None, :] * np.arange(n_mels)[:, None])
+        _MEL_CACHE[key] = (bank, dct.astype(np.float32))
+    return _MEL_CACHE[key]
+
+
+def mfcc(samples: np.ndarray, samplerate: int = 16000, n_mfcc: int = 13,
+         win_ms: int = 25, hop_ms: int = 10, n_mels: int = 26) -> np.ndarray:
+    """
+    (frames, n_mfcc - 1) cepstra. c0 is dropped so overall gain doesn't
+    matter; no per-utterance mean normalisation, because a burst may hold
+    the wake word plus the start of a command.
+    """
+    x = samples.astype(np.float32) / 32768.0
+    x = np.append(x[0], x[1:] - 0.97 * x[:-1]) if len(x) else x
+    win = int(samplerate * win_ms / 1000)
+    hop = int(samplerate * hop_ms / 1000)
+    if len(x) < win:
+        return np.zeros((0, n_mfcc - 1), dtype=np.float32)
+    n_frames = 1 + (len(x) - win) // hop
+    idx = np.arange(win)[None, :] + hop * np.arange(n_frames)[:, None]
+    frames = x[idx] * np.hamming(win).astype(np.float32)
+    n_fft = 1 << (win - 1).bit_length()
+    power = np.abs(np.fft.rfft(frames, n_fft)) ** 2
+    bank, dct = _mel_filterbank(samplerate, n_fft, n_mels)
+    return (np.log(power @ bank.T + 1e-10) @ dct[1:n_mfcc].T).astype(np.float32)
+
+
+def subsequence_dtw(template: np.ndarray, query: np.ndarray) -> float:
+    """
+    Best alignment cost of `template` anywhere inside `query`, normalised by
+    template length. Steps advance the template one frame and the query 0-2
+    frames, so each row is computed in one vectorised pass.
+    """
+    if len(template) == 0 or len(query) == 0:
+        return float("inf")
+    cost = np.sqrt(((template[:, None, :] - query[None, :, :]) ** 2).sum(axis=2))
+    acc = cost[0].copy()
+    inf = np.array([np.inf])
+    for i in range(1, len(template)):
+        shifted1 = np.concatenate([inf, acc[:-1]])
+        shifted2 = np.concatenate([inf, inf, acc[:-2]])
+        acc = cost[i] + np.minimum(acc, np.minimum(shifted1, shifted2))
+    return float(acc.min()) / len(template)
+
+
+# ============ Models ============
+
+class WakeWordModel:
+    """Interface: detect(samples) -> bool for one short burst of speech."""
+
+    name = "base"
+    last_score = 0.0
+
+    def detect(self, samples: np.ndarray) -> bool:
+        raise NotImplementedError
+
+
+class DTWWakeModel(WakeWordModel):
+    """A few enrolled recordings of the wake word, matched with DTW on MFCCs."""
+
+    name = "dtw"
+
+    def __init__(self, templates: Sequence[np.ndarray], threshold: float, samplerate: int = 16000):
+        self.templates = [np.asarray(t, dtype=np.float32) for t in templates]
+        self.threshold = threshold
+        self.samplerate = samplerate
+        self.last_score = float("inf")
+
+    @classmethod
+    def enroll(cls, recordings: Sequence[np.ndarray], samplerate: int = 16000,
+               margin: float = 1.25) -> "DTWWakeModel":
+        """
+        Build templates from int16 recordings. The threshold is the worst
+        template-to-template distance times `margin`.
+        """
+        templates = [mfcc(_trim(r, samplerate), samplerate) for r in recordings]
+        templates = [t for t in templates if len(t)]
+        if len(templates) < 2:
+            raise ValueError("need at least two usable wake-word recordings")
+        pairs = [
+            subsequence_dtw(a, b)
+            for i, a in enumerate(templates) for j, b in enumerate(templates) if i != j
+        ]
+        return cls(templates, threshold=max(pairs) * margin, samplerate=samplerate)
+
+    def score(self, samples: np.ndarray) -> float:
+        query = mfcc(samples, self.samplerate)
+        return min(subsequence_dtw(t, query) for t in self.templates)
+
+    def detect(self, samples: np.ndarray) -> bool:
+        self.last_score = self.score(samples)
+        return self.last_score <= self.threshold
+
+    def save(self, path: str):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        arrays = {f"t{i}": t for i, t in enumerate(self.templates)}
+        np.savez(path, threshold=self.threshold, samplerate=self.samplerate, **arrays)
+
+    @classmethod
+    def load(cls, path: str, threshold: Optional[float] = None) -> "DTWWakeModel":
+        with np.load(path) as data:
+            templates = [data[k] for k in sorted(data.files) if k.startswith("t") and k[1:].isdigit()]
+            saved = float(data["threshold"])
+            samplerate = int(data["samplerate"])
+        return cls(templates, threshold if threshold is not None else saved, samplerate)
+
+
+class VoskKeywordModel(WakeWordModel):
+    """Vosk restricted to a one-word grammar; needs REX_VOSK_MODEL."""
+
+    name = "vosk"
+
+    def __init__(self, keyword: str = "rex", model_path: Optional[str] = None, samplerate: int = 16000):
+        import vosk
+        vosk.SetLogLevel(-1)
+        self.keyword = keyword.lower()
+        self.samplerate = samplerate
+        self.model = vosk.Model(model_path or os.getenv("REX_VOSK_MODEL", "models/vosk"))
+        self.grammar = json.dumps([self.keyword, "[unk]"])
+
+    def detect(self, samples: np.ndarray) -> bool:
+        import vosk
+        rec = vosk.KaldiRecognizer(self.model, self.samplerate, self.grammar)
+        rec.AcceptWaveform(samples.astype(np.int16).tobytes())
+        text = json.loads(rec.FinalResult()).get("text", "")
+        self.last_score = 1.0 if self.keyword in text.split() else 0.0
+        return self.last_score > 0
+
+
+def _trim(samples: np.ndarray, samplerate: int, frame_ms: int = 10) -> np.ndarray:
+    """Cut leading/trailing silence from an enrolment recording."""
+    frame = int(samplerate * frame_ms / 1000)
+    n = len(samples) // frame
+    if n == 0:
+        return samples
+    x = samples[:n * frame].astype(np.float32).reshape(n, frame)
+    rms = np.sqrt((x * x).mean(axis=1))
+    active = np.nonzero(rms > 0.1 * rms.max())[0]
+    if len(active) == 0:
+        return samples
+    return samples[active[0] * frame:(active[-1] + 1) * frame]
+
+
+# ============ Listener ============
+
+class WakeWordListener:
+    """
+    Runs on the CaptureEngine's frame callbacks. Each burst of speech is
+    evaluated once, as soon as `window_s` of it has been heard or it ends,
+    so "Rex" fires even when the command follows without a pause.
+    """
+
+    def __init__(self, engine, model: WakeWordModel, on_wake: Optional[Callable[[], None]] = None,
+                 window_s: float = 1.2, config: Optional[VADConfig] = None):
+        self.engine = engine
+        self.model = model
+        self.on_wake = on_wake
+        self.window = int(window_s * engine.samplerate)
+        self.segmenter = UtteranceSegmenter(
+            engine.samplerate,
+            config or VADConfig(hangover_ms=200, preroll_ms=100, min_speech_ms=120, max_utterance_s=window_s),
+        )
+        self.segmenter.on_speech_start = self._on_speech_start
+        self.segmenter.on_speech_audio = self._on_speech_audio
+        self._burst: List[np.ndarray] = []
+        self._burst_len = 0
+        self._evaluated = False
+        self._woke = threading.Event()
+        self._paused = False
+        self._active = False
+        # Stats for the benchmark / idle-CPU report
+        self.cpu_seconds = 0.0
+        self.audio_seconds = 0.0
+        self.evaluations = 0
+        self.detections = 0
+
+    def start(self):
+        if not self._active:
+            self._active = True
+            self.engine.add_listener(self._on_frame)
+
+    def stop(self):
+        self._active = False
+        self.engine.remove_listener(self._on_frame)
+
+    def pause(self):
+        """Ignore audio while a conversation turn owns the microphone."""
+        self._paused = True
+
+    def resume(self):
+        self.segmenter.reset()
+        self._burst = []
+        self._woke.clear()
+        self._paused = False
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the wake word is heard (True) or timeout (False)."""
+        return self._woke.wait(timeout)
+
+    @property
+    def cpu_fraction(self) -> float:
+        """Detector CPU time per second of audio (fraction of one core)."""
+        return self.cpu_seconds / self.audio_seconds if self.audio_seconds else 0.0
+
+    def feed(self, frame: np.ndarray, end_pos: int):
+        """Process one capture frame (also usable without a CaptureEngine)."""
+        start = time.thread_time()
+        self.audio_seconds += len(frame) / self.engine.samplerate
+        segment = self.segmenter.feed(frame, end_pos)
+        if segment is not None or (self.segmenter.in_speech and self._burst_len >= self.window):
+            self._evaluate()
+        self.cpu_seconds += time.thread_time() - start
+
+    def _on_frame(self, frame: np.ndarray, end_pos: int):
+        if not self._paused:
+            self.feed(frame, end_pos)
+
+    def _on_speech_start(self):
+        self._burst = []
+        self._burst_len = 0
+        self._evaluated = False
+
+    def _on_speech_audio(self, samples: np.ndarray):
+        if not self._evaluated and self._burst_len < self.window:
+            self._burst.append(samples)
+            self._burst_len += len(samples)
+
+    def _evaluate(self):
+        if self._evaluated or not self._burst:
+            return
+        self._evaluated = True
+        self.evaluations += 1
+        if not self.model.detect(np.concatenate(self._burst)):
+            return
+        self.detections += 1
+        print(f"[WAKE] Wake word detected (score {self.model.last_score:.2f})", flush=True)
+        self._woke.set()
+        if self.on_wake is not None:
+            try:
+                self.on_wake()
+            except Exception as e:
+                print(f"[WAKE] on_wake error: {e}", flush=True)
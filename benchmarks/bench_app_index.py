@@ -0,0 +1,185 @@
+"""
+Application index (Backend/system/app_index.py): scan, incremental refresh
+and lookup cost on a synthetic install tree.
+
+    python -m benchmarks.bench_app_index [--apps 3000] [--bins 5000] [--system]
+
+The tree has --apps .desktop files spread over nested folders (like
+/usr/share/applications or a Start Menu) and --bins executables in two
+PATH-like folders. Lookups are timed per spoken-name style with the memo
+cleared, so every call runs the matcher (misses don't trigger a rescan
+there); "memoized" repeats a name. An app installed after the index was
+built must be found by the first lookup that misses it.
+A safety check puts poweroff, shutdown, wipefs and false on PATH: near
+names ("power", "shut", "wipe", "files") must not reach them, only their
+exact names do. --system also scans this machine's real sources.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import stat
+import tempfile
+import time
+
+from Backend.system.app_index import AppIndex
+from benchmarks.common import print_table
+
+SYLLABLES = ["ka", "lo", "mi", "ne", "ro", "ta", "vi", "zu", "pe", "sha", "dro", "fen", "gal", "qui", "xo"]
+
+
+def app_name(rng):
+    return " ".join("".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 3))).title()
+                    for _ in range(rng.randint(1, 3)))
+
+
+def build_tree(root, apps, bins, rng):
+    names = []
+    apps_dir = os.path.join(root, "applications")
+    for i in range(apps):
+        sub = os.path.join(apps_dir, f"group{i % 20}", f"sub{i % 3}")
+        os.makedirs(sub, exist_ok=True)
+        name = app_name(rng)
+        names.append(name)
+        with open(os.path.join(sub, f"app{i}.desktop"), "w") as f:
+            f.write(f"[Desktop Entry]\nType=Application\nName={name}\nExec=/opt/app{i}/run %U\n")
+    bin_dirs = [os.path.join(root, "bin"), os.path.join(root, "usr-bin")]
+    for d in bin_dirs:
+        os.makedirs(d, exist_ok=True)
+    for i in range(bins):
+        path = os.path.join(bin_dirs[i % 2], f"tool{i}")
+        with open(path, "w") as f:
+            f.write("#!/bin/sh\n")
+        os.chmod(path, os.stat(path).st_mode | stat.S_IXUSR)
+    sources = [(apps_dir, "desktop", True)] + [(d, "path", False) for d in bin_dirs]
+    return names, sources
+
+
+def spoken_variants(name, rng):
+    words = name.lower().split()
+    squashed = "".join(words)
+    return {
+        "exact": name.lower(),
+        "spaces moved": " ".join(squashed[i:i + 4] for i in range(0, len(squashed), 4)),
+        "sound-alike": squashed.replace("c", "k").replace("qu", "kw").replace("x", "ks"),
+        "prefix": squashed[:max(4, len(squashed) - 3)],
+        "typo": squashed[:-2] + squashed[-1] + squashed[-2],
+    }
+
+
+def time_lookups(index, names, rng, n=2000):
+    rows = {}
+    samples = [spoken_variants(rng.choice(names), rng) for _ in range(n)]
+    for style in samples[0]:
+        hits, times = 0, []
+        for variants in samples:
+            index._memo.clear()
+            start = time.perf_counter()
+            entry = index.find(variants[style])
+            times.append((time.perf_counter() - start) * 1e6)
+            hits += entry is not None
+        rows[style] = (times, hits / n)
+    index.find("memoized name")
+    times = []
+    for _ in range(n):
+        start = time.perf_counter()
+        index.find("memoized name")
+        times.append((time.perf_counter() - start) * 1e6)
+    rows["memoized"] = (times, 1.0)
+    return rows
+
+
+def check_system_tools(root):
+    """Fuzzy matching never lands on a PATH executable; exact names still do."""
+    tools = os.path.join(root, "tools")
+    os.makedirs(tools)
+    for name in ("poweroff", "shutdown", "wipefs", "false"):
+        path = os.path.join(tools, name)
+        with open(path, "w") as f:
+            f.write("#!/bin/sh\n")
+        os.chmod(path, os.stat(path).st_mode | stat.S_IXUSR)
+    index = AppIndex(os.path.join(root, "tools.json"), [(tools, "path", False)])
+    index.refresh()
+    ok = True
+    for spoken in ("power", "shut", "wipe", "files", "power of"):
+        entry = index.find(spoken)
+        fine = entry is None or entry.source != "path"
+        print(f"  {'ok    ' if fine else 'FAILED'} '{spoken}' -> {entry.target if entry else None}")
+        ok &= fine
+    entry = index.find("poweroff")
+    print(f"  {'ok    ' if entry else 'FAILED'} 'poweroff' -> {entry.target if entry else None}")
+    return ok and entry is not None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--apps", type=int, default=3000)
+    parser.add_argument("--bins", type=int, default=5000)
+    parser.add_argument("--system", action="store_true")
+    args = parser.parse_args()
+    rng = random.Random(7)
+
+    with tempfile.TemporaryDirectory() as root:
+        names, sources = build_tree(root, args.apps, args.bins, rng)
+        saved = os.path.join(root, "apps.json")
+        scans = []
+
+        index = AppIndex(saved, sources)
+        start = time.perf_counter()
+        stats = index.refresh()
+        scans.append(("cold scan", [(time.perf_counter() - start) * 1000], stats["rescanned"]))
+
+        fresh = AppIndex(saved, sources, rescan_interval=float("inf"))
+        start = time.perf_counter()
+        fresh.load()
+        scans.append(("load saved index", [(time.perf_counter() - start) * 1000], 0))
+
+        start = time.perf_counter()
+        stats = fresh.refresh()
+        scans.append(("refresh, nothing changed", [(time.perf_counter() - start) * 1000], stats["rescanned"]))
+
+        time.sleep(0.01)
+        with open(os.path.join(root, "applications", "group3", "sub1", "new.desktop"), "w") as f:
+            f.write("[Desktop Entry]\nType=Application\nName=Brand New App\nExec=/opt/new/run\n")
+        start = time.perf_counter()
+        stats = fresh.refresh()
+        scans.append(("refresh, one app installed", [(time.perf_counter() - start) * 1000], stats["rescanned"]))
+
+        print_table(f"Index: {args.apps} .desktop files, {args.bins} executables "
+                    f"({stats['dirs']} directories)", [(label, s) for label, s, _ in scans])
+        for label, _, rescanned in scans:
+            print(f"  {label:<32} rescanned {rescanned} directories")
+        print(f"  found the new app: {fresh.find('brand new app') is not None}")
+
+        late = AppIndex(saved, sources, rescan_interval=0)
+        late.refresh()
+        late.find("late arrival")
+        time.sleep(0.01)
+        with open(os.path.join(root, "applications", "group5", "sub2", "late.desktop"), "w") as f:
+            f.write("[Desktop Entry]\nType=Application\nName=Late Arrival\nExec=/opt/late/run\n")
+        start = time.perf_counter()
+        found = late.find("late arrival")
+        print(f"  installed after the scan, found on the next miss: {found is not None} "
+              f"({(time.perf_counter() - start) * 1000:.1f} ms)")
+
+        rows = time_lookups(fresh, names, rng)
+        print_table("Lookup per spoken name", [(style, t) for style, (t, _) in rows.items()], unit="us")
+        for style, (_, hit) in rows.items():
+            print(f"  {style:<16} found {hit:.0%}")
+
+        print("\nPATH executables by exact name only:")
+        safe = check_system_tools(root)
+
+    if args.system:
+        index = AppIndex(os.path.join(tempfile.gettempdir(), "rex-apps-bench.json"))
+        cold = index.refresh()
+        warm = index.refresh()
+        print(f"\nThis machine: {cold['entries']} apps, cold scan {cold['ms']:.0f} ms, "
+              f"incremental refresh {warm['ms']:.1f} ms")
+    return 0 if safe and found is not None else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,77 @@
+"""
+Decode-to-play latency: output.wav disk round trip vs. in-memory decoding.
+
+    python -m benchmarks.bench_audio_decode [--runs 20]
+
+Covers typical response lengths (a short quip, a sentence or two, a long
+answer) for WAV, raw PCM and — when libsndfile can encode it — MP3, the
+ElevenLabs default.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import os
+import tempfile
+import wave
+
+import numpy as np
+import soundfile as sf
+
+from audio.decode import decode_audio
+from benchmarks.common import time_call, print_table
+from benchmarks.standins import synthetic_speech
+
+LENGTHS = {"short (2 s)": 2.0, "medium (8 s)": 8.0, "long (30 s)": 30.0}
+RATE = 22050
+
+
+def encode(pcm: bytes, fmt: str) -> bytes:
+    if fmt == "pcm":
+        return pcm
+    if fmt == "wav":
+        buf = io.BytesIO()
+        with wave.open(buf, "wb") as wf:
+            wf.setnchannels(1)
+            wf.setsampwidth(2)
+            wf.setframerate(RATE)
+            wf.writeframes(pcm)
+        return buf.getvalue()
+    buf = io.BytesIO()
+    samples = np.frombuffer(pcm, dtype=np.int16).astype(np.float32) / 32768.0
+    sf.write(buf, samples, RATE, format="MP3")
+    return buf.getvalue()
+
+
+def disk_roundtrip(data: bytes, path: str):
+    with open(path, "wb") as f:
+        f.write(data)
+    return sf.read(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "output.wav")
+        for label, seconds in LENGTHS.items():
+            pcm = synthetic_speech(seconds, RATE)
+            for fmt in ("wav", "mp3", "pcm"):
+                try:
+                    data = encode(pcm, fmt)
+                except Exception as e:
+                    print(f"[BENCH] Skipping {fmt}: {e}")
+                    continue
+                if fmt != "pcm":
+                    rows.append((f"disk {fmt} {label}", time_call(lambda: disk_roundtrip(data, path), args.runs)))
+                rows.append((f"memory {fmt} {label}", time_call(lambda: decode_audio(data, RATE), args.runs)))
+
+    print_table("Decode-to-play latency", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+GUI frame-time jitter and turn latency with the backend in-process (a
+thread, sharing the GIL) vs in a child process (gui/backend_process.py).
+
+    python -m benchmarks.bench_backend_process [--seconds 10]
+
+A synthetic backend plays the assistant's part: each turn burns CPU in
+Python for "STT", streams "LLM" tokens, then "decodes TTS" block by block
+while publishing playback levels, posting LISTENING / SPEAKING / IDLE like
+the real loop. The widget (offscreen platform) is kept animating at 60 fps.
+Turn latency is turn start -> SPEAKING applied on the GUI thread.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import threading
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+
+from audio import levels
+from benchmarks.common import print_table
+from gui.backend_process import BackendProcess, _Channel, attach_rings, serve
+
+STT_MS = 150
+LLM_TOKENS, TOKEN_MS = 20, 4
+TTS_BLOCKS, BLOCK_MS, DECODE_MS = 30, 50, 12
+
+
+def burn(ms):
+    """Pure-Python work that holds the GIL, like decoding in Python."""
+    end = time.perf_counter() + ms / 1000
+    x = 0
+    while time.perf_counter() < end:
+        x += sum(i * i for i in range(200))
+    return x
+
+
+def synthetic_turns(post, ring_fn, should_continue):
+    while should_continue():
+        start = time.monotonic()
+        post(mode="LISTENING", partial="")
+        burn(STT_MS)
+        for _ in range(LLM_TOKENS):
+            burn(TOKEN_MS)
+        post(mode="SPEAKING", turn_started=start)
+        ring = ring_fn()
+        block = (np.sin(np.arange(1102) / 7.0) * 6000).astype(np.int16)
+        next_at = time.perf_counter()
+        for _ in range(TTS_BLOCKS):
+            if not should_continue():
+                break
+            burn(DECODE_MS)
+            ring.publish_block(block)
+            next_at += BLOCK_MS / 1000
+            time.sleep(max(0.0, next_at - time.perf_counter()))
+        post(mode="IDLE")
+        time.sleep(0.2)
+
+
+def synthetic_backend(conn, ring_names):
+    """Child-process entry for BackendProcess(target=...)."""
+    blocks = attach_rings(ring_names)
+    channel = _Channel(conn)
+    post = lambda **fields: channel.send("state", **fields)
+    try:
+        serve(conn, channel, lambda ok: synthetic_turns(post, lambda: levels.ring("playback"), ok))
+    finally:
+        for name in ring_names:
+            levels.detach(name)
+        for shm in blocks:
+            try:
+                shm.close()
+            except BufferError:
+                pass
+
+
+def run(mode, seconds, app, voice_gui):
+    from PyQt6.QtCore import QEventLoop, QTimer
+
+    widget = voice_gui.VoiceWidget()
+    voice_gui._gui_widget = widget
+    widget.frames.rates = {"IDLE": 60, "LISTENING": 60, "SPEAKING": 60}
+    widget.show()
+    widget.state.mode = None
+    widget.set_mode("SPEAKING")
+
+    paints = []
+    original = widget.frames.painted
+
+    def painted(ms):
+        paints.append(time.perf_counter())
+        original(ms)
+
+    widget.frames.painted = painted
+    turns = []
+
+    def on_state(changes):
+        if changes.get("mode") == "SPEAKING" and "turn_started" in changes:
+            turns.append((time.monotonic() - changes["turn_started"]) * 1000)
+
+    widget.bus.changed.connect(on_state)
+
+    running = threading.Event()
+    running.set()
+    backend = thread = None
+    if mode == "process":
+        backend = BackendProcess(on_event=voice_gui._on_backend_event, target=synthetic_backend)
+        backend.start()
+        backend.ready.wait(30)
+        backend.set_listening(True)
+    else:
+        thread = threading.Thread(
+            target=synthetic_turns,
+            args=(voice_gui.post_state, lambda: levels.ring("playback"), running.is_set),
+            daemon=True,
+        )
+        thread.start()
+
+    paints.clear()
+    loop = QEventLoop()
+    QTimer.singleShot(int(seconds * 1000), loop.quit)
+    loop.exec()
+    frames = list(paints)
+
+    running.clear()
+    if backend is not None:
+        backend.shutdown()
+    if thread is not None:
+        thread.join(5)
+    widget.hide()
+    widget.frames.timer.stop()
+    intervals = list(np.diff(frames) * 1000)
+    return intervals, turns
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    args = parser.parse_args()
+
+    from PyQt6.QtWidgets import QApplication
+    from gui import voice_gui
+
+    app = QApplication.instance() or QApplication([])
+    frame_rows, turn_rows, missed = [], [], {}
+    for mode in ("thread", "process"):
+        intervals, turns = run(mode, args.seconds, app, voice_gui)
+        frame_rows.append((f"{mode}: frame interval", intervals))
+        turn_rows.append((f"{mode}: turn start -> SPEAKING", turns))
+        missed[mode] = sum(1 for i in intervals if i > 1000 / 60 * 1.5)
+    print_table("GUI frame interval (target 16.7 ms)", frame_rows)
+    for mode, n in missed.items():
+        print(f"{mode:<10} frames later than 25 ms: {n}")
+    print_table("Turn latency", turn_rows)
+    print(f"\nCPUs available: {os.cpu_count()}")
+
+
+if __name__ == "__main__":
+    main()
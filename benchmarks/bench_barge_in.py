@@ -0,0 +1,95 @@
+"""
+Barge-in: how fast playback stops when the user talks over it, how often
+the assistant's own echo interrupts it, and turn-around between turns.
+
+    python -m benchmarks.bench_barge_in [--runs 5]
+
+The "microphone" is a paced WavFileSource holding background noise, the
+DummyEngine tone leaking back at a given echo coupling, and (optionally)
+synthetic user speech starting 1.5 s into the answer. Playback goes to a
+stand-in output stream, so no sound card is needed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from audio.bargein import BargeInDetector
+from audio.capture import CaptureEngine
+from audio.sources import WavFileSource
+from audio.stream_player import StreamPlayer
+from audio.tts_worker import DummyEngine, TTSWorker
+from benchmarks.common import print_table
+from benchmarks.standins import NullOutputStream, synthetic_speech
+
+RATE = 16000
+ANSWER = "This is a deliberately long answer that keeps going for a while, Sir."
+ECHO_DELAY = 0.1
+USER_AT = 1.5
+
+
+def mic_signal(seconds, coupling, with_user, rng):
+    x = rng.standard_normal(int(seconds * RATE)) * 60
+    t = np.arange(int(seconds * RATE)) / RATE
+    played = (t >= ECHO_DELAY) & (t < seconds - 0.5)
+    x += played * coupling * 0.05 * 32767 * np.sin(2 * np.pi * 220.0 * t)
+    if with_user:
+        speech = np.frombuffer(synthetic_speech(1.2, RATE, seed=3), dtype=np.int16).astype(np.float64)
+        at = int(USER_AT * RATE)
+        x[at:at + len(speech)] += speech
+    return np.clip(x, -32768, 32767).astype(np.int16)
+
+
+def run(coupling, with_user, echo_aware, rng):
+    """Returns (seconds from user speech onset to playback stop | None, false barge-in?)."""
+    player = StreamPlayer(samplerate=RATE, stream_factory=lambda sr, ch: NullOutputStream(sr, ch, buffer_s=0.05))
+    worker = TTSWorker([DummyEngine(samplerate=RATE)], player)
+    answer_s = len(ANSWER.split()) / 160 * 60
+    engine = CaptureEngine(WavFileSource.from_array(mic_signal(answer_s + 1.0, coupling, with_user, rng), RATE))
+    detector = BargeInDetector(engine, (lambda: player.level) if echo_aware else (lambda: 0.0))
+    fired = []
+    detector.arm(lambda pos: (fired.append(time.perf_counter()), worker.cancel_all()))
+
+    engine.start()
+    t0 = time.perf_counter()
+    utt = worker.say(ANSWER)
+    utt.wait()
+    detector.close()
+    engine.stop()
+    worker.shutdown()
+
+    if with_user:
+        stop = utt.timings.get("play_end") if fired else None
+        return (stop - (t0 + USER_AT)) if stop else None, False
+    return None, bool(fired)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+    rng = np.random.default_rng(0)
+
+    print("[BENCH] False barge-ins from echo alone (answer plays to the end otherwise):")
+    for coupling in (0.05, 0.2, 0.5):
+        naive = sum(run(coupling, False, False, rng)[1] for _ in range(args.runs))
+        aware = sum(run(coupling, False, True, rng)[1] for _ in range(args.runs))
+        print(f"  echo coupling {coupling:<5} energy-only VAD {naive}/{args.runs}   echo-aware {aware}/{args.runs}")
+
+    stops, missed = [], 0
+    for _ in range(args.runs):
+        latency, _ = run(0.2, True, True, rng)
+        if latency is None:
+            missed += 1
+        else:
+            stops.append(latency * 1000)
+    print(f"[BENCH] Missed barge-ins: {missed}/{args.runs}")
+    print_table("User speech onset -> playback stopped (echo coupling 0.2)", [("barge-in", stops)])
+    print("[BENCH] Turn-around after an answer: fixed 1500 ms sleep before -> next listen starts immediately now")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Capture ring (audio/capture.py RingBuffer): write/read cost per block and
+a position check that reads by absolute position always return the
+samples written there, including writes longer than the ring.
+
+    python -m benchmarks.bench_capture [--blocks 20000] [--seconds 30]
+
+Blocks are 20 ms at 16 kHz, like CaptureEngine's; the ring holds
+--seconds of audio. Samples are numbered (sample i has value i mod 2^15),
+so any drift between write_pos and the stored audio shows up directly.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from audio.capture import RingBuffer
+from benchmarks.common import print_table
+
+RATE = 16000
+BLOCK = RATE * 20 // 1000
+
+
+def numbered(start: int, n: int) -> np.ndarray:
+    return ((np.arange(start, start + n)) % 32768).astype(np.int16)
+
+
+def check(label, ok):
+    print(f"  {'ok    ' if ok else 'FAILED'} {label}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--blocks", type=int, default=20000)
+    parser.add_argument("--seconds", type=float, default=30.0)
+    args = parser.parse_args()
+
+    ring = RingBuffer(int(args.seconds * RATE))
+    writes, reads = [], []
+    for i in range(args.blocks):
+        block = numbered(ring.write_pos, BLOCK)
+        start = time.perf_counter()
+        ring.write(block)
+        writes.append((time.perf_counter() - start) * 1e6)
+        start = time.perf_counter()
+        ring.read(ring.write_pos - 10 * BLOCK)
+        reads.append((time.perf_counter() - start) * 1e6)
+    print_table(f"RingBuffer, {args.seconds:.0f} s ring, 20 ms blocks", [
+        ("write block", writes),
+        ("read last 200 ms", reads),
+    ], unit="us")
+
+    ok = True
+    tail = ring.read(ring.write_pos - 5 * BLOCK)
+    ok &= check("a read by position returns the samples written there",
+                np.array_equal(tail, numbered(ring.write_pos - 5 * BLOCK, 5 * BLOCK)))
+
+    # One write longer than the whole ring (e.g. a stalled callback flushing its backlog)
+    small = RingBuffer(1000)
+    small.write(numbered(0, 300))
+    pos = small.write(numbered(300, 2500))
+    ok &= check(f"oversized write advances write_pos by the full frame ({pos} == 2800)", pos == 2800)
+    ok &= check("and keeps its newest samples at their positions",
+                np.array_equal(small.read(1800, 2800), numbered(1800, 1000)))
+    small.write(numbered(2800, 150))
+    ok &= check("later writes continue at the right positions",
+                np.array_equal(small.read(2700, 2950), numbered(2700, 250)))
+
+    print("\nall checks passed" if ok else "\nSOME CHECKS FAILED")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
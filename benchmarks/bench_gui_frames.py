@@ -0,0 +1,65 @@
+"""
+VoiceWidget CPU per mode: the old always-on 60 Hz timer vs the frame
+scheduler (stopped in IDLE, reduced while LISTENING, full rate SPEAKING).
+
+    python -m benchmarks.bench_gui_frames [--seconds 5]
+
+Runs the real Qt event loop on the offscreen platform with the widget shown,
+so timer wake-ups, _tick and paints are all counted.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QEventLoop, QTimer
+from PyQt6.QtWidgets import QApplication
+
+from gui.voice_gui import FRAME_RATES, VoiceWidget
+
+ALWAYS_60 = {"IDLE": 60, "LISTENING": 60, "SPEAKING": 60}
+
+
+def run_mode(app, widget, mode, seconds):
+    """(CPU % of one core, repaints per second) while sitting in `mode`."""
+    widget.set_mode(mode)
+    app.processEvents()
+    frames0 = widget.frames.frames
+    cpu0, wall0 = time.process_time(), time.perf_counter()
+    loop = QEventLoop()
+    QTimer.singleShot(int(seconds * 1000), loop.quit)
+    loop.exec()
+    cpu = time.process_time() - cpu0
+    wall = time.perf_counter() - wall0
+    return cpu / wall * 100, (widget.frames.frames - frames0) / wall
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication([])
+    results = {}
+    for label, rates in (("always 60 Hz (before)", ALWAYS_60), ("frame scheduler", FRAME_RATES)):
+        widget = VoiceWidget()
+        widget.frames.rates = dict(rates)
+        widget.show()
+        for mode in ("IDLE", "LISTENING", "SPEAKING"):
+            widget.state.mode = None  # force set_mode through to the scheduler
+            results[(label, mode)] = run_mode(app, widget, mode, args.seconds)
+        widget.hide()
+        widget.frames.timer.stop()
+
+    print(f"\n== GUI CPU by mode, {args.seconds:.0f} s each ==", flush=True)
+    print(f"{'case':<26}{'mode':<12}{'CPU %':>10}{'fps':>10}")
+    for (label, mode), (cpu, fps) in results.items():
+        print(f"{label:<26}{mode:<12}{cpu:>10.2f}{fps:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+VoiceWidget paint cost: per-frame time and CPU for the wave animation.
+
+    python -m benchmarks.bench_gui_paint [--frames 600]
+
+Renders the widget into a QImage on the offscreen Qt platform (no display
+needed), advancing the phase every frame as the 60 Hz timer would. The
+"legacy" rows use the previous per-point math.sin / QPainterPath paint,
+kept here only as a reference.
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import os
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import Qt, QPointF, QRectF
+from PyQt6.QtGui import QBrush, QColor, QFont, QImage, QLinearGradient, QPainter, QPainterPath, QPen
+from PyQt6.QtWidgets import QApplication
+
+from benchmarks.common import print_table
+from gui.voice_gui import VoiceWidget
+
+
+class LegacyWidget(VoiceWidget):
+    """The old paintEvent: path, gradients, pens and font rebuilt every frame."""
+
+    def paintEvent(self, event):
+        h = self.height()
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        pill_x, pill_w, pill_h = 90, self.bar_w, self.bar_h
+        painter.setPen(QPen(self.glass_stroke, 1.5))
+        painter.setBrush(QColor(self.bg_color))
+        path = QPainterPath()
+        path.addRoundedRect(QRectF(pill_x + 2, 2, pill_w - 4, pill_h - 4), self.border_radius, self.border_radius)
+        painter.drawPath(path)
+
+        mid_y = h / 2
+        left, right = pill_x + 20, pill_x + pill_w - 20
+        width = right - left
+        amp, freq, speed = max(10, int(pill_h * 0.26)), 3.0, self.state.phase * 4.0
+        grad = QLinearGradient(left, 0, right, 0)
+        stops = [0.0, 0.33, 0.66, 1.0]
+        for s, c in zip(stops, self.wave_colors):
+            grad.setColorAt(s, c)
+        painter.setPen(QPen(QBrush(grad), 3.0))
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        path = QPainterPath()
+        steps = max(200, int(width))
+        for i in range(steps + 1):
+            t = i / steps
+            x = left + t * width
+            y = mid_y + math.sin(t * math.pi * 2 * freq + speed) * (amp * math.sin(math.pi * t))
+            if i == 0:
+                path.moveTo(x, y)
+            else:
+                path.lineTo(x, y)
+        painter.drawPath(path)
+        glow = QLinearGradient(left, mid_y, right, mid_y)
+        for s, c in zip(stops, self.wave_colors):
+            cc = QColor(c)
+            cc.setAlpha(80)
+            glow.setColorAt(s, cc)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QBrush(glow))
+        painter.drawRoundedRect(QRectF(left, mid_y + 4, width, 8), 4, 4)
+
+        center = QPointF(self.button_x + self.button_size / 2, self.button_y + self.button_size / 2)
+        painter.setPen(QPen(Qt.PenStyle.NoPen))
+        painter.setBrush(QColor(50, 150, 50, 100))
+        painter.drawEllipse(center, self.button_size / 2, self.button_size / 2)
+        painter.setPen(QPen(QColor(255, 255, 255, 70), 2))
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawEllipse(center, self.button_size / 2, self.button_size / 2)
+        painter.setPen(QColor(255, 255, 255))
+        font = QFont()
+        font.setBold(True)
+        font.setPointSize(11)
+        painter.setFont(font)
+        painter.drawText(
+            QRectF(self.button_x, self.button_y, self.button_size, self.button_size),
+            Qt.AlignmentFlag.AlignCenter,
+            "Start",
+        )
+        painter.end()
+
+
+def measure(widget, frames):
+    """Per-frame wall ms, plus CPU ms per frame for the whole run."""
+    widget.set_mode("SPEAKING")
+    widget.timer.stop()
+    image = QImage(widget.size(), QImage.Format.Format_ARGB32_Premultiplied)
+    samples = []
+    cpu0 = time.process_time()
+    for i in range(frames):
+        widget.state.phase = i / 60.0
+        image.fill(0)
+        start = time.perf_counter()
+        widget.render(image)
+        samples.append((time.perf_counter() - start) * 1000.0)
+    cpu = (time.process_time() - cpu0) * 1000.0 / frames
+    return samples, cpu
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--size", type=int, default=320)
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication([])
+    rows, cpu = [], {}
+    for label, cls in (("legacy (math.sin loop)", LegacyWidget), ("vectorised (numpy + QPolygonF)", VoiceWidget)):
+        widget = cls(size=args.size)
+        measure(widget, 30)  # warm-up
+        samples, cpu[label] = measure(widget, args.frames)
+        rows.append((label, samples))
+        widget.deleteLater()
+    print_table(f"SPEAKING frame paint, {args.frames} frames", rows)
+    for label, ms in cpu.items():
+        print(f"{label:<34} CPU {ms:.3f} ms/frame = {ms * 60 / 10:.1f}% of a core at 60 fps")
+    app.processEvents()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""
+Background jobs (Backend/system/jobs.py) on a large synthetic directory
+tree: how long the voice turn is blocked, and whether progress,
+cancellation, timeouts, captured output and the worker bound hold up.
+
+    python -m benchmarks.bench_jobs [--dirs 400] [--files 250] [--runs 3]
+
+The tree has --dirs folders (nested three deep) with --files small text
+files each; one file in 50 contains the search needle.
+
+- delete: shutil.rmtree in the turn (the old delete_folder) vs
+  scheduler.submit(), which answers "Started" after the inline wait; the
+  job's own run time is listed too.
+- search: search_with_regex in the turn vs as a job; matches streamed to
+  the job output must equal the returned ones.
+- cancel: a delete cancelled once it has started, time to stop and items
+  left; a command that prints forever with a 1 s timeout, killed with its
+  children.
+- pool: eight jobs on two workers never run more than two at a time.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+from Backend.system.file_control import delete_folder
+from Backend.system.jobs import CANCELLED, DONE, TIMED_OUT, JobScheduler
+from Backend.system.search_control import search_with_regex
+from Backend.system.system_control import execute_command
+from benchmarks.common import print_table
+
+NEEDLE = "rex-needle-42"
+CHATTY = (
+    f'"{sys.executable}" -c "import subprocess, sys, time; '
+    f"subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(300)']); "
+    f"[print(i, flush=True) or time.sleep(0.01) for i in range(100000)]\""
+)
+
+
+def build_tree(root, dirs, files):
+    os.makedirs(root)
+    for d in range(dirs):
+        sub = os.path.join(root, f"a{d % 10}", f"b{d % 7}", f"dir{d}")
+        os.makedirs(sub, exist_ok=True)
+        for f in range(files):
+            with open(os.path.join(sub, f"file{f}.txt"), "w") as fh:
+                fh.write(f"line one of {d}/{f}\n")
+                if (d * files + f) % 50 == 0:
+                    fh.write(f"here is the {NEEDLE}\n")
+    return dirs * files
+
+
+def count_left(root):
+    return sum(len(d) + len(f) for _, d, f in os.walk(root))
+
+
+def check(label, ok):
+    print(f"  {'ok    ' if ok else 'FAILED'} {label}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dirs", type=int, default=400)
+    parser.add_argument("--files", type=int, default=250)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--inline", type=float, default=0.2, help="seconds a turn waits before 'Started'")
+    args = parser.parse_args()
+
+    scheduler = JobScheduler(workers=2, inline_wait=args.inline)
+    announced = []
+    scheduler.on_finish(announced.append)
+    ok = True
+
+    with tempfile.TemporaryDirectory() as base:
+        tree = os.path.join(base, "tree")
+        n = build_tree(tree, args.dirs, args.files)
+        print(f"Tree: {n} files in {args.dirs} folders")
+
+        # ── Search ──
+        blocked, submitted, ran = [], [], []
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            expected = search_with_regex(NEEDLE, tree)
+            blocked.append((time.perf_counter() - start) * 1000)
+            start = time.perf_counter()
+            scheduler.submit("search", search_with_regex, NEEDLE, tree)
+            submitted.append((time.perf_counter() - start) * 1000)
+            job = scheduler.get()
+            job.wait()
+            ran.append(job.seconds * 1000)
+        print_table(f"Search {n} files: time the turn is blocked", [
+            ("search_with_regex in the turn", blocked),
+            ("scheduler.submit (answers)", submitted),
+            ("  ... the job itself", ran),
+        ])
+        ok &= check(f"job result equals the synchronous one ({len(expected.splitlines())} files matched)",
+                    job.result == expected)
+        ok &= check("every match was streamed to the job output",
+                    list(job.output) == expected.splitlines()[-len(job.output):])
+        ok &= check(f"summary: {job.summary}", job.summary.startswith("Found matches"))
+
+        # ── Delete ──
+        blocked, submitted, ran, samples, rising = [], [], [], 0, True
+        for _ in range(args.runs):
+            shutil.copytree(tree, tree + "-copy")
+            start = time.perf_counter()
+            shutil.rmtree(tree + "-copy")
+            blocked.append((time.perf_counter() - start) * 1000)
+
+            shutil.copytree(tree, tree + "-copy")
+            start = time.perf_counter()
+            scheduler.submit("delete", delete_folder, tree + "-copy")
+            submitted.append((time.perf_counter() - start) * 1000)
+            job = scheduler.get()
+            progress = []
+            while not job.wait(0.02):
+                if job.percent is not None:
+                    progress.append(job.percent)
+            samples += len(progress)
+            rising &= progress == sorted(progress)
+            ran.append(job.seconds * 1000)
+        print_table(f"Delete {n} files: time the turn is blocked", [
+            ("shutil.rmtree in the turn", blocked),
+            ("scheduler.submit (answers)", submitted),
+            ("  ... the job itself", ran),
+        ])
+        ok &= check(f"deleted ({job.summary})", job.state == DONE and not os.path.exists(tree + "-copy"))
+        ok &= check(f"progress reported and only went up ({samples} samples, last run {progress[:1]} .. "
+                    f"{progress[-1:]} %)", samples > 0 and rising)
+        ok &= check(f"background completions announced ({len(announced)})",
+                    all(j.state == DONE for j in announced) and len(announced) >= 1)
+
+        # ── Cancel and timeout ──
+        stop_ms = []
+        for _ in range(args.runs):
+            shutil.copytree(tree, tree + "-copy")
+            job = scheduler.start("delete", delete_folder, tree + "-copy")
+            while job.done_count == 0 and not job.wait(0.001):
+                pass
+            start = time.perf_counter()
+            job.cancel()
+            job.wait()
+            stop_ms.append((time.perf_counter() - start) * 1000)
+            left = count_left(tree + "-copy")
+            shutil.rmtree(tree + "-copy")
+        job = scheduler.start("chatty", execute_command, CHATTY, timeout=1.0)
+        job.wait()
+        print_table("Stopping a job", [
+            ("delete: cancel -> stopped", stop_ms),
+            ("command: timeout 1 s -> killed", [job.seconds * 1000]),
+        ])
+        ok &= check(f"cancelled delete stopped partway ({left} of {n + args.dirs} items left)",
+                    0 < left < n + args.dirs)
+        ok &= check(f"command timed out ({job.state}) with {len(job.output)} lines captured, "
+                    f"last {job.tail(1)}", job.state == TIMED_OUT and len(job.output) > 0)
+
+        queued = scheduler.start("never", delete_folder, tree)
+        queued.cancel()
+        scheduler.start("blocker", lambda job: time.sleep(0.1))
+        queued.wait()
+        ok &= check("a job cancelled while queued never runs", queued.state == CANCELLED and os.path.isdir(tree))
+
+        # ── Worker bound ──
+        running, peak, lock = [0], [0], threading.Lock()
+
+        def busy(job):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.05)
+            with lock:
+                running[0] -= 1
+
+        pool_jobs = [scheduler.start(f"busy {i}", busy) for i in range(8)]
+        for job in pool_jobs:
+            job.wait()
+        ok &= check(f"8 jobs on 2 workers, at most {peak[0]} at once", peak[0] == 2)
+
+    print("\nall checks passed" if ok else "\nSOME CHECKS FAILED")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
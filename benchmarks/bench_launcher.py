@@ -0,0 +1,149 @@
+"""
+Process launcher (Backend/system/launcher.py) vs the old blocking calls,
+with dummy apps (POSIX shell scripts; run it on Linux/macOS).
+
+    python -m benchmarks.bench_launcher [--runs 5] [--app-seconds 1.0]
+
+- open: `subprocess.run([app], shell=True)` (the old fallback) returns only
+  when the app exits; launcher.launch() returns once it is spawned.
+- close: a well-behaved app that starts a helper child, closed by tracked
+  PID (the whole process group) vs by image name (pkill -x, like
+  `taskkill /im`), counting helpers left running; and an app that ignores
+  SIGTERM, which is killed once the close timeout expires.
+- refused: programs named like system tools or living in an sbin
+  directory are never started, and a command line whose program isn't
+  installed is not handed to a shell.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import stat
+import subprocess
+import tempfile
+import time
+
+from Backend.system.launcher import Launcher, _group_alive, _live_in_group
+from benchmarks.common import print_table
+
+APP = """#!/bin/sh
+sleep {helper} &
+sleep {seconds}
+"""
+STUBBORN = """#!/bin/sh
+trap '' TERM
+while true; do sleep 0.05; done
+"""
+
+
+def script(directory, name, body):
+    path = os.path.join(directory, name)
+    with open(path, "w") as f:
+        f.write(body)
+    os.chmod(path, os.stat(path).st_mode | stat.S_IXUSR)
+    return path
+
+
+def helpers_alive(marker) -> int:
+    out = subprocess.run(["pgrep", "-f", f"sleep {marker}"], capture_output=True, text=True).stdout
+    return len(out.split())
+
+
+def wait_gone(launched, timeout=10.0):
+    start = time.perf_counter()
+    while time.perf_counter() - start < timeout:
+        # This container's init reaps orphans late, so zombies are confirmed away via /proc
+        if not launched.alive() and not (_group_alive(launched.pid) and _live_in_group(launched.pid)):
+            break
+        time.sleep(0.005)
+    return (time.perf_counter() - start) * 1000
+
+
+def refused(launch) -> bool:
+    try:
+        launch()
+    except (PermissionError, FileNotFoundError) as e:
+        print(f"  ok     refused: {e}")
+        return True
+    print("  FAILED started")
+    return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--app-seconds", type=float, default=1.0)
+    parser.add_argument("--close-timeout", type=float, default=1.0)
+    args = parser.parse_args()
+    if os.name == "nt":
+        raise SystemExit("uses POSIX shell scripts as dummy apps")
+
+    launcher = Launcher(close_timeout=args.close_timeout)
+    with tempfile.TemporaryDirectory() as d:
+        short = script(d, "shortapp", APP.format(helper=0.1, seconds=args.app_seconds))
+        helper = 301.5  # unique argument, so the helpers can be counted
+        app = script(d, "rexdummy", APP.format(helper=helper, seconds=300))
+        stubborn = script(d, "stubborn", STUBBORN)
+
+        blocking, spawned = [], []
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            subprocess.run([short], shell=True)
+            blocking.append((time.perf_counter() - start) * 1000)
+            start = time.perf_counter()
+            launcher.launch("short app", [short])
+            spawned.append((time.perf_counter() - start) * 1000)
+        print_table(f"Open (dummy app runs {args.app_seconds:.1f} s): time the turn is blocked", [
+            ("subprocess.run(shell=True)", blocking),
+            ("launcher.launch (Popen)", spawned),
+        ])
+
+        tracked, by_image, left_tracked, left_image = [], [], 0, 0
+        for _ in range(args.runs):
+            launched = launcher.launch("dummy", [app])
+            time.sleep(0.2)
+            launcher.close("dummy")
+            tracked.append(wait_gone(launched))
+            left_tracked += helpers_alive(helper)
+
+            proc = subprocess.Popen([app], start_new_session=True)
+            time.sleep(0.2)
+            start = time.perf_counter()
+            subprocess.run(["pkill", "-TERM", "-x", "rexdummy"])
+            proc.wait()
+            by_image.append((time.perf_counter() - start) * 1000)
+            left_image += helpers_alive(helper)
+            subprocess.run(["pkill", "-f", f"sleep {helper}"])
+        print_table("Close a well-behaved app: until it has exited", [
+            ("tracked PID, whole group", tracked),
+            ("by image name (pkill -x)", by_image),
+        ])
+        print(f"  helper processes left running: tracked {left_tracked}, by image {left_image} "
+              f"(of {args.runs})")
+
+        forced = []
+        for _ in range(max(1, args.runs // 2)):
+            launched = launcher.launch("stubborn", [stubborn])
+            time.sleep(0.2)
+            launcher.close("stubborn")
+            forced.append(wait_gone(launched))
+        print_table(f"Close an app that ignores SIGTERM (timeout {args.close_timeout:.1f} s)", [
+            ("graceful, then killed", forced),
+        ])
+
+        print("\nSystem programs and shell fallbacks:")
+        os.makedirs(os.path.join(d, "sbin"))
+        marker = os.path.join(d, "ran")
+        ok = refused(lambda: launcher.launch("power", [script(d, "poweroff", f"#!/bin/sh\ntouch {marker}\n")]))
+        ok &= refused(lambda: launcher.launch("tool", [script(os.path.join(d, "sbin"), "tool",
+                                                              f"#!/bin/sh\ntouch {marker}\n")]))
+        ok &= refused(lambda: launcher.launch_command("heard", f"not-an-app; touch {marker}"))
+        time.sleep(0.2)
+        ok &= not os.path.exists(marker)
+        print("\nall checks passed" if ok else "\nSOME CHECKS FAILED")
+        return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,117 @@
+"""
+Level ring: cost added to the audio threads, the GUI-side read, and a
+torn-read check with a writer thread hammering the ring.
+
+    python -m benchmarks.bench_level_ring [--blocks 20000]
+
+"playback" blocks are 50 ms at 22.05 kHz (StreamPlayer), "capture" blocks
+20 ms at 16 kHz (CaptureEngine); both already compute the block RMS, so the
+added cost is the peak plus the ring write.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import threading
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+
+from audio import levels
+from audio.levels import LevelRing
+from benchmarks.common import print_table
+from benchmarks.standins import synthetic_speech
+
+
+def per_block_us(fn, blocks, n):
+    samples = []
+    for i in range(n):
+        block = blocks[i % len(blocks)]
+        start = time.perf_counter()
+        fn(block)
+        samples.append((time.perf_counter() - start) * 1e6)
+    return samples
+
+
+def rms_only(block):
+    x = block.astype(np.float32)
+    return float(np.sqrt(np.mean(x * x)))
+
+
+def torn_reads(seconds: float) -> tuple:
+    """Writer publishes (i, i, i) as fast as it can; every row read must be consecutive and self-consistent."""
+    ring = LevelRing(64)
+    out = np.zeros((48, 3))
+    done = threading.Event()
+
+    def writer():
+        i = 0
+        while not done.is_set():
+            i += 1
+            ring.publish(float(i), float(i), when=float(i))
+
+    thread = threading.Thread(target=writer, daemon=True)
+    thread.start()
+    reads = bad = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        k = ring.recent(out)
+        rows = out[len(out) - k:]
+        reads += 1
+        if k and (np.any(rows[:, 0] != rows[:, 1]) or np.any(rows[:, 1] != rows[:, 2])
+                  or np.any(np.diff(rows[:, 0]) != 1)):
+            bad += 1
+    done.set()
+    thread.join()
+    return reads, bad
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--blocks", type=int, default=20000)
+    args = parser.parse_args()
+
+    rows = []
+    for label, rate, block_ms in (("playback", 22050, 50), ("capture", 16000, 20)):
+        pcm = np.frombuffer(synthetic_speech(3.0, rate), dtype=np.int16)
+        size = rate * block_ms // 1000
+        blocks = [pcm[i:i + size] for i in range(0, len(pcm) - size, size)]
+        ring = LevelRing()
+        base = per_block_us(rms_only, blocks, args.blocks)
+        both = per_block_us(lambda b: ring.publish_block(b, rms_only(b)), blocks, args.blocks)
+        rows.append((f"{label}: rms only", base))
+        rows.append((f"{label}: rms + ring", both))
+        rows.append((f"{label}: ring publish", per_block_us(lambda b: ring.publish_block(b, 1.0), blocks, args.blocks)))
+    print_table("Audio-thread cost per block", rows, unit="us")
+
+    ring = levels.ring("playback")
+    pcm = np.frombuffer(synthetic_speech(3.0, 22050), dtype=np.int16)
+    for i in range(0, len(pcm) - 1102, 1102):
+        ring.publish_block(pcm[i:i + 1102])
+    out = np.zeros((48, 3))
+    read = per_block_us(lambda _: ring.recent(out), [None], args.blocks)
+
+    from PyQt6.QtWidgets import QApplication
+    from gui.voice_gui import VoiceWidget
+    app = QApplication.instance() or QApplication([])
+    widget = VoiceWidget()
+    widget.set_mode("SPEAKING")
+    widget.timer.stop()
+
+    def envelope(_):
+        ring.publish(3000.0, 9000.0)  # keep the stream "live"
+        widget._wave_points()
+
+    wave = per_block_us(envelope, [None], 2000)
+    print_table("GUI-thread cost per frame", [("ring.recent(48)", read), ("wave from live levels", wave)], unit="us")
+
+    reads, bad = torn_reads(2.0)
+    print(f"\nConcurrent writer: {reads} reads, {bad} torn or out-of-order", flush=True)
+    app.processEvents()
+
+
+if __name__ == "__main__":
+    main()
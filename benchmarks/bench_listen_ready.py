@@ -0,0 +1,99 @@
+"""
+"Button press to ready" latency: per-turn sr.Microphone + 1.5 s ambient
+calibration vs. the persistent capture engine with a tracked noise floor.
+
+    python -m benchmarks.bench_listen_ready [--wav room_noise.wav] [--turns 5]
+
+Both paths read from a file-backed source paced in realtime, standing in
+for the microphone.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+import speech_recognition as sr
+
+from audio.capture import CaptureEngine
+from audio.sources import WavFileSource
+from audio.sr_source import CaptureAudioSource
+from benchmarks.common import print_table
+
+RATE = 16000
+
+
+def make_source(path):
+    if path:
+        return WavFileSource(path, realtime=True, pad_seconds=None)
+    rng = np.random.default_rng(0)
+    noise = (rng.standard_normal(RATE * 10) * 200).astype(np.int16)
+    return WavFileSource.from_array(noise, RATE, realtime=True, pad_seconds=None)
+
+
+class _PerTurnSource(sr.AudioSource):
+    """Mimics `with sr.Microphone()` on a file: the device is opened every turn."""
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.SAMPLE_RATE = raw.samplerate
+        self.SAMPLE_WIDTH = 2
+        self.CHUNK = 1024
+        self.stream = None
+
+    def __enter__(self):
+        self.raw.open()
+        self.stream = self
+        return self
+
+    def read(self, size):
+        return self.raw.read(size) or b""
+
+    def __exit__(self, *exc):
+        self.raw.close()
+        self.stream = None
+
+
+def legacy_ready(path) -> float:
+    r = sr.Recognizer()
+    start = time.perf_counter()
+    with _PerTurnSource(make_source(path)) as source:
+        r.adjust_for_ambient_noise(source, duration=1.5)
+        return (time.perf_counter() - start) * 1000.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--wav", help="16-bit WAV of room noise (default: synthetic noise)")
+    parser.add_argument("--turns", type=int, default=5)
+    args = parser.parse_args()
+
+    legacy = [legacy_ready(args.wav) for _ in range(args.turns)]
+
+    engine = CaptureEngine(make_source(args.wav))
+    start = time.perf_counter()
+    engine.start()
+    engine.wait_ready()
+    cold = [(time.perf_counter() - start) * 1000.0]
+
+    warm = []
+    for _ in range(args.turns):
+        time.sleep(0.5)  # previous turn being answered
+        r = sr.Recognizer()
+        start = time.perf_counter()
+        with CaptureAudioSource(engine) as source:
+            r.energy_threshold = engine.energy_threshold()
+            warm.append((time.perf_counter() - start) * 1000.0)
+    print(f"[BENCH] Tracked threshold {engine.energy_threshold():.1f}")
+    engine.stop()
+
+    print_table("Button press → ready to listen", [
+        ("per-turn mic + calibration", legacy),
+        ("persistent capture (first turn)", cold),
+        ("persistent capture (later turns)", warm),
+    ])
+
+
+if __name__ == "__main__":
+    main()
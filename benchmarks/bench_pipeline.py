@@ -0,0 +1,103 @@
+"""
+End-to-end turn latency: WAV in -> listen -> brain -> speak -> captured PCM out.
+
+    python -m benchmarks.bench_pipeline --dir recordings/ [--stt google|vosk|reference] [--out replies/]
+
+Each 16 kHz 16-bit WAV in the folder is one user turn, replayed in real
+time as the microphone. The reply is written to a CaptureSink instead of
+speakers and TTS uses the dummy engine unless REX_TTS_ENGINE says
+otherwise. `--stt reference` reads the same-named .txt file as the
+transcript, which takes the recognizer out of the measurement.
+
+Per turn: endpoint (end of speech -> VAD hand-off), STT, brain + TTS to
+first audio, and the total the user hears as silence.
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import os
+import time
+
+os.environ.setdefault("REX_TTS_ENGINE", "dummy")
+os.environ.setdefault("REX_WAKE", "off")
+
+import numpy as np
+
+from audio import stt
+from audio.sinks import CaptureSink
+from audio.sources import WavFileSource
+from benchmarks.common import print_table
+from benchmarks.standins import load_pcm
+
+RATE = 16000
+LEAD_S = 0.6
+
+_reference_text = {"text": ""}
+
+
+class ReferenceSTT(stt.STTBackend):
+    """Returns the current turn's reference transcript."""
+
+    name = "reference"
+
+    def transcribe(self, pcm: bytes, samplerate: int, cancel=None) -> stt.Transcript:
+        return stt.Transcript(_reference_text["text"], 1.0, self.name)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dir", required=True, help="folder of 16 kHz WAV utterances")
+    parser.add_argument("--stt", default="reference")
+    parser.add_argument("--out", help="save each captured reply as a WAV here")
+    args = parser.parse_args()
+
+    stt.BACKENDS["reference"] = ReferenceSTT
+    os.environ["REX_STT"] = args.stt
+    import assistant
+
+    sink = CaptureSink(realtime=True)
+    assistant.configure_audio(sink=sink)
+    if args.out:
+        os.makedirs(args.out, exist_ok=True)
+
+    rows = {"endpoint": [], "stt": [], "brain + tts to first audio": [], "end of speech -> first audio": []}
+    for path in sorted(glob.glob(os.path.join(args.dir, "*.wav"))):
+        pcm, rate = load_pcm(path)
+        if rate != RATE:
+            print(f"[BENCH] Skipping {path}: {rate} Hz (need {RATE})")
+            continue
+        ref_path = os.path.splitext(path)[0] + ".txt"
+        if os.path.exists(ref_path):
+            with open(ref_path, encoding="utf-8") as f:
+                _reference_text["text"] = f.read().strip()
+
+        samples = np.concatenate([np.zeros(int(LEAD_S * RATE), dtype=np.int16), np.frombuffer(pcm, dtype=np.int16)])
+        source = WavFileSource.from_array(samples, RATE, realtime=True, pad_seconds=None)
+        assistant.configure_audio(source=source)
+        sink.clear()
+
+        query = assistant.listen()
+        answer = assistant.speak_stream(assistant.process_query_stream(query)) if query else ""
+        t = dict(assistant.last_turn)
+        name = os.path.basename(path)
+        if "first_audio_at" not in t or "speech_end_pos" not in t:
+            print(f"[BENCH] {name}: no complete turn (query={query!r})")
+            continue
+
+        speech_end = source.started_at + t["speech_end_pos"] / RATE
+        rows["endpoint"].append((t["endpoint_at"] - speech_end) * 1000)
+        rows["stt"].append((t["transcribed_at"] - t["endpoint_at"]) * 1000)
+        rows["brain + tts to first audio"].append((t["first_audio_at"] - t["transcribed_at"]) * 1000)
+        rows["end of speech -> first audio"].append((t["first_audio_at"] - speech_end) * 1000)
+        print(f"[BENCH] {name}: '{query}' -> '{answer[:60]}' "
+              f"({rows['end of speech -> first audio'][-1]:.0f} ms)")
+        if args.out:
+            sink.save(os.path.join(args.out, os.path.splitext(name)[0] + "_reply.wav"))
+
+    print_table(f"Per-turn latency ({args.stt} STT)", list(rows.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Latency of realtime answers: local Rex templates vs. the streamed LLM path.
+
+    python -m benchmarks.bench_realtime_templates [--llm-runs 3] [--weather]
+
+The template path always runs. The LLM path runs only when GROK_API_KEY is
+configured in api.env; the chat history is restored afterwards so the
+benchmark does not pollute Backend/chat_history.json.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+
+from dotenv import load_dotenv
+
+from Backend.realtime_q import get_realtime_data
+from Backend import templates
+from benchmarks.common import time_call, print_table
+
+# Not time/date/weather questions, though a realtime trigger matches a
+# substring: these must fall through to the LLM, not get a canned reading
+NOT_READINGS = [
+    "do you know who iron man is",
+    "how are you today",
+    "what is the weather today",
+    "news right now",
+    "play some music now",
+]
+
+QUERIES = {
+    "time": "what time is it",
+    "date": "what's the date today",
+    "date (tomorrow)": "what date is tomorrow",
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=1000, help="template path iterations")
+    parser.add_argument("--llm-runs", type=int, default=3, help="LLM path iterations (0 to skip)")
+    parser.add_argument("--weather", action="store_true", help="include weather (needs network)")
+    args = parser.parse_args()
+
+    queries = dict(QUERIES)
+    if args.weather:
+        queries["weather"] = "what's the weather in Indore"
+
+    # Fetch once so the table shows rendering cost, not wttr.in
+    results = {name: get_realtime_data(q) for name, q in queries.items()}
+
+    for query in NOT_READINGS:
+        answer = templates.answer(query, get_realtime_data(query))
+        print(f"[BENCH] {'ok    ' if answer is None else 'FAILED'} no template for {query!r}"
+              + (f" (got {answer!r})" if answer else ""))
+
+    rows = []
+    for name, result in results.items():
+        if templates.answer(queries[name], result) is None:
+            print(f"[BENCH] FAILED {queries[name]!r} is not answered by a template")
+        if templates.render(result) is None:
+            print(f"[BENCH] {name}: no template (category={result and result.get('category')})")
+            continue
+        rows.append((f"template {name}", time_call(lambda r=result: templates.render(r), args.runs)))
+        rows.append((f"fetch+template {name}", time_call(
+            lambda q=queries[name]: templates.render(get_realtime_data(q)), min(args.runs, 50))))
+
+    load_dotenv('api.env')
+    if args.llm_runs > 0 and os.getenv('GROK_API_KEY'):
+        from Backend.general_q import general
+        from Backend.memory import memory
+
+        saved = memory.get_context()
+        try:
+            for name, result in results.items():
+                data_str = result.get("display_str") or str(result.get("key_data", ""))
+                query = queries[name]
+                enhanced = (
+                    f"{query}\n\n"
+                    f"Use this exact realtime information — do NOT invent or change any numbers:\n"
+                    f"{data_str}"
+                )
+                rows.append((f"llm {name}", time_call(
+                    lambda: general(enhanced, extra_context=data_str), args.llm_runs)))
+        finally:
+            memory.history = saved
+            memory.save()
+    else:
+        print("[BENCH] Skipping LLM path (no GROK_API_KEY or --llm-runs 0)")
+
+    print_table("Realtime answer latency", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Cold start with lazily loaded skills (Backend/skills.py) vs importing every
+skill up front, as the brain used to.
+
+    python -m benchmarks.bench_skills [--runs 5]
+
+Each run is a fresh interpreter that imports Backend.brain ("eager" then
+calls registry.preload(), which is what the old top-level imports did) and
+reports import time, resident memory, and what the first use of a skill
+costs afterwards: a time query (no extra imports) and loading the stock
+skill (yfinance/pandas). Skills whose Windows-only dependencies are missing
+here just fail to preload, as they would have failed to import before.
+Also times trigger matching: the compiled index vs the old keyword chain.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+from benchmarks.common import print_table, summarize
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = r"""
+import json, sys, time
+start = time.perf_counter()
+import Backend.brain
+from Backend.skills import registry
+preload = {}
+if sys.argv[1] == "eager":
+    preload = registry.preload()
+import_ms = (time.perf_counter() - start) * 1000
+
+def rss_mb():
+    try:
+        with open("/proc/self/statm") as f:
+            import os
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+rss = rss_mb()
+t = time.perf_counter()
+Backend.brain.get_realtime_data("what time is it")
+time_ms = (time.perf_counter() - t) * 1000
+t = time.perf_counter()
+try:
+    registry.load(registry.match("stock price", "realtime")[0])
+except ImportError:
+    pass
+stock_ms = (time.perf_counter() - t) * 1000
+print(json.dumps({"import_ms": import_ms, "rss_mb": rss, "time_ms": time_ms, "stock_ms": stock_ms,
+                  "failed": sorted(k for k, v in preload.items() if v)}))
+"""
+
+OLD_KEYWORDS = [
+    ['time', 'clock', 'hour', 'now'],
+    ['date', 'today', 'day', 'tomorrow'],
+    ['weather', 'temperature', 'forecast', 'climate'],
+    ['stock', 'price', 'share', 'nse', 'bse'],
+    ['news', 'headline', 'latest', 'breaking', "today's news"],
+    ['open', 'close', 'play', 'launch', 'run', 'volume', 'shutdown', 'restart',
+     'file', 'folder', 'delete', 'window', 'minimize', 'maximize', 'settings'],
+]
+
+QUERIES = [
+    "what is the capital of france and why is it famous",
+    "tell me the latest news",
+    "open notepad",
+    "how does a transformer neural network work in simple words",
+    "what's the weather in mumbai",
+]
+
+
+def run_child(mode):
+    env = dict(os.environ)
+    env.setdefault("GROK_API_KEY", "benchmark")  # general_q exits without one; nothing is sent
+    out = subprocess.run([sys.executable, "-c", CHILD, mode], cwd=ROOT, env=env,
+                         capture_output=True, text=True, timeout=300)
+    lines = [l for l in out.stdout.splitlines() if l.startswith("{")]
+    if not lines:
+        raise RuntimeError(f"{mode} run failed:\n{out.stderr[-2000:]}")
+    return json.loads(lines[-1])
+
+
+def bench_matching(n=20000):
+    from Backend.skills import registry
+
+    def old(q):
+        q = q.lower()
+        return [i for i, words in enumerate(OLD_KEYWORDS) if any(w in q for w in words)]
+
+    def new(q):
+        return registry.match(q, "realtime") + registry.match(q, "system")
+
+    rows = []
+    for label, fn in (("keyword chain", old), ("skill index", new)):
+        start = time.perf_counter()
+        for i in range(n):
+            fn(QUERIES[i % len(QUERIES)])
+        rows.append((label, [(time.perf_counter() - start) / n * 1e6]))
+    print_table("Trigger matching, per query", rows, unit="us")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    results = {mode: [run_child(mode) for _ in range(args.runs)] for mode in ("lazy", "eager")}
+    for metric, title in (("import_ms", "Import Backend.brain"),
+                          ("time_ms", "First time query"),
+                          ("stock_ms", "First stock query: loading the skill")):
+        print_table(title, [(mode, [r[metric] for r in runs]) for mode, runs in results.items()])
+
+    print("\n-- Resident memory after import (MB)")
+    for mode, runs in results.items():
+        s = summarize([r["rss_mb"] for r in runs])
+        print(f"  {mode:<8}{s['p50']:>9.1f}")
+    failed = results["eager"][0]["failed"]
+    if failed:
+        print(f"\n(preload failed here for: {', '.join(failed)} — Windows-only dependencies)")
+    bench_matching()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Speculative prefetch on partial transcripts: how often the guess is right
+and how much realtime-lookup latency it hides.
+
+    python -m benchmarks.bench_speculation [--wps 2.5] [--endpoint-ms 350]
+
+Each utterance is "spoken" word by word (a partial transcript per word, as
+a streaming recognizer would produce), then finalised after the endpoint
+delay. Partials mishear a few words (MISHEARD) that the final transcript
+corrects, so some guesses must be discarded. Lookups are simulated with per-category latencies so the run is
+offline; the keyword intent matcher is the real one.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from Backend.realtime_q import realtime_key
+from Backend.speculation import Speculator
+from benchmarks.common import print_table
+
+UTTERANCES = [
+    "what's the weather in indore",
+    "tcs share price please",
+    "what time is it",
+    "tell me a joke about cats",
+    "how is the weather right now",
+    "stock price of tata motors",
+    "give me the latest news headlines",
+    "what's the date tomorrow",
+    "open chrome and play some music",
+    "what is the temperature outside",
+    "who is iron man",
+    "reliance stock price today",
+]
+
+# Words the streaming recognizer gets wrong in its partials and only fixes in the final
+MISHEARD = {"tata": "data", "tomorrow": "to marrow", "headlines": "head lines"}
+
+LATENCY_S = {"weather": 0.7, "stock": 0.9, "news": 0.6, "time": 0.0, "date": 0.0}
+
+
+def make_fetch(rng):
+    def fetch(text):
+        key = realtime_key(text)
+        time.sleep(max(0.0, rng.normal(LATENCY_S[key[0]], 0.1)) if LATENCY_S[key[0]] else 0.0)
+        return {"category": key[0], "key_data": text, "display_str": f"{key} for '{text}'"}
+    return fetch
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--wps", type=float, default=2.5, help="words per second")
+    parser.add_argument("--endpoint-ms", type=int, default=350)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    fetch = make_fetch(rng)
+    speculator = Speculator(fetch=fetch)
+    baseline, speculative = [], []
+
+    for utterance in UTTERANCES:
+        words = [MISHEARD.get(w, w) for w in utterance.split()]
+        for i in range(1, len(words) + 1):
+            time.sleep(1.0 / args.wps)
+            speculator.on_partial(" ".join(words[:i]))
+        time.sleep(args.endpoint_ms / 1000.0)
+
+        # After the final transcript: resolve speculation, then fetch if it missed
+        start = time.perf_counter()
+        data = speculator.resolve(utterance)
+        if data is None and realtime_key(utterance) is not None:
+            fetch(utterance)
+        waited = (time.perf_counter() - start) * 1000
+
+        if realtime_key(utterance) is not None:
+            speculative.append(waited)
+            t = time.perf_counter()
+            fetch(utterance)
+            baseline.append((time.perf_counter() - t) * 1000)
+        print(f"  {utterance:<38} {'hit ' if data else 'miss' if realtime_key(utterance) else '-   '}  {waited:6.0f} ms")
+
+    print_table("Realtime lookup wait after the final transcript", [
+        ("fetch after final (before)", baseline),
+        ("speculative prefetch", speculative),
+    ])
+    print(f"[BENCH] {speculator.report()}")
+    speculator.shutdown()
+
+
+if __name__ == "__main__":
+    main()
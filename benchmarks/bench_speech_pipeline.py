@@ -0,0 +1,76 @@
+"""
+Perceived latency: speak-after-full-answer vs. sentence-pipelined speech.
+
+    python -m benchmarks.bench_speech_pipeline [--runs 3]
+
+Both paths use the same stand-in LLM token stream and the TTS worker with a
+DummyEngine (fixed synthesis latency, audio as long as the words take to
+say) writing to a stand-in output stream, so the difference is purely the
+pipelining.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from audio.speech_pipeline import split_sentences
+from audio.stream_player import StreamPlayer
+from audio.tts_worker import TTSWorker, DummyEngine
+from benchmarks.common import print_table
+from benchmarks.standins import paced_tokens, NullOutputStream
+
+ANSWER = (
+    "Certainly, Sir. The Eiffel Tower was completed in 1889 for the World's Fair, "
+    "and was initially criticised by a number of rather vocal artists. "
+    "It stands roughly 330 metres tall, depending on the antenna of the day. "
+    "For a time it was the tallest structure on Earth, a title it held for four decades. "
+    "Today it welcomes millions of visitors a year, most of whom queue far longer than they would like."
+)
+RATE = 16000
+
+
+def make_worker(latency_s: float) -> TTSWorker:
+    player = StreamPlayer(samplerate=RATE, stream_factory=lambda sr, ch: NullOutputStream(sr, ch))
+    return TTSWorker([DummyEngine(samplerate=RATE, latency_s=latency_s)], player)
+
+
+def sequential(worker: TTSWorker) -> tuple:
+    start = time.perf_counter()
+    utt = worker.say("".join(paced_tokens(ANSWER)))
+    utt.wait()
+    return (utt.timings["first_audio"] - start) * 1000.0, (time.perf_counter() - start) * 1000.0
+
+
+def pipelined(worker: TTSWorker) -> tuple:
+    start = time.perf_counter()
+    utterances = [worker.say(segment) for segment in split_sentences(paced_tokens(ANSWER))]
+    for utt in utterances:
+        utt.wait()
+    first = min(u.timings["first_audio"] for u in utterances)
+    return (first - start) * 1000.0, (time.perf_counter() - start) * 1000.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--synth-latency", type=float, default=0.4, help="stand-in TTS latency (s)")
+    args = parser.parse_args()
+
+    worker = make_worker(args.synth_latency)
+    seq = [sequential(worker) for _ in range(args.runs)]
+    pipe = [pipelined(worker) for _ in range(args.runs)]
+    worker.shutdown()
+
+    print_table("Perceived latency (time to first audio)", [
+        ("sequential", [s[0] for s in seq]),
+        ("sentence pipeline", [p[0] for p in pipe]),
+    ])
+    print_table("Total turn time", [
+        ("sequential", [s[1] for s in seq]),
+        ("sentence pipeline", [p[1] for p in pipe]),
+    ])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Startup report: time to the first prompt per entry point, and which imports
+it spends that time on (parsed from `python -X importtime`).
+
+    python -m benchmarks.bench_startup [--runs 5] [--top 15]
+
+Each case is a fresh interpreter. "text" waits for the REPL prompt on
+stdout and then closes stdin; the others time a plain import (the GUI
+module, and the full voice assistant for comparison).
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+from benchmarks.common import print_table
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CASES = {
+    "text (first prompt)": [sys.executable, "-X", "importtime", "main.py", "--text"],
+    "gui module import": [sys.executable, "-X", "importtime", "-c", "import gui.voice_gui"],
+    "assistant import": [sys.executable, "-X", "importtime", "-c", "import assistant"],
+}
+
+
+def run_case(cmd, prompt: bytes = b"You: "):
+    """(seconds until prompt / exit, stderr text, ok)."""
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    start = time.perf_counter()
+    proc = subprocess.Popen(cmd, cwd=ROOT, env=env, stdin=subprocess.PIPE,
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    elapsed = None
+    if "--text" in cmd:
+        seen = b""
+        while not seen.endswith(prompt):
+            ch = proc.stdout.read(1)
+            if not ch:
+                break
+            seen += ch
+        elapsed = time.perf_counter() - start
+    _, err = proc.communicate(b"", timeout=120)
+    if elapsed is None:
+        elapsed = time.perf_counter() - start
+    return elapsed, err.decode(errors="replace"), proc.returncode == 0
+
+
+def top_imports(stderr: str, n: int):
+    """Packages by total self import time (us), summed over their submodules."""
+    totals = defaultdict(int)
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        totals[name.strip().split(".")[0]] += int(self_us)
+    return sorted(totals.items(), key=lambda kv: -kv[1])[:n]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=12)
+    args = parser.parse_args()
+
+    rows, reports = [], {}
+    for label, cmd in CASES.items():
+        samples = []
+        for _ in range(args.runs):
+            elapsed, err, ok = run_case(cmd)
+            samples.append(elapsed * 1000)
+            reports[label] = (err, ok)
+        rows.append((label, samples))
+    print_table("Startup", rows)
+
+    for label, (err, ok) in reports.items():
+        print(f"\n-- {label}: import time by package (ms){'' if ok else '  [exited with an error]'}")
+        for name, us in top_imports(err, args.top):
+            print(f"  {name:<40}{us / 1000:>9.1f}")
+        if not ok:
+            last = [l for l in err.splitlines() if l and not l.startswith("import time:")]
+            if last:
+                print(f"  error: {last[-1]}")
+
+
+if __name__ == "__main__":
+    main()
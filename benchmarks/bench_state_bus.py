@@ -0,0 +1,101 @@
+"""
+State bus stress run: worker threads flood the GUI with state changes.
+
+    python -m benchmarks.bench_state_bus [--threads 4] [--rate 2000] [--seconds 5]
+
+Each thread posts mode / partial / level changes at `rate` per second to a
+shown VoiceWidget (offscreen platform) while the Qt event loop runs. Reports
+how many posts were coalesced into how many deliveries and repaints, the
+worst post-to-delivery delay, GUI-thread CPU, and whether the widget ends on
+the last posted state.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import threading
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QEventLoop, QTimer
+from PyQt6.QtWidgets import QApplication
+
+from gui import voice_gui
+from gui.voice_gui import VoiceWidget
+
+MODES = ("IDLE", "LISTENING", "SPEAKING")
+
+
+def flood(rate, seconds, seed):
+    rng = random.Random(seed)
+    interval = 1.0 / rate
+    deadline = time.perf_counter() + seconds
+    next_at = time.perf_counter()
+    n = 0
+    while time.perf_counter() < deadline:
+        kind = rng.random()
+        if kind < 0.5:
+            mode = rng.choice(MODES)
+            voice_gui.post_state(mode=mode)
+        elif kind < 0.8:
+            voice_gui.show_partial(f"what is the weather {n}")
+        else:
+            voice_gui.post_state(level=rng.random())
+        n += 1
+        next_at += interval
+        delay = next_at - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--rate", type=float, default=2000.0, help="posts per second per thread")
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication([])
+    widget = VoiceWidget()
+    voice_gui._gui_widget = widget
+    widget.show()
+    app.processEvents()
+
+    threads = [
+        threading.Thread(target=flood, args=(args.rate, args.seconds, i), daemon=True)
+        for i in range(args.threads)
+    ]
+    frames0 = widget.frames.frames
+    cpu0, wall0 = time.process_time(), time.perf_counter()
+    for t in threads:
+        t.start()
+    loop = QEventLoop()
+    QTimer.singleShot(int(args.seconds * 1000), loop.quit)
+    loop.exec()
+    for t in threads:
+        t.join()
+
+    # Final, deterministic state after the flood: must win over everything queued
+    voice_gui.post_state(mode="SPEAKING", partial="done")
+    deadline = time.perf_counter() + 1.0
+    while time.perf_counter() < deadline and (widget.state.mode != "SPEAKING" or widget.partial_text != "done"):
+        app.processEvents()
+    wall = time.perf_counter() - wall0
+    cpu = time.process_time() - cpu0
+
+    bus = widget.bus
+    print(f"\n== State bus, {args.threads} threads x {args.rate:.0f}/s for {args.seconds:.0f} s ==", flush=True)
+    print(f"posted            {bus.posted} ({bus.posted / wall:.0f}/s)")
+    print(f"delivered         {bus.delivered} batches ({bus.posted / max(1, bus.delivered):.0f} posts each)")
+    print(f"repaints          {widget.frames.frames - frames0}")
+    print(f"max delay         {bus.max_delay * 1000:.1f} ms (post -> GUI thread)")
+    print(f"process CPU       {cpu / wall * 100:.1f}% of a core (posting threads included)")
+    ok = widget.state.mode == "SPEAKING" and widget.partial_text == "done"
+    print(f"final state       {'consistent' if ok else 'WRONG: ' + str(bus.state)}")
+
+
+if __name__ == "__main__":
+    main()
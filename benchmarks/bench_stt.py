@@ -0,0 +1,111 @@
+"""
+Speech-to-text accuracy and speed per backend.
+
+    python -m benchmarks.bench_stt --dir recordings/ [--backends google,vosk]
+
+The folder holds 16 kHz 16-bit WAV utterances, each with a same-named .txt
+reference transcript. Reports word error rate, real-time factor (processing
+time / audio duration) and, for streaming backends, how long the final
+transcript takes once the last audio has been fed — the part of recognition
+the user actually waits for after they stop talking.
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import os
+import time
+
+import speech_recognition as sr
+
+from audio.stt import create_backend
+from benchmarks.common import print_table, word_errors
+from benchmarks.standins import load_pcm
+
+RATE = 16000
+CHUNK = RATE // 50 * 2  # 20 ms of int16
+
+
+def load_cases(folder: str):
+    cases = []
+    for path in sorted(glob.glob(os.path.join(folder, "*.wav"))):
+        ref_path = os.path.splitext(path)[0] + ".txt"
+        if not os.path.exists(ref_path):
+            print(f"[BENCH] Skipping {path}: no reference .txt")
+            continue
+        pcm, rate = load_pcm(path)
+        if rate != RATE:
+            print(f"[BENCH] Skipping {path}: {rate} Hz (need {RATE})")
+            continue
+        with open(ref_path, encoding="utf-8") as f:
+            cases.append((os.path.basename(path), pcm, f.read().strip()))
+    return cases
+
+
+def run_backend(name: str, cases):
+    backend = create_backend(name)
+    t0 = time.perf_counter()
+    backend.warm_up()
+    print(f"[BENCH] {name}: warm-up {(time.perf_counter() - t0) * 1000:.0f} ms")
+
+    errors = words = 0
+    audio_s = proc_s = 0.0
+    latencies, tails = [], []
+    for label, pcm, reference in cases:
+        start = time.perf_counter()
+        try:
+            if backend.streaming:
+                session = backend.start_stream(RATE)
+                for i in range(0, len(pcm), CHUNK):
+                    session.accept(pcm[i:i + CHUNK])
+                fed = time.perf_counter()
+                text = session.finish().text
+                tails.append((time.perf_counter() - fed) * 1000)
+            else:
+                text = backend.transcribe(pcm, RATE).text
+        except sr.UnknownValueError:
+            text = ""
+        except sr.RequestError as e:
+            print(f"[BENCH] {name}: {label}: {e}")
+            continue
+        elapsed = time.perf_counter() - start
+        e, n = word_errors(reference, text)
+        errors += e
+        words += n
+        audio_s += len(pcm) / 2 / RATE
+        proc_s += elapsed
+        latencies.append(elapsed * 1000)
+        print(f"  {label:<28} {e}/{n} errors  {elapsed * 1000:7.0f} ms  '{text}'")
+
+    wer = errors / words if words else float("nan")
+    rtf = proc_s / audio_s if audio_s else float("nan")
+    print(f"[BENCH] {name}: WER {wer:.1%} over {words} words, RTF {rtf:.3f}")
+    rows = [(f"{name} transcribe", latencies)]
+    if tails:
+        rows.append((f"{name} final after last audio", tails))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dir", required=True, help="folder of 16 kHz WAVs with .txt references")
+    parser.add_argument("--backends", default="google,vosk")
+    args = parser.parse_args()
+
+    cases = load_cases(args.dir)
+    if not cases:
+        print(f"[BENCH] No usable utterances in {args.dir}")
+        return
+
+    rows = []
+    for name in args.backends.split(","):
+        try:
+            rows += run_backend(name.strip(), cases)
+        except Exception as e:
+            print(f"[BENCH] {name}: unavailable ({e})")
+    print_table("STT latency per utterance", rows)
+
+
+if __name__ == "__main__":
+    main()
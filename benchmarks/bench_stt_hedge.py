@@ -0,0 +1,112 @@
+"""
+Hedged STT: turn latency with the primary recognizer alone vs. hedged.
+
+    python -m benchmarks.bench_stt_hedge [--turns 200] [--hedge-ms 300]
+    python -m benchmarks.bench_stt_hedge --dir recordings/ --backends google,vosk
+
+Without --dir, simulated backends stand in: a cloud recognizer with spiky
+latency (mostly ~400 ms, with a 10% tail of 1.5-4 s) and a local one at a
+steady ~450 ms with slightly lower confidence. Like the real ones, the
+local backend stops when cancelled and the cloud one can't once its
+request is out, so it reports its full latency even after losing: the
+report's "avg saved" is then exact, and a lower bound for turns where the
+first backend was stopped. The last lines show how much recognition work
+hedging left running after each turn was decided.
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import os
+import threading
+import time
+
+import numpy as np
+
+from audio.stt import HedgedSTT, STTBackend, STTCancelled, Transcript, create_backend
+from benchmarks.common import print_table
+from benchmarks.standins import load_pcm
+
+RATE = 16000
+
+
+class SimulatedSTT(STTBackend):
+    def __init__(self, name, latency_fn, confidence, interruptible=True):
+        self.name = name
+        self.latency_fn = latency_fn
+        self.confidence = confidence
+        self.interruptible = interruptible
+        self.completed = 0
+        self.cancelled = 0
+
+    def transcribe(self, pcm: bytes, samplerate: int, cancel=None) -> Transcript:
+        latency = self.latency_fn()
+        if not self.interruptible:
+            time.sleep(latency)   # a request already sent runs to the end
+        elif (cancel or threading.Event()).wait(latency):
+            self.cancelled += 1
+            raise STTCancelled()
+        self.completed += 1
+        return Transcript("what's the time", self.confidence, self.name)
+
+
+def simulated(seed: int = 0):
+    rng = np.random.default_rng(seed)
+
+    def cloud():
+        if rng.random() < 0.1:
+            return rng.uniform(1.5, 4.0)
+        return rng.lognormal(np.log(0.4), 0.25)
+
+    def local():
+        return rng.normal(0.45, 0.05)
+
+    return [SimulatedSTT("cloud", cloud, 0.92, interruptible=False), SimulatedSTT("local", local, 0.75)]
+
+
+def timed(backend, pcm):
+    start = time.perf_counter()
+    try:
+        backend.transcribe(pcm, RATE)
+    except Exception as e:
+        print(f"[BENCH] {getattr(backend, 'name', '?')}: {e}")
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dir", help="folder of 16 kHz WAV utterances (uses real backends)")
+    parser.add_argument("--backends", default="google,vosk")
+    parser.add_argument("--turns", type=int, default=60, help="simulated turns")
+    parser.add_argument("--hedge-ms", type=int, default=300)
+    parser.add_argument("--min-confidence", type=float, default=0.6)
+    args = parser.parse_args()
+
+    if args.dir:
+        backends = [create_backend(n.strip()) for n in args.backends.split(",")]
+        clips = [load_pcm(p)[0] for p in sorted(glob.glob(os.path.join(args.dir, "*.wav")))]
+    else:
+        backends = simulated()
+        clips = [b""] * args.turns
+
+    hedged = HedgedSTT(backends, hedge_delay=args.hedge_ms / 1000.0, min_confidence=args.min_confidence)
+    hedged.warm_up()
+    primary_only = [timed(backends[0], pcm) for pcm in clips]
+    for b in backends:
+        b.completed = b.cancelled = 0
+    with_hedge = [timed(hedged, pcm) for pcm in clips]
+
+    print_table(
+        f"STT latency per turn (hedge after {args.hedge_ms} ms)",
+        [(f"{backends[0].name} only", primary_only), ("hedged", with_hedge)],
+    )
+    print(f"[BENCH] {hedged.report()}")
+    if not args.dir:
+        time.sleep(0.1)  # cancelled losers return within a wakeup
+        for b in backends:
+            print(f"[BENCH] hedged {b.name}: {b.completed} ran to the end, {b.cancelled} stopped when they lost")
+
+
+if __name__ == "__main__":
+    main()
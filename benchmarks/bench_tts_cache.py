@@ -0,0 +1,81 @@
+"""
+TTS cache: hit rate and time to first audio on a replayed session.
+
+    python -m benchmarks.bench_tts_cache [--turns 200] [--max-mb 5]
+
+Utterances are drawn from a mix of repeated assistant phrases and unique
+LLM answers; misses go through a stand-in synthesizer with ElevenLabs-like
+latency, hits are read back from the cache directory. Like the assistant,
+only the repeated (fixed) phrases are stored; --cache-all also stores the
+unique answers, which then compete with them for the --max-mb budget.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import time
+
+from audio.tts_cache import TTSCache
+from benchmarks.common import print_table
+from benchmarks.standins import synthetic_speech, fake_synthesize
+
+REPEATED = [
+    "Good bye, sir",
+    "Closed current tab",
+    "Volume set to 50%",
+    "Volume increased to 60%",
+    "Sorry, I couldn't process that.",
+    "Apologies, Sir. A momentary lapse in the matrix. Could you repeat that?",
+    "Opened chrome",
+]
+VOICE, MODEL, FMT = "voice", "model", "pcm_22050"
+
+
+def synthesize(text: str) -> bytes:
+    seconds = fake_synthesize(text)
+    return synthetic_speech(max(seconds, 0.5), 22050)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--turns", type=int, default=200)
+    parser.add_argument("--repeat-ratio", type=float, default=0.6)
+    parser.add_argument("--max-mb", type=float, default=5.0)
+    parser.add_argument("--presynth", action="store_true", help="pre-synthesize REPEATED first")
+    parser.add_argument("--cache-all", action="store_true", help="also store one-off answers")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    hit_ms, miss_ms = [], []
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = TTSCache(cache_dir, max_bytes=int(args.max_mb * 1024 * 1024))
+        if args.presynth:
+            cache.presynthesize(REPEATED, synthesize, VOICE, MODEL, FMT, background=False)
+
+        for turn in range(args.turns):
+            if rng.random() < args.repeat_ratio:
+                text = rng.choice(REPEATED)
+            else:
+                text = f"Unique answer number {turn}, Sir."
+            start = time.perf_counter()
+            audio = cache.get(text, VOICE, MODEL, FMT)
+            if audio is not None:
+                hit_ms.append((time.perf_counter() - start) * 1000.0)
+                continue
+            audio = synthesize(text)
+            miss_ms.append((time.perf_counter() - start) * 1000.0)
+            if args.cache_all or text in REPEATED:
+                cache.put(text, VOICE, MODEL, FMT, audio)
+
+        print(f"[BENCH] Cache: {cache.report()}")
+
+    print_table("Time until audio is ready to play", [
+        ("cache hit", hit_ms),
+        ("cache miss (stand-in synth)", miss_ms),
+    ])
+
+
+if __name__ == "__main__":
+    main()
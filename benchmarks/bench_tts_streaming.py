@@ -0,0 +1,83 @@
+"""
+Time-to-first-audio: streamed PCM playback vs. the buffered output.wav path.
+
+    python -m benchmarks.bench_tts_streaming [--wav recorded.wav] [--runs 5]
+
+A local stand-in replays recorded (or synthetic) speech with a realistic
+time-to-first-byte and faster-than-realtime chunk pacing, so no ElevenLabs
+credits or sound card are needed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+import wave
+
+import soundfile as sf
+
+from audio.stream_player import StreamPlayer
+from benchmarks.common import print_table
+from benchmarks.standins import load_pcm, synthetic_speech, paced_chunks, NullOutputStream
+
+
+def buffered_first_audio(pcm: bytes, rate: int, pacing: dict, workdir: str) -> float:
+    """Mirror the original speak(): join stream, write file, re-read, play."""
+    start = time.perf_counter()
+    audio_bytes = b"".join(paced_chunks(pcm, rate, **pacing))
+    path = os.path.join(workdir, "output.wav")
+    with wave.open(path, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(rate)
+        wf.writeframes(audio_bytes)
+    data, samplerate = sf.read(path)
+    # sd.play() would start here
+    return (time.perf_counter() - start) * 1000.0
+
+
+def streaming_first_audio(pcm: bytes, rate: int, pacing: dict, jitter_ms: int) -> float:
+    streams = []
+
+    def factory(samplerate, channels):
+        stream = NullOutputStream(samplerate, channels)
+        streams.append(stream)
+        return stream
+
+    player = StreamPlayer(samplerate=rate, jitter_ms=jitter_ms, stream_factory=factory)
+    start = time.perf_counter()
+    player.play_chunks(paced_chunks(pcm, rate, **pacing))
+    return (streams[0].first_write - start) * 1000.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--wav", help="16-bit WAV to replay (default: 6 s synthetic speech)")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--ttfb", type=float, default=0.3, help="stand-in time to first byte (s)")
+    parser.add_argument("--speed", type=float, default=2.0, help="synthesis speed vs realtime")
+    parser.add_argument("--jitter-ms", type=int, default=80)
+    args = parser.parse_args()
+
+    if args.wav:
+        pcm, rate = load_pcm(args.wav)
+    else:
+        rate = 22050
+        pcm = synthetic_speech(6.0, rate)
+    pacing = {"first_byte_s": args.ttfb, "speed": args.speed}
+    print(f"[BENCH] {len(pcm) / (2 * rate):.1f}s clip at {rate} Hz, ttfb={args.ttfb}s, speed={args.speed}x")
+
+    with tempfile.TemporaryDirectory() as workdir:
+        buffered = [buffered_first_audio(pcm, rate, pacing, workdir) for _ in range(args.runs)]
+    streamed = [streaming_first_audio(pcm, rate, pacing, args.jitter_ms) for _ in range(args.runs)]
+
+    print_table("Time to first audio", [
+        ("buffered (output.wav)", buffered),
+        (f"streaming (jitter {args.jitter_ms} ms)", streamed),
+    ])
+
+
+if __name__ == "__main__":
+    main()
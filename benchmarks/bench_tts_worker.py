@@ -0,0 +1,107 @@
+"""
+TTS worker on a headless box: per-utterance timings, priority and cancellation.
+
+    python -m benchmarks.bench_tts_worker
+
+Uses DummyEngine and a stand-in output stream, so it runs on Linux without
+a sound card, ElevenLabs key or SAPI voice. The streamed section drives
+ElevenLabsEngine with a stand-in client whose stream() is lazy like the
+SDK's (nothing is requested until it is iterated): the request must start
+on the synth thread, so the gap between back-to-back utterances is not
+the time to the first chunk.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from audio.stream_player import StreamPlayer
+from audio.tts_worker import TTSWorker, DummyEngine, ElevenLabsEngine, PRIORITY_URGENT, PRIORITY_BACKGROUND
+from benchmarks.common import print_table
+from benchmarks.standins import NullOutputStream
+
+RATE = 16000
+
+
+class LazyStreamClient:
+    """client.text_to_speech.stream(): a generator that connects when first iterated."""
+
+    def __init__(self, first_chunk_s: float, seconds: float = 0.5):
+        self.text_to_speech = self
+        self.first_chunk_s = first_chunk_s
+        self.seconds = seconds
+
+    def stream(self, text, voice_id, model_id, output_format):
+        def chunks():
+            time.sleep(self.first_chunk_s)
+            chunk = bytes(2 * RATE // 20)   # 50 ms, delivered faster than real time
+            for _ in range(int(self.seconds * 20)):
+                time.sleep(0.005)
+                yield chunk
+        return chunks()
+
+
+def streamed(first_chunk_s: float, n: int = 6):
+    player = StreamPlayer(samplerate=RATE, stream_factory=lambda sr, ch: NullOutputStream(sr, ch))
+    engine = ElevenLabsEngine(LazyStreamClient(first_chunk_s), "voice", "model", f"pcm_{RATE}")
+    worker = TTSWorker([engine], player)
+    utts = [worker.say(f"Streamed sentence {i}.", stream=True) for i in range(n)]
+    for utt in utts:
+        utt.wait()
+    worker.shutdown()
+    gaps = [(b.timings["first_audio"] - a.timings["play_end"]) * 1000 for a, b in zip(utts, utts[1:])]
+    return [u.report()["synth_ms"] for u in utts], gaps
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--utterances", type=int, default=10)
+    parser.add_argument("--synth-latency", type=float, default=0.05)
+    parser.add_argument("--first-chunk-ms", type=int, default=300, help="streamed: time to the first chunk")
+    args = parser.parse_args()
+
+    player = StreamPlayer(samplerate=RATE, stream_factory=lambda sr, ch: NullOutputStream(sr, ch))
+    worker = TTSWorker([DummyEngine(samplerate=RATE, latency_s=args.synth_latency, wpm=1200)], player)
+
+    # Steady stream of utterances
+    utts = [worker.say(f"Status update number {i}, Sir.") for i in range(args.utterances)]
+    for utt in utts:
+        utt.wait()
+    reports = [u.report() for u in utts]
+
+    # Priority: an urgent utterance queued behind background ones plays first
+    background = [worker.say(f"Background note {i}.", priority=PRIORITY_BACKGROUND) for i in range(5)]
+    urgent = worker.say("Urgent, Sir.", priority=PRIORITY_URGENT)
+    for utt in background + [urgent]:
+        utt.wait()
+    played_before = sum(1 for u in background if u.timings["play_start"] < urgent.timings["play_start"])
+    print(f"[BENCH] Background utterances played before the urgent one: {played_before} of 5")
+
+    # Cancellation: a long utterance stops within one playback block
+    long_utt = worker.say("word " * 400)
+    while "first_audio" not in long_utt.timings:
+        time.sleep(0.005)
+    time.sleep(0.2)
+    t_cancel = time.perf_counter()
+    worker.cancel(long_utt)
+    long_utt.wait()
+    print(f"[BENCH] Cancel → playback stopped in {(long_utt.timings['play_end'] - t_cancel) * 1000:.1f} ms")
+
+    worker.shutdown()
+    print_table("Per-utterance timings", [
+        ("queue wait", [r["queue_ms"] for r in reports]),
+        ("synthesis", [r["synth_ms"] for r in reports]),
+        ("time to first audio", [r["first_audio_ms"] for r in reports]),
+        ("playback", [r["play_ms"] for r in reports]),
+    ])
+
+    synth, gaps = streamed(args.first_chunk_ms / 1000.0)
+    print_table(f"Streamed utterances back to back ({args.first_chunk_ms} ms to first chunk)", [
+        ("synthesis (to first chunk)", synth),
+        ("silence between utterances", gaps),
+    ])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Endpointing: local VAD vs. Recognizer.listen on recorded or synthetic audio.
+
+    python -m benchmarks.bench_vad [--dir recordings/] [--spectral]
+
+Each WAV should hold one utterance; it is padded with 2 s of its own
+background noise. "Endpoint latency" is audio time between the true end of
+speech and the moment the utterance is handed off. CPU is process time per
+second of audio.
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import os
+import time
+
+import numpy as np
+import speech_recognition as sr
+
+from audio.capture import frame_rms
+from audio.vad import UtteranceSegmenter, VADConfig
+from benchmarks.common import print_table
+from benchmarks.standins import load_pcm, synthetic_speech
+
+RATE = 16000
+FRAME = RATE // 50  # 20 ms
+
+
+def synthetic_cases(n: int = 8):
+    rng = np.random.default_rng(1)
+    for i in range(n):
+        noise_level = 60 + 40 * (i % 3)
+        speech = np.frombuffer(synthetic_speech(1.0 + 0.4 * i, RATE, seed=i), dtype=np.int16).astype(np.float32)
+        lead = int(0.8 * RATE)
+        audio = rng.standard_normal(lead + len(speech) + 2 * RATE) * noise_level
+        audio[lead:lead + len(speech)] += speech
+        yield f"synthetic-{i}", np.clip(audio, -32768, 32767).astype(np.int16), lead, lead + len(speech)
+
+
+def file_cases(folder: str):
+    """True speech bounds estimated offline from frame energy."""
+    for path in sorted(glob.glob(os.path.join(folder, "*.wav"))):
+        pcm, rate = load_pcm(path)
+        if rate != RATE:
+            print(f"[BENCH] Skipping {path}: {rate} Hz (need {RATE})")
+            continue
+        x = np.frombuffer(pcm, dtype=np.int16)
+        rms = np.array([frame_rms(x[i:i + FRAME]) for i in range(0, len(x) - FRAME + 1, FRAME)])
+        active = np.nonzero(rms > 0.1 * rms.max())[0]
+        start, end = active[0] * FRAME, (active[-1] + 1) * FRAME
+        quiet = x[:max(FRAME, start)]
+        pad = np.resize(quiet, 2 * RATE) if len(quiet) else np.zeros(2 * RATE, dtype=np.int16)
+        yield os.path.basename(path), np.concatenate([x, pad]), start, end
+
+
+def run_vad(audio, config):
+    seg = UtteranceSegmenter(RATE, config)
+    t0 = time.process_time()
+    result = None
+    for i in range(0, len(audio) - FRAME + 1, FRAME):
+        result = seg.feed(audio[i:i + FRAME], i + FRAME) or result
+        if result is not None:
+            break
+    cpu = time.process_time() - t0
+    return result, cpu, (i + FRAME) / RATE
+
+
+class _CountingStream(sr.AudioSource):
+    def __init__(self, audio):
+        self.audio = audio
+        self.pos = 0
+        self.SAMPLE_RATE, self.SAMPLE_WIDTH, self.CHUNK = RATE, 2, 1024
+        self.stream = self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+    def read(self, size):
+        chunk = self.audio[self.pos:self.pos + size]
+        self.pos += len(chunk)
+        return chunk.tobytes()
+
+
+def run_recognizer(audio, lead_noise):
+    r = sr.Recognizer()
+    r.dynamic_energy_threshold = False
+    r.energy_threshold = max(50.0, frame_rms(lead_noise) * 1.5)
+    src = _CountingStream(audio)
+    try:
+        r.listen(src, timeout=5, phrase_time_limit=8)
+    except sr.WaitTimeoutError:
+        return None
+    return src.pos
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dir", help="folder of 16 kHz 16-bit WAV utterances")
+    parser.add_argument("--spectral", action="store_true")
+    parser.add_argument("--hangover-ms", type=int, default=350)
+    args = parser.parse_args()
+
+    config = VADConfig(hangover_ms=args.hangover_ms, spectral=args.spectral)
+    cases = file_cases(args.dir) if args.dir else synthetic_cases()
+
+    vad_delay, sr_delay, cpu_ms_per_s = [], [], []
+    clipped = missed = total = 0
+    for name, audio, start, end in cases:
+        total += 1
+        segment, cpu, audio_s = run_vad(audio, config)
+        cpu_ms_per_s.append(cpu * 1000.0 / audio_s)
+        if segment is None:
+            missed += 1
+        else:
+            vad_delay.append((segment.detected_pos - end) * 1000.0 / RATE)
+            if segment.start_pos > start:
+                clipped += 1
+        consumed = run_recognizer(audio, audio[:max(FRAME, start // 2)])
+        if consumed is not None:
+            sr_delay.append((consumed - end) * 1000.0 / RATE)
+
+    print(f"[BENCH] {total} utterances, VAD missed {missed}, onset clipped {clipped}")
+    print_table("Endpoint latency after end of speech", [
+        (f"local VAD (hangover {args.hangover_ms} ms)", vad_delay),
+        ("Recognizer.listen", sr_delay),
+    ])
+    print_table("VAD CPU per second of audio", [("local VAD", cpu_ms_per_s)], unit="ms CPU")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Wake-word detector: false-accept / false-reject rates and idle CPU.
+
+    python -m benchmarks.bench_wakeword [--dir recordings/] [--idle-minutes 10]
+
+With --dir the folder needs enroll/, positive/ and negative/ subfolders of
+16 kHz 16-bit WAVs; otherwise formant-synthesised words with varied speed,
+pitch and noise stand in. Each case is padded with background noise and fed
+frame by frame through WakeWordListener exactly as the capture thread would.
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import os
+import time
+
+import numpy as np
+
+from audio.wakeword import DTWWakeModel, WakeWordListener
+from benchmarks.common import print_table
+from benchmarks.standins import WORDS, load_pcm, synthetic_word
+
+RATE = 16000
+FRAME = RATE // 50
+
+
+class _Engine:
+    samplerate = RATE
+
+    def add_listener(self, cb):
+        pass
+
+    def remove_listener(self, cb):
+        pass
+
+
+def _word(name, rng):
+    pcm = synthetic_word(name, RATE, speed=rng.uniform(0.85, 1.15),
+                         pitch=rng.uniform(100, 200), seed=int(rng.integers(1 << 30)))
+    return np.frombuffer(pcm, dtype=np.int16)
+
+
+def synthetic_sets(rng, n_pos: int = 40, n_neg_each: int = 20):
+    enroll = [
+        np.frombuffer(synthetic_word("rex", RATE, speed=s, pitch=p, seed=i), dtype=np.int16)
+        for i, (s, p) in enumerate([(1.0, 130), (0.95, 150), (1.05, 115)])
+    ]
+    positives = [_word("rex", rng) for _ in range(n_pos // 2)]
+    # "Rex, what time ..." with no pause after the wake word
+    positives += [np.concatenate([_word("rex", rng), _word("time", rng), _word("open", rng)])
+                  for _ in range(n_pos - n_pos // 2)]
+    negatives = [_word(w, rng) for w in WORDS if w != "rex" for _ in range(n_neg_each)]
+    return enroll, positives, negatives
+
+
+def folder_sets(folder):
+    def load(sub):
+        out = []
+        for path in sorted(glob.glob(os.path.join(folder, sub, "*.wav"))):
+            pcm, rate = load_pcm(path)
+            if rate == RATE:
+                out.append(np.frombuffer(pcm, dtype=np.int16))
+            else:
+                print(f"[BENCH] Skipping {path}: {rate} Hz (need {RATE})")
+        return out
+    return load("enroll"), load("positive"), load("negative")
+
+
+def run_case(listener, audio, rng, noise_level):
+    lead = (rng.standard_normal(int(0.6 * RATE)) * noise_level).astype(np.int16)
+    tail = (rng.standard_normal(int(0.8 * RATE)) * noise_level).astype(np.int16)
+    noisy = audio.astype(np.float32) + rng.standard_normal(len(audio)) * noise_level
+    x = np.concatenate([lead, np.clip(noisy, -32768, 32767).astype(np.int16), tail])
+    before = listener.detections
+    listener.resume()
+    for i in range(0, len(x) - FRAME + 1, FRAME):
+        listener.feed(x[i:i + FRAME], i + FRAME)
+    return listener.detections > before
+
+
+def idle_cpu(model, minutes, rng, noise_level):
+    """Mostly background noise with an unrelated word every ~15 s."""
+    listener = WakeWordListener(_Engine(), model)
+    chunk = 15 * RATE
+    pos = 0
+    for _ in range(int(minutes * 60 / 15)):
+        x = (rng.standard_normal(chunk) * noise_level).astype(np.int16)
+        word = _word("open", rng)
+        x[RATE:RATE + len(word)] += word
+        for i in range(0, chunk, FRAME):
+            pos += FRAME
+            listener.feed(x[i:i + FRAME], pos)
+    return listener
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dir", help="folder with enroll/, positive/ and negative/ WAVs")
+    parser.add_argument("--idle-minutes", type=float, default=10.0)
+    parser.add_argument("--noise", type=float, default=80.0, help="background noise RMS (int16)")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(7)
+    enroll, positives, negatives = folder_sets(args.dir) if args.dir else synthetic_sets(rng)
+    model = DTWWakeModel.enroll(enroll, RATE)
+    print(f"[BENCH] Enrolled {len(model.templates)} templates, threshold {model.threshold:.2f}")
+
+    listener = WakeWordListener(_Engine(), model)
+    latencies = []
+    accepted = 0
+    for audio in positives:
+        start = time.perf_counter()
+        accepted += run_case(listener, audio, rng, args.noise)
+        latencies.append((time.perf_counter() - start) * 1000 / (len(audio) / RATE + 1.4))
+    false_accepts = sum(run_case(listener, audio, rng, args.noise) for audio in negatives)
+
+    fr = 1 - accepted / len(positives) if positives else float("nan")
+    fa = false_accepts / len(negatives) if negatives else float("nan")
+    print(f"[BENCH] False reject: {fr:.1%} ({len(positives) - accepted}/{len(positives)})")
+    print(f"[BENCH] False accept: {fa:.1%} ({false_accepts}/{len(negatives)} non-wake words)")
+
+    idle = idle_cpu(model, args.idle_minutes, rng, args.noise)
+    per_hour = idle.cpu_fraction * 3600
+    print(
+        f"[BENCH] Idle: {idle.cpu_fraction * 100:.3f}% of one core "
+        f"= {per_hour:.1f} CPU-seconds per hour ({idle.evaluations} bursts evaluated, "
+        f"{idle.detections} false wakes in {args.idle_minutes:g} min)"
+    )
+    print_table("Detector CPU per second of audio (positives)", [("wake word", latencies)])
+
+
+if __name__ == "__main__":
+    main()
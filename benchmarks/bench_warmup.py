@@ -0,0 +1,133 @@
+"""
+First-turn latency with the startup warm-up (warmup.py) vs initializing
+each subsystem on first use, as the assistant did before.
+
+    python -m benchmarks.bench_warmup [--runs 5] [--press-ms 300] [--real]
+
+Subsystems are stand-ins that sleep for a typical one-time cost (device
+enumeration, TLS handshakes, SAPI voice init, history file); they are
+network/device waits, so sleeping models them well. A simulated user
+presses the button --press-ms after launch and speaks for 1.2 s; the turn
+then needs STT, the LLM and TTS. First-turn latency is button press ->
+first audio. With the warm-up, the turn waits only for what it is about to
+use, and only if it isn't warm yet.
+
+--real also runs assistant.start_warmup() (dummy TTS) and prints how long
+each real task took on this machine.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import threading
+import time
+
+from benchmarks.common import print_table
+from warmup import WarmUp
+
+# One-time costs (ms), what the first use of each subsystem pays
+COSTS = {
+    "history": 80,      # chat history JSON
+    "mic": 250,         # device enumeration + opening the stream
+    "stt": 150,         # recognizer / model set-up
+    "llm": 300,         # DNS + TLS to Groq
+    "tts": 400,         # pyttsx3 / SAPI voice lookup, output stream
+    "elevenlabs": 350,  # SDK import + TLS to ElevenLabs
+}
+# Per-turn work that is there warm or cold (ms)
+SPEECH_MS, STT_MS, TTFT_MS, SYNTH_MS = 1200, 300, 250, 200
+
+
+class Subsystem:
+    """Initialized once, on first get(), like the assistant's lazy getters."""
+
+    def __init__(self, cost_ms):
+        self.cost = cost_ms / 1000
+        self._ready = False
+        self._lock = threading.Lock()
+
+    def get(self):
+        with self._lock:
+            if not self._ready:
+                time.sleep(self.cost)
+                self._ready = True
+
+
+def first_turn(press_ms, warm: bool):
+    systems = {name: Subsystem(ms) for name, ms in COSTS.items()}
+    warmup = None
+    if warm:
+        warmup = WarmUp()
+        for name, system in systems.items():
+            warmup.add(name, system.get)
+        warmup.start()
+
+    def need(*names):
+        if warmup is not None:
+            warmup.wait(*names)
+        for name in names:
+            systems[name].get()
+
+    time.sleep(press_ms / 1000)
+    press = time.perf_counter()
+    need("mic", "stt")                     # listen()
+    time.sleep(SPEECH_MS / 1000)
+    time.sleep(STT_MS / 1000)
+    systems["history"].get()               # brain: memory.get_context()
+    systems["llm"].get()                   # the request itself pays an un-warmed connection
+    time.sleep(TTFT_MS / 1000)
+    need("tts")                            # speak_stream()
+    systems["elevenlabs"].get()
+    time.sleep(SYNTH_MS / 1000)
+    first_audio = time.perf_counter()
+    if warmup is not None:
+        warmup.join()
+    report = warmup.report() if warmup is not None else {}
+    return (first_audio - press) * 1000, report, dict(warmup.waited) if warmup else {}
+
+
+def real_warmup():
+    os.environ.setdefault("REX_TTS_ENGINE", "dummy")
+    os.environ.setdefault("GROK_API_KEY", "benchmark")
+    import assistant
+    warm = assistant.start_warmup()
+    warm.join(30)
+    rows = [(name, [r["ms"] or 0.0]) for name, r in warm.report().items()]
+    print_table("Real warm-up tasks on this machine", rows)
+    for name, r in warm.report().items():
+        if r["error"]:
+            print(f"  {name}: {r['error']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--press-ms", type=int, default=300, help="button press after launch")
+    parser.add_argument("--real", action="store_true")
+    args = parser.parse_args()
+
+    rows, ready, waits = [], {}, {}
+    for label, warm in (("on first use (serial)", False), ("parallel warm-up", True)):
+        samples = []
+        for _ in range(args.runs):
+            ms, report, waited = first_turn(args.press_ms, warm)
+            samples.append(ms)
+            if report:
+                ready, waits = report, waited
+        rows.append((label, samples))
+    print_table(f"First turn: button press ({args.press_ms} ms after launch) -> first audio", rows)
+    floor = SPEECH_MS + STT_MS + TTFT_MS + SYNTH_MS
+    print(f"(speech + STT + first token + synthesis alone: {floor} ms)")
+
+    print("\n-- Warm-up tasks (stand-in costs), ready at ms after launch")
+    for name, r in ready.items():
+        print(f"  {name:<12}{r['ms']:>8.0f} ms   ready at {r['ready_at_ms']:>6.0f}")
+    print("-- First turn waited for: " + (", ".join(f"{k} {v * 1000:.0f} ms" for k, v in waits.items()) or "nothing"))
+
+    if args.real:
+        real_warmup()
+
+
+if __name__ == "__main__":
+    main()
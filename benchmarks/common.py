@@ -0,0 +1,69 @@
+"""
+Shared helpers for the benchmark scripts.
+
+Run any benchmark from the repo root, e.g.:
+    python -m benchmarks.bench_realtime_templates
+"""
+
+from __future__ import annotations
+
+import statistics
+import time
+from typing import Callable, Iterable, List
+
+
+def time_call(fn: Callable, repeat: int = 1) -> List[float]:
+    """Run fn() `repeat` times and return wall-clock durations in ms."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return samples
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile (samples need not be sorted)."""
+    if not samples:
+        return float("nan")
+    ordered = sorted(samples)
+    k = max(0, min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1)))))
+    return ordered[k]
+
+
+def summarize(samples: List[float]) -> dict:
+    """Return n / mean / p50 / p95 / max for a list of ms samples."""
+    if not samples:
+        return {"n": 0, "mean": float("nan"), "p50": float("nan"), "p95": float("nan"), "max": float("nan")}
+    return {
+        "n": len(samples),
+        "mean": statistics.fmean(samples),
+        "p50": percentile(samples, 50),
+        "p95": percentile(samples, 95),
+        "max": max(samples),
+    }
+
+
+def print_table(title: str, rows: Iterable[tuple], unit: str = "ms") -> None:
+    """Print (label, samples) rows as a fixed-width latency table."""
+    print(f"\n== {title} ==", flush=True)
+    print(f"{'case':<34}{'n':>6}{'mean':>12}{'p50':>12}{'p95':>12}{'max':>12}   ({unit})")
+    for label, samples in rows:
+        s = summarize(samples)
+        print(
+            f"{label:<34}{s['n']:>6}{s['mean']:>12.3f}{s['p50']:>12.3f}"
+            f"{s['p95']:>12.3f}{s['max']:>12.3f}"
+        )
+
+
+def word_errors(reference: str, hypothesis: str) -> tuple:
+    """(edit distance in words, reference word count) — WER is their ratio."""
+    ref = reference.lower().split()
+    hyp = hypothesis.lower().split()
+    prev = list(range(len(hyp) + 1))
+    for i, r in enumerate(ref, 1):
+        cur = [i] + [0] * len(hyp)
+        for j, h in enumerate(hyp, 1):
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (r != h))
+        prev = cur
+    return prev[-1], len(ref)
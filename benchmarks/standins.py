@@ -0,0 +1,151 @@
+"""
+Local stand-ins used by the benchmarks in place of network services and
+sound devices. They pace data like the real thing but never touch the
+network or an audio card.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+import wave
+from typing import Iterator, Tuple
+
+import numpy as np
+
+
+def load_pcm(path: str) -> Tuple[bytes, int]:
+    """Read a 16-bit mono/stereo WAV as (mono int16 PCM bytes, samplerate)."""
+    with wave.open(path, "rb") as wf:
+        rate = wf.getframerate()
+        channels = wf.getnchannels()
+        if wf.getsampwidth() != 2:
+            raise ValueError(f"{path}: only 16-bit WAV files are supported")
+        data = np.frombuffer(wf.readframes(wf.getnframes()), dtype=np.int16)
+    if channels > 1:
+        data = data.reshape(-1, channels).mean(axis=1).astype(np.int16)
+    return data.tobytes(), rate
+
+
+def synthetic_speech(seconds: float, samplerate: int = 22050, seed: int = 0) -> bytes:
+    """Speech-like test signal: syllable-rate amplitude-modulated harmonics."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * samplerate)) / samplerate
+    f0 = 140 + 20 * np.sin(2 * np.pi * 0.7 * t)
+    phase = 2 * np.pi * np.cumsum(f0) / samplerate
+    voiced = sum(np.sin(k * phase) / k for k in range(1, 6))
+    envelope = np.clip(np.sin(2 * np.pi * 4.0 * t), 0, None) ** 0.5
+    signal = 0.3 * voiced * envelope + 0.01 * rng.standard_normal(t.size)
+    return (np.clip(signal, -1, 1) * 32767).astype(np.int16).tobytes()
+
+
+# (F1, F2, seconds) per phone; roughly "rex" and a few other short words
+WORDS = {
+    "rex": [(350, 2300, 0.08), (550, 1800, 0.16), (300, 1600, 0.06), (0, 0, 0.10)],
+    "next": [(300, 1500, 0.07), (550, 1800, 0.15), (300, 1600, 0.06), (0, 0, 0.08)],
+    "yes": [(300, 2200, 0.07), (550, 1850, 0.15), (0, 0, 0.12)],
+    "time": [(0, 0, 0.05), (750, 1200, 0.12), (350, 2000, 0.10), (300, 1200, 0.08)],
+    "open": [(500, 900, 0.14), (300, 1000, 0.06), (550, 1800, 0.08), (300, 1500, 0.07)],
+    "music": [(300, 1200, 0.07), (300, 900, 0.10), (0, 0, 0.08), (350, 2200, 0.08), (0, 0, 0.05)],
+}
+
+
+def synthetic_word(word: str, samplerate: int = 16000, speed: float = 1.0,
+                   pitch: float = 130.0, seed: int = 0) -> bytes:
+    """
+    Formant-synthesised stand-in for a spoken word from WORDS; (0, 0) phones
+    are noise bursts. speed/pitch/seed give different "speakers" per call.
+    """
+    rng = np.random.default_rng(seed)
+    parts = []
+    for f1, f2, dur in WORDS[word]:
+        n = int(dur / speed * samplerate)
+        t = np.arange(n) / samplerate
+        if f1 == 0:
+            seg = 0.08 * rng.standard_normal(n)
+        else:
+            phase = 2 * np.pi * pitch * t
+            seg = np.zeros(n)
+            for k in range(1, int(4000 / pitch)):
+                fk = k * pitch
+                gain = np.exp(-((fk - f1) / 120.0) ** 2) + 0.6 * np.exp(-((fk - f2) / 180.0) ** 2)
+                seg += gain * np.sin(k * phase)
+            seg *= 0.25
+        ramp = min(n // 4, int(0.01 * samplerate))
+        if ramp:
+            seg[:ramp] *= np.linspace(0, 1, ramp)
+            seg[-ramp:] *= np.linspace(1, 0, ramp)
+        parts.append(seg)
+    signal = np.concatenate(parts) + 0.003 * rng.standard_normal(sum(len(p) for p in parts))
+    return (np.clip(signal, -1, 1) * 32767).astype(np.int16).tobytes()
+
+
+def paced_chunks(
+    pcm: bytes,
+    samplerate: int,
+    chunk_ms: int = 100,
+    first_byte_s: float = 0.3,
+    speed: float = 2.0,
+) -> Iterator[bytes]:
+    """
+    Yield PCM like a TTS HTTP stream: a time-to-first-byte delay, then chunks
+    produced `speed` times faster than realtime.
+    """
+    chunk_bytes = int(samplerate * 2 * chunk_ms / 1000)
+    chunk_bytes -= chunk_bytes % 2
+    time.sleep(first_byte_s)
+    for i in range(0, len(pcm), chunk_bytes):
+        yield pcm[i:i + chunk_bytes]
+        time.sleep(chunk_ms / 1000.0 / speed)
+
+
+class NullOutputStream:
+    """
+    Stand-in for sounddevice.RawOutputStream. write() blocks like a real
+    device once more than `buffer_s` of audio is queued, and records when
+    the first frame was handed over.
+    """
+
+    def __init__(self, samplerate: int, channels: int = 1, buffer_s: float = 0.1):
+        self.samplerate = samplerate
+        self.channels = channels
+        self.latency = buffer_s
+        self.first_write = None
+        self.bytes_written = 0
+        self._play_head = None  # wall time at which queued audio runs out
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def close(self):
+        pass
+
+    def write(self, data: bytes):
+        now = time.perf_counter()
+        if self.first_write is None:
+            self.first_write = now
+        if self._play_head is None or self._play_head < now:
+            self._play_head = now
+        self._play_head += len(data) / (self.samplerate * 2 * self.channels)
+        self.bytes_written += len(data)
+        backlog = self._play_head - time.perf_counter()
+        if backlog > self.latency:
+            time.sleep(backlog - self.latency)
+        return False
+
+
+def paced_tokens(text: str, first_token_s: float = 0.35, tokens_per_s: float = 60.0) -> Iterator[str]:
+    """Yield word-ish tokens like a streamed LLM completion."""
+    time.sleep(first_token_s)
+    for token in re.findall(r"\S+\s*", text):
+        yield token
+        time.sleep(1.0 / tokens_per_s)
+
+
+def fake_synthesize(text: str, base_s: float = 0.25, per_char_s: float = 0.004, wpm: float = 160.0) -> float:
+    """Simulate TTS latency; returns the spoken duration of the audio in seconds."""
+    time.sleep(base_s + per_char_s * len(text))
+    return len(text.split()) / wpm * 60.0
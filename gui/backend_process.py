@@ -0,0 +1,215 @@
+"""
+Assistant backend in a child process.
+
+Audio capture, STT, LLM streaming and TTS decoding then hold their own GIL,
+so they can't stall the GUI's painter and vice versa. The two sides talk
+over a multiprocessing Pipe:
+
+    GUI -> backend   ("listen", bool), ("shutdown",)
+    backend -> GUI   ("ready", {}), ("state", {mode/partial/timings...}),
+                     ("stopped", {})    # the loop ended by itself ("goodbye")
+
+Every backend message carries its send time (time.monotonic, which is
+system-wide) so the GUI can report IPC latency. Audio levels don't go
+through the pipe: the playback and capture LevelRings live in shared
+memory created by the GUI and attached by the backend.
+
+This module imports no Qt, so the child process never loads it.
+"""
+
+from __future__ import annotations
+
+import multiprocessing as mp
+import threading
+import time
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable, Dict, Optional
+
+from audio import levels
+from audio.levels import LevelRing
+
+RINGS = ("playback", "capture")
+RING_CAPACITY = 256
+
+
+class BackendProcess:
+    """GUI-side handle: starts the child, relays its events, shuts it down."""
+
+    def __init__(self, on_event: Callable[[str, dict], None], target: Optional[Callable] = None):
+        self.on_event = on_event
+        self.target = target or backend_main
+        self.process: Optional[mp.Process] = None
+        self._conn = None
+        self._send_lock = threading.Lock()
+        self._shm: Dict[str, SharedMemory] = {}
+        self._reader: Optional[threading.Thread] = None
+        self.ready = threading.Event()
+        self.latencies = []   # seconds from backend send to GUI receipt
+
+    def start(self):
+        for name in RINGS:
+            shm = SharedMemory(create=True, size=LevelRing.nbytes(RING_CAPACITY))
+            self._shm[name] = shm
+            levels.attach(name, shm.buf, RING_CAPACITY)
+        ctx = mp.get_context("spawn")
+        self._conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(
+            target=self.target,
+            args=(child_conn, {name: shm.name for name, shm in self._shm.items()}),
+            name="rex-backend",
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        self._reader = threading.Thread(target=self._read, name="backend-events", daemon=True)
+        self._reader.start()
+        print(f"[BACKEND] Started child process {self.process.pid}", flush=True)
+
+    def send(self, *message) -> bool:
+        with self._send_lock:
+            if self._conn is None:
+                return False
+            try:
+                self._conn.send(message)
+                return True
+            except (OSError, ValueError):
+                return False
+
+    def set_listening(self, on: bool):
+        self.send("listen", on)
+
+    def _read(self):
+        while True:
+            try:
+                kind, payload, sent_at = self._conn.recv()
+            except (EOFError, OSError, ValueError):
+                break
+            self.latencies.append(time.monotonic() - sent_at)
+            if kind == "ready":
+                self.ready.set()
+            try:
+                self.on_event(kind, payload)
+            except Exception as e:
+                print(f"[BACKEND] Event handler error: {e}", flush=True)
+        if self.process is not None and not self.process.is_alive() and self.process.exitcode:
+            print(f"[BACKEND] Child process exited with code {self.process.exitcode}", flush=True)
+
+    def shutdown(self, timeout: float = 3.0):
+        """Ask the backend to stop, then terminate it if it doesn't; frees the shared memory."""
+        if self.process is not None:
+            self.send("shutdown")
+            self.process.join(timeout)
+            if self.process.is_alive():
+                print("[BACKEND] Child did not exit, terminating", flush=True)
+                self.process.terminate()
+                self.process.join(1.0)
+        with self._send_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+        if self._reader is not None:
+            self._reader.join(1.0)
+        for name, shm in self._shm.items():
+            levels.detach(name)
+            try:
+                shm.close()
+            except BufferError:
+                pass  # a view is still alive somewhere; unlinking still frees it at exit
+            shm.unlink()
+        self._shm.clear()
+        self.process = None
+
+
+# ============ Child process ============
+
+class _Channel:
+    """Backend -> GUI sender, shared by the assistant's threads."""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self._lock = threading.Lock()
+
+    def send(self, kind: str, **payload):
+        with self._lock:
+            try:
+                self.conn.send((kind, payload, time.monotonic()))
+            except (OSError, ValueError):
+                pass  # GUI is gone; the command loop will see EOF
+
+
+def attach_rings(ring_names: dict) -> list:
+    """Back the named level rings with the GUI's shared memory."""
+    blocks = []
+    for name, shm_name in ring_names.items():
+        shm = SharedMemory(name=shm_name)
+        levels.attach(name, shm.buf, RING_CAPACITY)
+        blocks.append(shm)
+    return blocks
+
+
+def serve(conn, channel: _Channel, run_loop: Callable[[Callable[[], bool]], None]):
+    """
+    Command loop of the child: runs run_loop(should_continue) on a thread
+    whenever the GUI asks to listen, until "shutdown" or the GUI goes away.
+    """
+    listening = threading.Event()
+    stopping = threading.Event()
+
+    def worker():
+        while not stopping.is_set():
+            if not listening.wait(0.2):
+                continue
+            print("[WORKER] Started", flush=True)
+            run_loop(lambda: listening.is_set() and not stopping.is_set())
+            print("[WORKER] Finished", flush=True)
+            if listening.is_set() and not stopping.is_set():
+                listening.clear()
+                channel.send("stopped")
+
+    thread = threading.Thread(target=worker, name="conversation", daemon=True)
+    thread.start()
+    channel.send("ready")
+    try:
+        while True:
+            try:
+                message = conn.recv()
+            except (EOFError, OSError):
+                break
+            if message[0] == "listen":
+                if message[1]:
+                    listening.set()
+                else:
+                    listening.clear()
+            elif message[0] == "shutdown":
+                break
+    finally:
+        stopping.set()
+        listening.clear()
+        thread.join(3.0)
+
+
+def backend_main(conn, ring_names: dict):
+    """Child process entry point: the real assistant."""
+    blocks = attach_rings(ring_names)
+    channel = _Channel(conn)
+
+    import assistant
+    assistant.register_gui_callbacks(
+        idle_cb=lambda: channel.send("state", mode="IDLE"),
+        listening_cb=lambda: channel.send("state", mode="LISTENING", partial=""),
+        speaking_cb=lambda: channel.send("state", mode="SPEAKING"),
+        partial_cb=lambda text: channel.send("state", partial=text),
+        timings_cb=lambda timings: channel.send("state", timings=timings),
+    )
+    assistant.start_warmup()
+    try:
+        serve(conn, channel, assistant.conversation_loop)
+    finally:
+        for name in ring_names:
+            levels.detach(name)
+        for shm in blocks:
+            try:
+                shm.close()
+            except BufferError:
+                pass
+        print("[BACKEND] Exiting", flush=True)
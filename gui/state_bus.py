@@ -0,0 +1,72 @@
+"""
+Thread-safe state channel from the assistant threads to the GUI.
+
+post() can be called from any thread: it merges the fields into a pending
+snapshot under a lock and, unless a delivery is already scheduled, pokes the
+GUI thread through a queued signal. The GUI thread waits one coalescing
+interval and then emits `changed` once with everything that arrived, so a
+burst of transitions (IDLE -> LISTENING -> IDLE within a few ms) costs one
+repaint and only the latest value of each field is delivered.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from PyQt6.QtCore import QObject, QTimer, Qt, pyqtSignal
+
+
+class StateBus(QObject):
+    """
+    Fields used by the widget: mode ("IDLE" | "LISTENING" | "SPEAKING"),
+    partial (transcript so far), level (0-1), timings (stage durations).
+    Create it on the GUI thread.
+    """
+
+    changed = pyqtSignal(dict)   # merged changes, on the GUI thread
+    _poke = pyqtSignal()
+
+    def __init__(self, coalesce_ms: int = 16, parent: QObject | None = None):
+        super().__init__(parent)
+        self.state: dict = {}
+        self._lock = threading.Lock()
+        self._pending: dict = {}
+        self._first_post = 0.0
+        self._scheduled = False
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(coalesce_ms)
+        self._timer.timeout.connect(self._flush)
+        self._poke.connect(self._schedule, Qt.ConnectionType.QueuedConnection)
+        # Stats for the stress benchmark
+        self.posted = 0
+        self.delivered = 0
+        self.max_delay = 0.0   # seconds from the first post of a batch to its delivery
+
+    def post(self, **fields):
+        """Merge fields into the next delivery; safe from any thread."""
+        with self._lock:
+            self._pending.update(fields)
+            self.posted += 1
+            if self._scheduled:
+                return
+            self._scheduled = True
+            self._first_post = time.perf_counter()
+        self._poke.emit()
+
+    def _schedule(self):
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def _flush(self):
+        with self._lock:
+            changes, self._pending = self._pending, {}
+            self._scheduled = False
+            first = self._first_post
+        if not changes:
+            return
+        self.max_delay = max(self.max_delay, time.perf_counter() - first)
+        self.delivered += 1
+        self.state.update(changes)
+        self.changed.emit(changes)
@@ -5,27 +5,36 @@ Simple PyQt6 Voice GUI with Start/Stop button and animated wave.
 from __future__ import annotations
 
 import math
+import os
 import sys
 import time
 from dataclasses import dataclass
 
+import numpy as np
 from PyQt6.QtCore import Qt, QTimer, QThread, pyqtSignal, QObject, QRectF, QPointF
-from PyQt6.QtGui import QColor, QPainter, QPainterPath, QPen, QLinearGradient, QBrush, QFont
+from PyQt6.QtGui import QColor, QPainter, QPainterPath, QPen, QPolygonF, QLinearGradient, QBrush, QFont, QFontMetrics
 from PyQt6.QtWidgets import QApplication, QWidget
 
+from audio import levels
+from gui.state_bus import StateBus
+
 
 # ============ Global State ============
 
 _gui_widget: VoiceWidget | None = None
 _listener_worker: ListenerWorker | None = None
 _listener_thread: QThread | None = None
+_backend = None  # BackendProcess when the assistant runs in a child process
 
 
 # ============ Public API ============
 
-def launch_gui(x: int = -1, y: int = -1, size: int = 320) -> None:
-    """Launch the GUI window in-process."""
-    global _gui_widget
+def launch_gui(x: int = -1, y: int = -1, size: int = 320, backend_process: bool = False) -> None:
+    """
+    Launch the GUI window. With backend_process the assistant runs in a
+    child process (gui/backend_process.py) instead of a QThread here.
+    """
+    global _gui_widget, _backend
     
     app = QApplication.instance()
     if app is None:
@@ -33,6 +42,11 @@ def launch_gui(x: int = -1, y: int = -1, size: int = 320) -> None:
 
     _gui_widget = VoiceWidget(size=size)
     
+    if backend_process:
+        from gui.backend_process import BackendProcess
+        _backend = BackendProcess(on_event=_on_backend_event)
+        _backend.start()
+    
     # Position: center-bottom if not specified
     screen = app.primaryScreen().availableGeometry()
     if x < 0 or y < 0:
@@ -45,29 +59,56 @@ def launch_gui(x: int = -1, y: int = -1, size: int = 320) -> None:
     sys.exit(app.exec())
 
 
+def post_state(**fields) -> None:
+    """Send state to the GUI from any thread (see gui/state_bus.py)."""
+    if _gui_widget is not None:
+        _gui_widget.bus.post(**fields)
+
+
 def set_idle() -> None:
     """Set GUI to idle state."""
-    if _gui_widget is not None:
-        _gui_widget.set_mode("IDLE")
+    post_state(mode="IDLE")
 
 
 def set_listening() -> None:
     """Set GUI to listening state."""
-    if _gui_widget is not None:
-        _gui_widget.set_mode("LISTENING")
+    post_state(mode="LISTENING", partial="")
 
 
 def set_speaking() -> None:
     """Set GUI to speaking state."""
-    if _gui_widget is not None:
-        _gui_widget.set_mode("SPEAKING")
+    post_state(mode="SPEAKING")
+
+
+def show_partial(text: str) -> None:
+    """Show the transcript so far while the user is speaking."""
+    post_state(partial=text)
+
+
+def show_timings(timings: dict) -> None:
+    """Stage durations of the last turn, in ms (shown as the widget tooltip)."""
+    post_state(timings=timings)
+
+
+def _on_backend_event(kind: str, payload: dict) -> None:
+    """Events from the backend process (reader thread)."""
+    if kind == "state":
+        post_state(**payload)
+    elif kind == "stopped":
+        post_state(listening=False)
+    elif kind == "ready":
+        print("[GUI] Backend ready", flush=True)
 
 
 def shutdown_gui() -> None:
     """Shutdown GUI cleanly."""
-    global _listener_worker, _listener_thread, _gui_widget
+    global _listener_worker, _listener_thread, _gui_widget, _backend
     
     try:
+        if _backend is not None:
+            backend, _backend = _backend, None
+            backend.shutdown()
+        
         if _listener_worker is not None:
             _listener_worker.stop()
         
@@ -104,57 +145,7 @@ class ListenerWorker(QObject):
         print("[WORKER] Started", flush=True)
         
         try:
-            while self._is_running:
-                try:
-                    if not self._is_running:
-                        break
-                    
-                    # LISTEN
-                    print("[WORKER] Calling listen()...", flush=True)
-                    query = assistant.listen()
-                    
-                    if not self._is_running:
-                        break
-                    
-                    if not query:
-                        print("[WORKER] No query, continuing...", flush=True)
-                        continue
-                    
-                    print(f"[WORKER] Got query: {query}", flush=True)
-                    
-                    # Check exit commands
-                    if query.lower().strip() in ["exit", "bye", "goodbye"]:
-                        print("[WORKER] Exit command detected", flush=True)
-                        try:
-                            assistant.speak("Good bye, sir")
-                        except Exception as e:
-                            print(f"[WORKER] Error in goodbye: {e}", flush=True)
-                        break
-                    
-                    # PROCESS
-                    print("[WORKER] Processing query...", flush=True)
-                    try:
-                        answer = assistant.process_query(query)
-                        print(f"[WORKER] Got answer: {answer[:50]}...", flush=True)
-                    except Exception as e:
-                        print(f"[WORKER] Process error: {e}", flush=True)
-                        answer = "Sorry, I couldn't process that."
-                    
-                    # SPEAK
-                    if self._is_running:
-                        print("[WORKER] Calling speak()...", flush=True)
-                        try:
-                            assistant.speak(answer)
-                            print("[WORKER] Speak done, waiting 1.5s before next listen...", flush=True)
-                            time.sleep(1.5)
-                        except Exception as e:
-                            print(f"[WORKER] Speak error: {e}", flush=True)
-                
-                except Exception as e:
-                    print(f"[WORKER] Loop error: {e}", flush=True)
-                    if self._is_running:
-                        time.sleep(0.5)
-        
+            assistant.conversation_loop(lambda: self._is_running)
         finally:
             self._is_running = False
             print("[WORKER] Finished", flush=True)
@@ -168,6 +159,13 @@ class ListenerWorker(QObject):
 
 # ============ GUI Animation State ============
 
+def _polygon_array(poly: QPolygonF) -> np.ndarray:
+    """(n, 2) float64 view onto a QPolygonF's points, written in place."""
+    ptr = poly.data()
+    ptr.setsize(len(poly) * 2 * 8)
+    return np.frombuffer(ptr, dtype=np.float64).reshape(-1, 2)
+
+
 @dataclass
 class GuiState:
     mode: str = "IDLE"  # IDLE | LISTENING | SPEAKING
@@ -175,6 +173,73 @@ class GuiState:
     last_time: float = 0.0
 
 
+# ============ Frame Scheduling ============
+
+# Frames per second by mode; IDLE draws a still line, so it only repaints on change
+FRAME_RATES = {"IDLE": 0, "LISTENING": 24, "SPEAKING": 60}
+
+
+class FrameScheduler(QObject):
+    """
+    Runs the animation timer only while the picture can change: stopped in
+    IDLE, a reduced rate while listening, the full rate while speaking.
+    max_fps caps every mode; when painting takes longer than budget_ms per
+    frame, the rate is lowered in proportion.
+    """
+    
+    def __init__(self, widget: "VoiceWidget", rates: dict | None = None,
+                 max_fps: float | None = None, budget_ms: float | None = None):
+        super().__init__(widget)
+        self.widget = widget
+        self.rates = dict(rates or FRAME_RATES)
+        self.max_fps = max_fps if max_fps is not None else float(os.getenv("REX_GUI_MAX_FPS", "60"))
+        self.budget_ms = budget_ms if budget_ms is not None else float(os.getenv("REX_GUI_FRAME_BUDGET_MS", "8"))
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(widget._tick)
+        self.mode = "IDLE"
+        self.paint_ms = 0.0  # smoothed paint time
+        self.frames = 0
+    
+    def fps(self, mode: str) -> float:
+        rate = min(self.rates.get(mode, 0), self.max_fps)
+        if rate > 0 and self.budget_ms > 0 and self.paint_ms > self.budget_ms:
+            rate = min(rate, max(10.0, rate * self.budget_ms / self.paint_ms))
+        return rate
+    
+    def set_mode(self, mode: str):
+        self.mode = mode
+        rate = self.fps(mode)
+        if rate <= 0:
+            self.timer.stop()
+            self.widget.update()  # one repaint for the new still frame
+            return
+        if not self.timer.isActive():
+            self.widget.state.last_time = 0  # no phase jump after a pause
+        self._set_interval(rate)
+    
+    def painted(self, ms: float):
+        """Called after every paint with its duration."""
+        self.frames += 1
+        self.paint_ms = ms if self.frames == 1 else 0.9 * self.paint_ms + 0.1 * ms
+        if self.timer.isActive() and self.budget_ms > 0:
+            self._set_interval(self.fps(self.mode))
+    
+    def _set_interval(self, rate: float):
+        interval = max(1, int(round(1000 / rate)))
+        if not self.timer.isActive():
+            self.timer.start(interval)
+        elif abs(self.timer.interval() - interval) > 1:
+            self.timer.setInterval(interval)
+
+
+# ============ Audio Levels ============
+
+# Which level ring drives the wave in each mode, and the RMS drawn at full height
+LEVEL_SOURCES = {"SPEAKING": ("playback", 8000.0), "LISTENING": ("capture", 3000.0)}
+LEVEL_BLOCKS = 48      # newest blocks spread across the wave (~1-2 s)
+LEVEL_STALE_S = 0.3    # fall back to the synthetic wave when nothing newer arrived
+
+
 # ============ Main GUI Widget ============
 
 class VoiceWidget(QWidget):
@@ -218,10 +283,17 @@ class VoiceWidget(QWidget):
         self.button_x = 10
         self.button_y = (self.bar_h - self.button_size) // 2
         
-        # Animation timer
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self._tick)
-        self.timer.start(int(1000 / 60))
+        # Cached wave geometry, pens and gradients
+        self._layout_wave()
+        
+        # Animation timer, started and stopped by mode
+        self.frames = FrameScheduler(self)
+        self.timer = self.frames.timer
+        
+        # State from the assistant threads arrives here, coalesced, on the GUI thread
+        self.partial_text = ""
+        self.bus = StateBus(parent=self)
+        self.bus.changed.connect(self._on_state)
         
         # Drag support
         self._drag_pos = None
@@ -234,9 +306,25 @@ class VoiceWidget(QWidget):
         _listener_worker.finished.connect(_listener_thread.quit)
     
     def set_mode(self, mode: str):
-        """Update animation mode (IDLE, LISTENING, SPEAKING)."""
+        """Update animation mode (IDLE, LISTENING, SPEAKING). GUI thread only; use post_state elsewhere."""
+        if mode == self.state.mode and (mode == "IDLE" or self.timer.isActive()):
+            return
         self.state.mode = mode
-        self.update()
+        self.frames.set_mode(mode)
+    
+    def _on_state(self, changes: dict):
+        """Apply a coalesced batch from the state bus."""
+        if "mode" in changes:
+            self.set_mode(changes["mode"])
+        if "partial" in changes and changes["partial"] != self.partial_text:
+            self.partial_text = changes["partial"]
+            self.update()
+        if changes.get("listening") is False and self.is_listening:
+            # The backend's loop ended by itself (e.g. "goodbye")
+            self.is_listening = False
+            self.update()
+        if "timings" in changes:
+            self.setToolTip("\n".join(f"{k}: {v:.0f} ms" for k, v in changes["timings"].items()))
     
     def _on_button_click(self):
         """Handle button click: start or stop listening."""
@@ -246,7 +334,9 @@ class VoiceWidget(QWidget):
             # STOP
             print("[GUI] Stop button clicked", flush=True)
             self.is_listening = False
-            if _listener_worker is not None:
+            if _backend is not None:
+                _backend.set_listening(False)
+            elif _listener_worker is not None:
                 _listener_worker.stop()
             if _listener_thread is not None and _listener_thread.isRunning():
                 _listener_thread.quit()
@@ -256,7 +346,9 @@ class VoiceWidget(QWidget):
             # START
             print("[GUI] Start button clicked", flush=True)
             self.is_listening = True
-            if _listener_thread is not None and not _listener_thread.isRunning():
+            if _backend is not None:
+                _backend.set_listening(True)
+            elif _listener_thread is not None and not _listener_thread.isRunning():
                 _listener_thread.start()
             print("[GUI] Listening started", flush=True)
         
@@ -333,31 +425,65 @@ class VoiceWidget(QWidget):
         
         self.update()
     
-    def paintEvent(self, event):
-        """Draw the widget: pill + wave + button."""
-        w, h = self.width(), self.height()
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
-        
-        # ============ Draw Wave Pill ============
+    # ============ Wave Geometry ============
+    
+    def _layout_wave(self):
+        """Precompute the wave's x grid and envelope; only changes with the widget size."""
         pill_x = 90
-        pill_w = self.bar_w
-        pill_h = self.bar_h
-        
-        # Pill background
-        rect = QRectF(pill_x + 2, 2, pill_w - 4, pill_h - 4)
-        painter.setPen(QPen(self.glass_stroke, 1.5))
-        painter.setBrush(QColor(self.bg_color))
-        path = QPainterPath()
-        path.addRoundedRect(rect, self.border_radius, self.border_radius)
-        painter.drawPath(path)
+        self._pill_path = QPainterPath()
+        self._pill_path.addRoundedRect(
+            QRectF(pill_x + 2, 2, self.bar_w - 4, self.bar_h - 4), self.border_radius, self.border_radius
+        )
+        self._wave_left = pill_x + 20
+        self._wave_right = pill_x + self.bar_w - 20
+        width = self._wave_right - self._wave_left
+        steps = max(200, int(width))
+        t = np.linspace(0.0, 1.0, steps + 1)
+        self._wave_t = t
+        self._wave_angle = t * (2 * np.pi)
+        self._wave_env = np.sin(np.pi * t)
+        self._wave_poly = QPolygonF()
+        self._wave_poly.resize(steps + 1)
+        self._wave_xy = _polygon_array(self._wave_poly)
+        self._wave_xy[:, 0] = self._wave_left + t * width
+        self._wave_y = np.empty(steps + 1)
+        self._wave_key = None
+        self._level_buf = np.zeros((LEVEL_BLOCKS, 3))
+        self._level_count = 0
+        self._build_styles()
+    
+    def _build_styles(self):
+        """Pens/brushes per mode, built once instead of on every paint."""
+        left, right = self._wave_left, self._wave_right
+        mid_y = self.bar_h / 2
+        stops = [0.0, 0.33, 0.66, 1.0]
         
-        # Wave animation
-        mid_y = h / 2
-        left = pill_x + 20
-        right = pill_x + pill_w - 20
-        width = right - left
+        grad = QLinearGradient(left, 0, right, 0)
+        for s, c in zip(stops, self.wave_colors):
+            grad.setColorAt(s, c)
         
+        self._styles = {}
+        for mode in ("IDLE", "LISTENING", "SPEAKING"):
+            glow = QLinearGradient(left, mid_y, right, mid_y)
+            for s, c in zip(stops, self.wave_colors):
+                cc = QColor(c)
+                cc.setAlpha(80 if mode != "IDLE" else 40)
+                glow.setColorAt(s, cc)
+            self._styles[mode] = (QPen(QBrush(grad), 3.0 if mode != "IDLE" else 2.0), QBrush(glow))
+        
+        self._pill_pen = QPen(self.glass_stroke, 1.5)
+        self._button_pen = QPen(QColor(255, 255, 255, 70), 2)
+        self._button_font = QFont()
+        self._button_font.setBold(True)
+        self._button_font.setPointSize(11)
+        self._partial_font = QFont()
+        self._partial_font.setPointSize(8)
+        self._partial_metrics = QFontMetrics(self._partial_font)
+        self._partial_pen = QPen(QColor(255, 255, 255, 170))
+    
+    def _wave_points(self) -> QPolygonF:
+        """Fill the cached polygon's y column with one vectorised expression."""
+        pill_h = self.bar_h
         if self.state.mode == "SPEAKING":
             amp = max(10, int(pill_h * 0.26))
             freq = 3.0
@@ -371,41 +497,80 @@ class VoiceWidget(QWidget):
             freq = 1.0
             speed = 0.0
         
-        # Gradient
-        grad = QLinearGradient(left, 0, right, 0)
-        stops = [0.0, 0.33, 0.66, 1.0]
-        for s, c in zip(stops, self.wave_colors):
-            grad.setColorAt(s, c)
+        # Real audio levels, when the matching stream is live, set the amplitude along the wave
+        envelope = self._level_envelope(max(10, int(pill_h * 0.26)))
+        key = (amp, freq, speed, None if envelope is None else self._level_count)
+        if key != self._wave_key:
+            y = self._wave_y
+            np.multiply(self._wave_angle, freq, out=y)
+            y += speed
+            np.sin(y, out=y)
+            y *= self._wave_env
+            y *= amp if envelope is None else envelope
+            y += pill_h / 2
+            self._wave_xy[:, 1] = y
+            self._wave_key = key
+        return self._wave_poly
+    
+    def _level_envelope(self, full_amp: float) -> np.ndarray | None:
+        """
+        Pixel amplitude per wave point from the newest levels (oldest at the
+        left), or None when the mode has no live stream. Copies a few dozen
+        floats out of the ring; the audio thread is never blocked.
+        """
+        source = LEVEL_SOURCES.get(self.state.mode)
+        if source is None:
+            return None
+        name, full_scale = source
+        ring = levels.ring(name)
+        n = ring.recent(self._level_buf)
+        if n < 2:
+            return None
+        rows = self._level_buf[-n:]
+        if time.monotonic() - rows[-1, 0] > LEVEL_STALE_S:
+            return None
+        self._level_count = ring.count
+        loud = np.sqrt(np.clip(rows[:, 1] / full_scale, 0.0, 1.0))
+        env = np.interp(self._wave_t, np.linspace(0.0, 1.0, n), loud)
+        return 2.0 + (full_amp - 2.0) * env
+    
+    def paintEvent(self, event):
+        """Draw the widget: pill + wave + button."""
+        start = time.perf_counter()
+        h = self.height()
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        
+        # ============ Draw Wave Pill ============
+        painter.setPen(self._pill_pen)
+        painter.setBrush(self.bg_color)
+        painter.drawPath(self._pill_path)
+        
+        # Wave animation
+        mid_y = h / 2
+        left = self._wave_left
+        width = self._wave_right - left
+        pen, glow = self._styles.get(self.state.mode, self._styles["IDLE"])
         
-        pen = QPen(QBrush(grad), 3.0 if self.state.mode != "IDLE" else 2.0)
         painter.setPen(pen)
         painter.setBrush(Qt.BrushStyle.NoBrush)
-        
-        # Draw wave
-        path = QPainterPath()
-        steps = max(200, int(width))
-        for i in range(steps + 1):
-            t = i / steps
-            x = left + t * width
-            envelope = math.sin(math.pi * t)
-            y = mid_y + math.sin(t * math.pi * 2 * freq + speed) * (amp * envelope)
-            if i == 0:
-                path.moveTo(x, y)
-            else:
-                path.lineTo(x, y)
-        
-        painter.drawPath(path)
+        painter.drawPolyline(self._wave_points())
         
         # Glow below wave
-        glow = QLinearGradient(left, mid_y, right, mid_y)
-        for s, c in zip(stops, self.wave_colors):
-            cc = QColor(c)
-            cc.setAlpha(80 if self.state.mode != "IDLE" else 40)
-            glow.setColorAt(s, cc)
         painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(QBrush(glow))
+        painter.setBrush(glow)
         painter.drawRoundedRect(QRectF(left, mid_y + 4, width, 8), 4, 4)
         
+        # Transcript so far, above the wave
+        if self.partial_text and self.state.mode == "LISTENING":
+            painter.setPen(self._partial_pen)
+            painter.setFont(self._partial_font)
+            text_rect = QRectF(left, 3, width, mid_y - 8)
+            text = self._partial_metrics.elidedText(
+                self.partial_text, Qt.TextElideMode.ElideLeft, int(width)
+            )
+            painter.drawText(text_rect, Qt.AlignmentFlag.AlignCenter, text)
+        
         # ============ Draw Circular Button ============
         button_center_x = self.button_x + self.button_size / 2
         button_center_y = self.button_y + self.button_size / 2
@@ -424,18 +589,17 @@ class VoiceWidget(QWidget):
         painter.drawEllipse(QPointF(button_center_x, button_center_y), self.button_size / 2, self.button_size / 2)
         
         # Button border
-        painter.setPen(QPen(QColor(255, 255, 255, 70), 2))
+        painter.setPen(self._button_pen)
         painter.setBrush(Qt.BrushStyle.NoBrush)
         painter.drawEllipse(QPointF(button_center_x, button_center_y), self.button_size / 2, self.button_size / 2)
         
         # Button text
         painter.setPen(QColor(255, 255, 255))
-        font = QFont()
-        font.setBold(True)
-        font.setPointSize(11)
-        painter.setFont(font)
+        painter.setFont(self._button_font)
         painter.drawText(
             QRectF(self.button_x, self.button_y, self.button_size, self.button_size),
             Qt.AlignmentFlag.AlignCenter,
             button_text,
         )
+        painter.end()
+        self.frames.painted((time.perf_counter() - start) * 1000.0)
@@ -0,0 +1,121 @@
+"""
+Headless entry points: a text REPL and a voice daemon without the GUI.
+
+    python main.py --text      # type a question, the answer streams back
+    python main.py --daemon    # voice loop with no window; Ctrl+C / SIGTERM stops it
+
+Each mode imports only what it needs. Text mode never loads Qt or the audio
+stack, and the brain (Groq, realtime sources) is imported on a background
+thread while the first prompt is already on screen.
+"""
+
+import contextlib
+import importlib
+import signal
+import sys
+import threading
+import time
+
+PROMPT = "You: "
+EXIT_WORDS = {"exit", "bye", "goodbye", "quit"}
+
+
+class _Preload:
+    """Import a module on a background thread; get() waits for it."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.module = None
+        self.error = None
+        self.seconds = 0.0
+        self._thread = threading.Thread(target=self._load, name=f"preload-{name}", daemon=True)
+        self._thread.start()
+
+    def _load(self):
+        start = time.perf_counter()
+        try:
+            self.module = importlib.import_module(self.name)
+        except BaseException as e:  # general_q exits without an API key
+            self.error = e
+        self.seconds = time.perf_counter() - start
+
+    def get(self):
+        self._thread.join()
+        if self.error is not None:
+            raise RuntimeError(f"{self.name} failed to load: {self.error!r}")
+        return self.module
+
+
+def run_text(stdin=None, stdout=None) -> int:
+    """Text conversation over stdin/stdout. Backend logs go to stderr."""
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    brain = _Preload("Backend.brain")
+
+    from Backend.system.jobs import scheduler
+
+    def announce(job):   # a background job finished while the prompt is up
+        stdout.write(f"\nRex: {job.announcement()}\n{PROMPT}")
+        stdout.flush()
+
+    scheduler.on_finish(announce)
+
+    while True:
+        stdout.write(PROMPT)
+        stdout.flush()
+        line = stdin.readline()
+        if not line:
+            stdout.write("\n")
+            return 0
+        query = line.strip()
+        if not query:
+            continue
+        if query.lower() in EXIT_WORDS:
+            stdout.write("Rex: Good bye, sir\n")
+            return 0
+
+        try:
+            module = brain.get()
+        except RuntimeError as e:
+            print(f"[TEXT] {e}", file=sys.stderr, flush=True)
+            return 1
+
+        stdout.write("Rex: ")
+        with contextlib.redirect_stdout(sys.stderr):
+            try:
+                for piece in module.brainQ_stream(query):
+                    stdout.write(piece)
+                    stdout.flush()
+            except Exception as e:   # e.g. a system skill whose Windows-only deps are missing
+                print(f"[TEXT] Error in brain processing: {e!r}", file=sys.stderr, flush=True)
+                stdout.write("Sorry, I couldn't process that.")
+        stdout.write("\n")
+
+
+def run_daemon() -> int:
+    """Voice assistant with no GUI, until SIGINT/SIGTERM."""
+    stop = threading.Event()
+
+    def on_signal(signum, frame):
+        print(f"[DAEMON] Signal {signum}, finishing the current turn...", flush=True)
+        stop.set()
+
+    signal.signal(signal.SIGINT, on_signal)
+    signal.signal(signal.SIGTERM, on_signal)
+
+    import assistant
+    assistant.register_gui_callbacks(
+        timings_cb=lambda t: print("[DAEMON] " + ", ".join(f"{k} {v:.0f} ms" for k, v in t.items()), flush=True),
+    )
+    assistant.start_warmup()
+    print("[DAEMON] Running", flush=True)
+
+    while not stop.is_set():
+        # Returns on "goodbye"; a daemon keeps serving (with REX_WAKE it waits for the wake word again)
+        try:
+            assistant.conversation_loop(lambda: not stop.is_set())
+        except Exception as e:
+            print(f"[DAEMON] Loop error: {e!r}", flush=True)
+        stop.wait(0.5)
+    print("[DAEMON] Stopped", flush=True)
+    return 0
@@ -1,14 +1,47 @@
-﻿from gui.voice_gui import launch_gui, set_idle, set_listening, set_speaking
-import assistant
+﻿import os
+import sys
 
-print('Starting voice assistant...', flush=True)
 
-# Register GUI callbacks
-assistant.register_gui_callbacks(
-    idle_cb=set_idle,
-    listening_cb=set_listening,
-    speaking_cb=set_speaking
-)
+def main():
+    if "--text" in sys.argv or "--daemon" in sys.argv:
+        # Headless: no Qt, and text mode doesn't load the audio stack either
+        import headless
+        sys.exit(headless.run_text() if "--text" in sys.argv else headless.run_daemon())
 
-print('Launching GUI...', flush=True)
-launch_gui()
+    if "--enroll-wake" in sys.argv:
+        # Record a few samples of "Rex" for the wake-word detector, then exit
+        import assistant
+        sys.exit(0 if assistant.enroll_wake_word() else 1)
+
+    print('Starting voice assistant...', flush=True)
+
+    if "--process" in sys.argv or os.getenv("REX_BACKEND_PROCESS", "0") == "1":
+        # Assistant in a child process: the GUI process never imports it
+        from gui.voice_gui import launch_gui
+        print('Launching GUI (backend in a separate process)...', flush=True)
+        launch_gui(backend_process=True)
+        return
+
+    from gui.voice_gui import launch_gui, set_idle, set_listening, set_speaking, show_partial, show_timings
+    import assistant
+
+    # Register GUI callbacks
+    assistant.register_gui_callbacks(
+        idle_cb=set_idle,
+        listening_cb=set_listening,
+        speaking_cb=set_speaking,
+        partial_cb=show_partial,
+        timings_cb=show_timings,
+    )
+
+    # Mic, STT, LLM/TTS connections, voices and history warm up in the
+    # background while the window comes up (includes TTS pre-synthesis)
+    assistant.start_warmup()
+
+    print('Launching GUI...', flush=True)
+    launch_gui()
+
+
+# Guarded so the backend child process (multiprocessing "spawn") can import this module safely
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Startup warm-up: run the slow one-time initializations (microphone, STT
+model, LLM and TTS connections, local voice, chat history) concurrently in
+the background while the GUI comes up, and track readiness per subsystem.
+
+A turn calls wait() for just the subsystems it is about to use, so the
+first one never waits for, say, the ElevenLabs handshake while it is still
+listening. Tasks that fail are marked done with the error; the caller's own
+lazy initializer then retries and reports the problem as before.
+"""
+
+import threading
+import time
+from typing import Callable, Dict, Iterable, Optional
+
+
+class _Task:
+    def __init__(self, name: str, fn: Callable[[], object], after: Iterable[str]):
+        self.name = name
+        self.fn = fn
+        self.after = tuple(after)
+        self.done = threading.Event()
+        self.started = None
+        self.finished = None
+        self.error = None
+
+    @property
+    def seconds(self) -> Optional[float]:
+        if self.started is None or self.finished is None:
+            return None
+        return self.finished - self.started
+
+
+class WarmUp:
+    def __init__(self):
+        self._tasks: Dict[str, _Task] = {}
+        self._t0 = None
+        self.waited = {}   # subsystem -> seconds turns spent waiting for it
+
+    def add(self, name: str, fn: Callable[[], object], after: Iterable[str] = ()):
+        """Register a task; `after` names tasks it must wait for (e.g. the mic before the wake word)."""
+        self._tasks[name] = _Task(name, fn, after)
+        return self
+
+    def start(self):
+        self._t0 = time.perf_counter()
+        for task in self._tasks.values():
+            threading.Thread(target=self._run, args=(task,), name=f"warmup-{task.name}", daemon=True).start()
+        return self
+
+    def _run(self, task: _Task):
+        for dep in task.after:
+            if dep in self._tasks:
+                self._tasks[dep].done.wait()
+        task.started = time.perf_counter()
+        try:
+            task.fn()
+        except Exception as e:
+            task.error = e
+        task.finished = time.perf_counter()
+        task.done.set()
+        if task.error is not None:
+            print(f"[WARMUP] {task.name} failed after {task.seconds * 1000:.0f} ms: {task.error}", flush=True)
+        else:
+            print(
+                f"[WARMUP] {task.name} ready in {task.seconds * 1000:.0f} ms "
+                f"(+{(task.finished - self._t0) * 1000:.0f} ms since start)",
+                flush=True,
+            )
+
+    def ready(self, name: str) -> bool:
+        task = self._tasks.get(name)
+        return task is None or task.done.is_set()
+
+    def wait(self, *names: str, timeout: Optional[float] = None) -> bool:
+        """Block until the named subsystems are warm (unknown names count as ready)."""
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        ok = True
+        for name in names:
+            task = self._tasks.get(name)
+            if task is None or task.done.is_set():
+                continue
+            start = time.perf_counter()
+            remaining = None if deadline is None else max(0.0, deadline - start)
+            ok = task.done.wait(remaining) and ok
+            self.waited[name] = self.waited.get(name, 0.0) + time.perf_counter() - start
+            print(f"[WARMUP] Waited {(time.perf_counter() - start) * 1000:.0f} ms for {name}", flush=True)
+        return ok
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        return self.wait(*self._tasks, timeout=timeout)
+
+    def report(self) -> dict:
+        """name -> {"ms": duration, "ready_at_ms": since start(), "error": str or None}."""
+        out = {}
+        for name, task in self._tasks.items():
+            out[name] = {
+                "ms": None if task.seconds is None else task.seconds * 1000,
+                "ready_at_ms": None if task.finished is None or self._t0 is None
+                else (task.finished - self._t0) * 1000,
+                "error": None if task.error is None else str(task.error),
+            }
+        return out